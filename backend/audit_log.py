@@ -0,0 +1,208 @@
+"""
+==============================================================================
+Audit Log Writer Module (audit_log.py)
+==============================================================================
+Description: Buffered, asynchronous writer for structured audit events
+
+Main Features:
+    - start: Create the queue and spawn the background flush task (app startup)
+    - stop: Stop the flush task and write any remaining entries (app shutdown)
+    - enqueue: Queue an audit entry without blocking the request
+
+Batching Strategy:
+    - Entries are serialized on enqueue and written by a single background task
+    - A batch is flushed once AUDIT_LOG_BUFFER_SIZE entries are collected or
+      AUDIT_LOG_BUFFER_TIME seconds have passed since its first entry
+    - Each entry is its own log record (one JSON object per record), or, when
+      AUDIT_LOG_FILE is set, a batch is one writev() on an O_APPEND descriptor
+    - Batches are written from a worker thread, never the event loop thread
+    - If the writer is not running, the queue is full or a batch write fails,
+      entries are logged synchronously so no event is dropped
+
+Dependencies:
+    - orjson: Fast JSON serialization of entries
+
+Environment Variables:
+    - AUDIT_LOG_BUFFER_SIZE: Maximum entries per batch (default: 64)
+    - AUDIT_LOG_BUFFER_TIME: Maximum seconds an entry waits in a batch (default: 1.0)
+    - AUDIT_LOG_FILE: Append audit entries to this file instead of the logger (default: unset)
+
+Logging:
+    Entries (and writer messages) go to the "main" logger, as they did when
+    the endpoint logged them itself
+==============================================================================
+"""
+
+import os
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+# Audit records have always been emitted by the "main" logger; keep that
+# name so existing log routing and filters still receive them
+logger = logging.getLogger("main")
+
+AUDIT_LOG_BUFFER_SIZE = int(os.getenv("AUDIT_LOG_BUFFER_SIZE", "64"))
+AUDIT_LOG_BUFFER_TIME = float(os.getenv("AUDIT_LOG_BUFFER_TIME", "1.0"))
+AUDIT_QUEUE_MAXSIZE = 10000
+AUDIT_LOG_FILE = os.getenv("AUDIT_LOG_FILE", "")
+
+# Global queue and flush task
+_queue: Optional[asyncio.Queue] = None
+_flusher: Optional[asyncio.Task] = None
+_fd: Optional[int] = None
+
+# Queued by stop() so the flusher drains everything before it exits
+# (a sentinel instead of task.cancel(), which asyncio.wait_for can swallow)
+_STOP = object()
+
+
+def _write_fd(fd: int, batch: List[str]) -> None:
+    """
+    Append a batch to the audit file with a single writev() syscall.
+
+    If a write fails part-way, only the entries not yet written in full
+    are logged through the logger, so none is lost or duplicated.
+    """
+    buffers = [f"{line}\n".encode() for line in batch]
+    written = 0
+    try:
+        written = os.writev(fd, buffers)
+        if written < sum(len(b) for b in buffers):
+            # Short write (rare for regular files): finish the remainder
+            rest = b"".join(buffers)[written:]
+            while rest:
+                count = os.write(fd, rest)
+                written += count
+                rest = rest[count:]
+        return
+    except OSError as e:
+        logger.error(f"Audit file write failed after {written} bytes: {e}")
+
+    # Skip the entries that reached the file in full
+    done = 0
+    for buffer in buffers:
+        if written < len(buffer):
+            break
+        written -= len(buffer)
+        done += 1
+    for line in batch[done:]:
+        logger.info(line)
+
+
+def _write(batch: List[str]) -> None:
+    """Write a batch of serialized entries (one syscall, or one record per entry)"""
+    if _fd is not None:
+        _write_fd(_fd, batch)
+    else:
+        for line in batch:
+            logger.info(line)
+
+
+async def _flush(batch: List[str]) -> None:
+    """Write a batch off the event loop; on failure log its entries directly"""
+    try:
+        await asyncio.to_thread(_write, batch)
+    except Exception as e:
+        # Keep the flusher alive: a dead flusher would strand the whole queue
+        logger.exception(f"Audit batch write failed, logging {len(batch)} entries directly: {e}")
+        for line in batch:
+            logger.info(line)
+
+
+async def _flush_loop() -> None:
+    """Collect queued entries into batches and write them until the stop sentinel"""
+    loop = asyncio.get_running_loop()
+    while True:
+        line = await _queue.get()
+        if line is _STOP:
+            return
+        batch = [line]
+        deadline = loop.time() + AUDIT_LOG_BUFFER_TIME
+
+        while len(batch) < AUDIT_LOG_BUFFER_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                line = await asyncio.wait_for(_queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if line is _STOP:
+                await _flush(batch)
+                return
+            batch.append(line)
+
+        await _flush(batch)
+
+
+def start() -> None:
+    """
+    Start the background audit writer.
+
+    Must be called from a running event loop (app startup).
+    """
+    global _queue, _flusher, _fd
+
+    if _flusher is not None:
+        logger.warning("Audit writer already started")
+        return
+
+    if AUDIT_LOG_FILE and hasattr(os, "writev"):
+        _fd = os.open(AUDIT_LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o640)
+    _queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+    _flusher = asyncio.create_task(_flush_loop())
+    logger.info("Audit writer started")
+
+
+async def stop() -> None:
+    """
+    Stop the background audit writer after flushing queued entries.
+    """
+    global _queue, _flusher, _fd
+
+    if _flusher is None:
+        return
+
+    if not _flusher.done():
+        await _queue.put(_STOP)
+    try:
+        await _flusher
+    except Exception as e:
+        logger.exception(f"Audit writer failed: {e}")
+
+    # Anything a failed flusher left behind is logged synchronously
+    while not _queue.empty():
+        line = _queue.get_nowait()
+        if line is not _STOP:
+            logger.info(line)
+
+    if _fd is not None:
+        os.close(_fd)
+    _queue = None
+    _flusher = None
+    _fd = None
+    logger.info("Audit writer stopped")
+
+
+def enqueue(entry: Dict[str, Any]) -> None:
+    """
+    Queue a structured audit entry for writing.
+
+    Args:
+        entry: Trusted audit log entry (JSON-serializable)
+    """
+    # Outputting pure JSON allows external log aggregators (ELK, Stackdriver, etc.)
+    # to automatically parse the fields without complex regex or pattern matching.
+    line = orjson.dumps({"audit_log": True, "data": entry}).decode()
+
+    if _queue is None:
+        logger.info(line)
+        return
+    try:
+        _queue.put_nowait(line)
+    except asyncio.QueueFull:
+        logger.warning("Audit queue full, writing entry synchronously")
+        logger.info(line)
@@ -8,7 +8,9 @@ Main Features:
     - init_pool: Initialize connection pool on app startup
     - close_pool: Close connection pool on app shutdown
     - get_connection: Context manager for acquiring connections
+    - transaction: Context manager for a cursor whose statements commit together
     - execute: Helper for executing queries
+    - execute_rowcount: Helper for writes that need the affected row count
     - fetchone/fetchall: Helpers for fetching results
 
 Environment Variables:
@@ -17,6 +19,8 @@ Environment Variables:
     - MYSQL_USER: Database user (default: pista)
     - MYSQL_PASSWORD: Database password
     - MYSQL_DATABASE: Database name (default: gition)
+    - DB_POOL_MIN: Connections opened at startup (default: 2)
+    - DB_POOL_MAX: Maximum pooled connections, i.e. concurrent queries (default: 25)
 ==============================================================================
 """
 
@@ -41,11 +45,19 @@ DB_CONFIG = {
     "autocommit": True,
 }
 
+# Pool sizing: every query holds a connection only while it runs, so
+# DB_POOL_MAX bounds concurrent in-flight queries (keep MySQL's
+# max_connections above DB_POOL_MAX x backend processes)
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "2"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "25"))
+# Recycle idle connections before MySQL's wait_timeout drops them
+DB_POOL_RECYCLE = 3600
+
 # Global connection pool
 _pool: Optional[aiomysql.Pool] = None
 
 
-async def init_pool(min_size: int = 1, max_size: int = 10) -> aiomysql.Pool:
+async def init_pool(min_size: int = DB_POOL_MIN, max_size: int = DB_POOL_MAX) -> aiomysql.Pool:
     """
     Initialize the database connection pool.
     
@@ -66,6 +78,7 @@ async def init_pool(min_size: int = 1, max_size: int = 10) -> aiomysql.Pool:
         _pool = await aiomysql.create_pool(
             minsize=min_size,
             maxsize=max_size,
+            pool_recycle=DB_POOL_RECYCLE,
             **DB_CONFIG
         )
         logger.info(f"Database pool initialized: {DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['db']}")
@@ -147,6 +160,33 @@ async def get_cursor(dict_cursor: bool = True):
             yield cur
 
 
+@asynccontextmanager
+async def transaction(dict_cursor: bool = True):
+    """
+    Context manager for a cursor whose statements commit as one transaction.
+    
+    Commits when the block exits normally, rolls back if it raises.
+    
+    Usage:
+        async with transaction() as cur:
+            await cur.execute("INSERT ...", (...))
+            await cur.execute("UPDATE ...", (...))
+    
+    Yields:
+        aiomysql.Cursor: Database cursor
+    """
+    cursor_class = aiomysql.DictCursor if dict_cursor else aiomysql.Cursor
+    async with get_connection() as conn:
+        await conn.begin()
+        try:
+            async with conn.cursor(cursor_class) as cur:
+                yield cur
+            await conn.commit()
+        except BaseException:
+            await conn.rollback()
+            raise
+
+
 async def execute(
     query: str, 
     args: Optional[Tuple] = None,
@@ -174,6 +214,24 @@ async def execute(
             return cur.lastrowid
 
 
+async def execute_rowcount(query: str, args: Optional[Tuple] = None) -> int:
+    """
+    Execute a write and return the number of affected rows.
+    
+    Note: MySQL counts only rows whose values actually changed, so an UPDATE
+    that matches a row but sets identical values returns 0.
+    
+    Args:
+        query: SQL query string
+        args: Query parameters
+        
+    Returns:
+        Affected row count
+    """
+    async with get_cursor() as cur:
+        return await cur.execute(query, args or ())
+
+
 async def fetchone(query: str, args: Optional[Tuple] = None) -> Optional[Dict[str, Any]]:
     """
     Execute a query and fetch one result.
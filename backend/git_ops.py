@@ -5,32 +5,53 @@ Git Operations Module (git_ops.py)
 Description: Git operation handlers for GitHub repositories
 
 Main Features:
-    - clone_repo: Clone repository (with token authentication)
-    - pull_repo: Pull latest changes
-    - list_files: List files/directories
+    - clone_repo_async: Clone repository (with token authentication)
+    - reclone_repo_async: Delete and clone fresh
+    - pull_repo_async: Pull latest changes
+      (all three run the git CLI as an asyncio subprocess)
+    - list_files: List files/directories (cached per HEAD commit)
     - read_file: Read file content
-    - search_files: Search filenames/content
+    - search_files: Search filenames/content (backed by a per-repo FTS5 index)
+    - build_search_index / invalidate_search_index: Maintain the search index
     - get_commits: Get commit history
     - get_branches: Get branch list
     - checkout_branch: Switch branches
 
 Dependencies:
     - GitPython: Python library for Git operations
-    
+    - cachetools: TTL cache for directory listings
+    - git CLI: Used directly by the async clone/pull variants
+
 Repository Path Structure:
     /repos/{user_id}/{repo_name}/
     
 Environment Variables:
     - REPOS_PATH: Repository base path (default: /repos)
+    - GIT_CLONE_DEPTH: Shallow clone depth for async clones (default: 0 = full history)
+    - GIT_CLONE_FILTER: Partial clone filter spec, e.g. "blob:none" (default: none)
+    - GIT_CLONE_NO_TAGS: Skip fetching tags for async clones (default: 0)
+    - GIT_REF_CACHE: Enable the shared reference object cache (default: 1)
+    - GIT_REF_CACHE_MAX_MB: Reference cache size budget before LRU eviction (default: 2048)
+    - SEARCH_INDEX_MAX_FILE_KB: Files larger than this are searched on disk instead of
+      from the index (default: 1024)
 ==============================================================================
 """
 
 import os
+import re
 import shutil
+import asyncio
+import hashlib
 import logging
+import sqlite3
+import tempfile
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
+from cachetools import TTLCache
 from git import Repo, GitCommandError
-from typing import Dict, Any, Union
+from typing import Dict, Any, Tuple, Union
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -38,6 +59,25 @@ logger = logging.getLogger(__name__)
 # Base path for cloned repositories
 REPOS_BASE_PATH = os.getenv("REPOS_PATH", "/repos")
 
+# Clone tuning for the async (git CLI) clone path
+CLONE_DEPTH = int(os.getenv("GIT_CLONE_DEPTH", "0"))
+CLONE_FILTER = os.getenv("GIT_CLONE_FILTER", "")
+CLONE_NO_TAGS = os.getenv("GIT_CLONE_NO_TAGS", "0") == "1"
+
+# Shared bare mirrors used as --reference-if-able object sources
+# Stored under REPOS_BASE_PATH/_ref_cache (GitHub logins cannot start with '_')
+REF_CACHE_ENABLED = os.getenv("GIT_REF_CACHE", "1") == "1"
+REF_CACHE_DIRNAME = "_ref_cache"
+REF_CACHE_MAX_BYTES = int(os.getenv("GIT_REF_CACHE_MAX_MB", "2048")) * 1024 * 1024
+
+# Full-text search index, kept inside .git so it never shows up in
+# listings, search results or `git status`
+SEARCH_INDEX_FILENAME = "gition_index.sqlite"
+# Marker left by a failed build; searches use the file scan while it is fresh
+SEARCH_INDEX_FAILED_FILENAME = "gition_index.failed"
+SEARCH_INDEX_FAILURE_TTL = 300
+SEARCH_INDEX_MAX_FILE_BYTES = int(os.getenv("SEARCH_INDEX_MAX_FILE_KB", "1024")) * 1024
+
 # Standard binary extensions to skip/detect
 BINARY_EXTENSIONS = {
     '.png', '.jpg', '.jpeg', '.gif', '.ico', '.pdf', '.zip', '.tar', '.gz',
@@ -45,21 +85,48 @@ BINARY_EXTENSIONS = {
     '.mp3', '.mp4', '.avi', '.mov', '.webm', '.wav', '.pyc', '.o', '.a'
 }
 
+# Path separators or parent references in a user_id/repo_name component
+_UNSAFE_COMPONENT = re.compile(r"[/\\]|\.\.")
 
-def get_repo_path(user_id: str, repo_name: str) -> Path:
+
+def validate_repo_ref(user_id: str, repo_name: str) -> str | None:
     """
-    Get local path for a repository with path traversal protection
+    Check that user_id/repo_name are safe single path components.
+
+    Lets callers reject bad input with a plain error dict instead of
+    raising (and catching) an exception on every invalid request.
+
+    Returns:
+        str: Error message, or None if both are valid
     """
     if not user_id or not repo_name:
-        raise ValueError("Invalid user_id or repo_name")
+        return "Invalid user_id or repo_name"
 
     # Sanitize: Reject path separators in components
-    if any(sep in str(user_id) for sep in ('/', '\\', '..')):
-        raise ValueError(f"Invalid user_id: {user_id}")
-    if any(sep in repo_name for sep in ('/', '\\', '..')):
-        raise ValueError(f"Invalid repo_name: {repo_name}")
+    if _UNSAFE_COMPONENT.search(str(user_id)):
+        return f"Invalid user_id: {user_id}"
+    if _UNSAFE_COMPONENT.search(repo_name):
+        return f"Invalid repo_name: {repo_name}"
+    return None
+
+
+@lru_cache(maxsize=16)
+def _resolve_base(base: str) -> Path:
+    """Resolve a repos base directory once (keyed by the configured string)"""
+    return Path(base).resolve()
+
+
+def get_repo_path(user_id: str, repo_name: str) -> Path:
+    """
+    Get local path for a repository with path traversal protection
+    """
+    error = validate_repo_ref(user_id, repo_name)
+    if error:
+        raise ValueError(error)
 
-    base_path = Path(REPOS_BASE_PATH).resolve()
+    base_path = _resolve_base(REPOS_BASE_PATH)
+    # Not cached: resolving the repo path on every call is what catches a
+    # symlinked user/repo directory pointing outside the base
     repo_path = (base_path / str(user_id) / repo_name).resolve()
 
     # Verify path is still within REPOS_BASE_PATH
@@ -73,28 +140,261 @@ def get_repo_path(user_id: str, repo_name: str) -> Path:
 
 
 # ==============================================================================
-# Repository Clone/Pull
+# Repository Clone/Pull (git CLI subprocess)
 # ==============================================================================
+# Waiting on a git child process is pure I/O, so these run the git CLI via
+# asyncio subprocesses instead of holding a worker thread for the whole
+# clone/pull like the GitPython variants above.
+
+async def _run_git(*args: str, cwd: Union[str, Path, None] = None) -> Tuple[int, str]:
+    """
+    Run a git command without blocking the event loop.
+
+    Args:
+        *args: git arguments (passed as argv, never through a shell)
+        cwd: Working directory for the command
+
+    Returns:
+        Tuple of (return code, combined stdout/stderr output)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "git", *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        # Never fall back to an interactive credential prompt
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+    )
+    output, _ = await proc.communicate()
+    return proc.returncode, output.decode("utf-8", errors="replace").strip()
+
+
+async def _create_local_branches_async(repo_path: Path) -> int:
+    """
+    Create local tracking branches for all remote branches.
+
+    Args:
+        repo_path: Path to the repository
+
+    Returns:
+        int: Number of local branches created
+    """
+    code, output = await _run_git(
+        "for-each-ref", "--format=%(refname:short)", "refs/heads", cwd=repo_path
+    )
+    if code != 0:
+        logger.warning(f"Failed to list local branches: {output}")
+        return 0
+    local_branch_names = set(output.splitlines())
+
+    code, output = await _run_git(
+        "for-each-ref", "--format=%(refname:short)", "refs/remotes", cwd=repo_path
+    )
+    if code != 0:
+        logger.warning(f"Failed to list remote branches: {output}")
+        return 0
+
+    created_count = 0
+    for ref_name in output.splitlines():
+        # Skip HEAD reference and bare remote names (e.g. 'origin')
+        if ref_name.endswith("/HEAD") or "/" not in ref_name:
+            continue
+
+        # Extract branch name (remove remote prefix like 'origin/')
+        branch_name = ref_name.split("/", 1)[1]
+        if branch_name in local_branch_names:
+            continue
+
+        code, output = await _run_git("branch", "--track", branch_name, ref_name, cwd=repo_path)
+        if code != 0:
+            logger.warning(f"Failed to create branch {branch_name}: {output}")
+            continue
+        local_branch_names.add(branch_name)
+        created_count += 1
+        logger.info(f"Created local branch: {branch_name} (tracking {ref_name})")
+
+    return created_count
+
+
+# ==============================================================================
+# Reference Object Cache
+# ==============================================================================
+# One bare mirror per clone URL (cache key = sha256 of the token-free URL).
+# User clones borrow objects from it with --reference-if-able, so re-clones and
+# clones of the same repository by different users only transfer new objects.
+
+# Per-mirror locks so concurrent clones of one URL don't race on creation
+_ref_cache_locks: Dict[str, asyncio.Lock] = {}
+# Mirrors borrowed by an in-flight clone (eviction skips them) and mirrors
+# being evicted (clones skip them); guarded by _ref_cache_state_lock since
+# eviction runs in a worker thread
+_ref_cache_readers: Dict[str, int] = {}
+_ref_cache_evicting: set = set()
+_ref_cache_state_lock = threading.Lock()
+
+# Only branches and tags are mirrored; GitHub's refs/pull/* heads would be
+# copied by a --mirror clone and can outweigh everything a user clone needs
+_REF_CACHE_REFSPECS = ("+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*")
+
+
+def _get_ref_cache_path(clone_url: str) -> Path:
+    """Get the reference mirror path for a (token-free) clone URL"""
+    key = hashlib.sha256(clone_url.encode("utf-8")).hexdigest()
+    return _resolve_base(REPOS_BASE_PATH) / REF_CACHE_DIRNAME / key
+
+
+def _dir_size(path: Path) -> int:
+    """Total size in bytes of all files under path"""
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def evict_reference_cache(max_bytes: int = REF_CACHE_MAX_BYTES) -> int:
+    """
+    Evict least recently used reference mirrors until the cache fits max_bytes.
+
+    Mirrors are touched on every use, so directory mtime is the LRU clock.
+    User clones are made with --dissociate and don't depend on a mirror once
+    they finish; mirrors still borrowed by an in-flight clone are skipped.
+
+    Returns:
+        int: Number of mirrors evicted
+    """
+    cache_root = _resolve_base(REPOS_BASE_PATH) / REF_CACHE_DIRNAME
+    if not cache_root.exists():
+        return 0
+
+    entries = []
+    for entry in cache_root.iterdir():
+        if entry.is_dir():
+            entries.append((entry.stat().st_mtime, _dir_size(entry), entry))
+
+    total = sum(size for _, size, _ in entries)
+    evicted = 0
+    # Oldest first
+    for _mtime, size, entry in sorted(entries, key=lambda e: e[0]):
+        if total <= max_bytes:
+            break
+        with _ref_cache_state_lock:
+            if _ref_cache_readers.get(entry.name):
+                continue
+            _ref_cache_evicting.add(entry.name)
+            _ref_cache_locks.pop(entry.name, None)
+        try:
+            shutil.rmtree(entry, ignore_errors=True)
+        finally:
+            with _ref_cache_state_lock:
+                _ref_cache_evicting.discard(entry.name)
+        total -= size
+        evicted += 1
+        logger.info(f"Evicted reference mirror {entry.name} ({size} bytes)")
+    return evicted
+
+
+async def _ensure_reference_cache(clone_url: str, auth_url: str) -> Path | None:
+    """
+    Create or refresh the bare mirror for clone_url and borrow it.
+
+    A returned mirror stays protected from eviction until the caller
+    passes it to _release_reference_cache.
+
+    Returns:
+        Path of the mirror, or None if it could not be prepared
+        (the caller then clones without a reference).
+    """
+    cache_path = _get_ref_cache_path(clone_url)
+    name = cache_path.name
+    with _ref_cache_state_lock:
+        if name in _ref_cache_evicting:
+            return None
+        lock = _ref_cache_locks.setdefault(name, asyncio.Lock())
+        _ref_cache_readers[name] = _ref_cache_readers.get(name, 0) + 1
+
+    borrowed = False
+    try:
+        async with lock:
+            if (cache_path / "HEAD").exists():
+                # Refresh from the authenticated URL without persisting the token
+                code, output = await _run_git(
+                    "fetch", "--prune", "--quiet", "--", auth_url, *_REF_CACHE_REFSPECS, cwd=cache_path
+                )
+                if code != 0:
+                    logger.warning(f"Reference mirror refresh failed for {name}")
+                    return None
+            else:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                code, output = await _run_git("clone", "--bare", "--quiet", "--", auth_url, str(cache_path))
+                if code != 0:
+                    logger.warning(f"Reference mirror creation failed for {name}")
+                    shutil.rmtree(cache_path, ignore_errors=True)
+                    return None
+                # Keep the shared mirror free of user credentials
+                await _run_git("remote", "set-url", "origin", clone_url, cwd=cache_path)
+                await asyncio.to_thread(evict_reference_cache)
+
+            # Mark as recently used for LRU eviction
+            os.utime(cache_path)
+            borrowed = True
+            return cache_path
+    finally:
+        if not borrowed:
+            _release_reference_cache(cache_path)
 
-def clone_repo(
+
+def _release_reference_cache(cache_path: Path) -> None:
+    """Drop a borrow taken by _ensure_reference_cache"""
+    with _ref_cache_state_lock:
+        count = _ref_cache_readers.get(cache_path.name, 0) - 1
+        if count > 0:
+            _ref_cache_readers[cache_path.name] = count
+        else:
+            _ref_cache_readers.pop(cache_path.name, None)
+
+
+def _build_clone_args(auth_url: str, repo_path: Path, reference: Path | None) -> list[str]:
+    """Build git clone argv for the async clone path"""
+    args = ["clone"]
+    if CLONE_NO_TAGS:
+        args += ["--no-tags"]
+    if CLONE_DEPTH > 0:
+        # Keep every branch reachable; the UI lists and checks out all of them
+        args += ["--depth", str(CLONE_DEPTH), "--no-single-branch"]
+    if CLONE_FILTER:
+        args += [f"--filter={CLONE_FILTER}"]
+    if reference is not None:
+        args += ["--reference-if-able", str(reference), "--dissociate"]
+    args += ["--", auth_url, str(repo_path)]
+    return args
+
+
+async def clone_repo_async(
     clone_url: str,
     access_token: str,
     user_id: str,
     repo_name: str
 ) -> Dict[str, Any]:
     """
-    Clone a GitHub repository to local storage
-    
+    Clone a GitHub repository to local storage without blocking the event loop.
+
+    The clone runs as a git subprocess awaited on the event loop instead of
+    occupying a thread pool slot.
+
     Authentication Method:
         - Inject token into HTTPS URL for authentication
         - Format: https://TOKEN@github.com/user/repo.git
-    
+
     Args:
         clone_url: GitHub HTTPS clone URL
         access_token: GitHub OAuth access token
         user_id: User's GitHub ID (for path separation)
         repo_name: Repository name
-        
+
     Returns:
         Dict:
             - status: "success" | "exists" | "error"
@@ -102,8 +402,12 @@ def clone_repo(
             - message: Status message
             - branches_created: Number of local branches created (on success)
     """
+    error = validate_repo_ref(user_id, repo_name)
+    if error:
+        return {"status": "error", "message": error, "path": None}
+
     repo_path = get_repo_path(user_id, repo_name)
-    
+
     # Return existing path if already cloned
     if repo_path.exists() and (repo_path / ".git").exists():
         return {
@@ -111,43 +415,45 @@ def clone_repo(
             "path": str(repo_path),
             "message": f"Repository already cloned at {repo_path}"
         }
-    
+
     # Create parent directory if needed
     repo_path.parent.mkdir(parents=True, exist_ok=True)
-    
+
     # Inject token into clone URL (for private repo access)
-    # https://github.com/... → https://TOKEN@github.com/...
     auth_url = clone_url.replace("https://", f"https://{access_token}@")
-    
+
+    reference = await _ensure_reference_cache(clone_url, auth_url) if REF_CACHE_ENABLED else None
     try:
-        Repo.clone_from(auth_url, repo_path)
-        
-        # Create local branches for all remote branches
-        # Skip fetch since we just cloned - all refs are up-to-date
-        branches_created = create_local_branches_from_remotes(repo_path, skip_fetch=True)
-        logger.info(f"Created {branches_created} local branches from remotes")
-        
-        return {
-            "status": "success",
-            "path": str(repo_path),
-            "message": f"Repository cloned successfully ({branches_created} branches created)",
-            "branches_created": branches_created
-        }
-    except GitCommandError as e:
+        code, output = await _run_git(*_build_clone_args(auth_url, repo_path, reference))
+    finally:
+        if reference is not None:
+            _release_reference_cache(reference)
+    if code != 0:
         # Clean up partial clone on failure
         if repo_path.exists():
             shutil.rmtree(repo_path)
-            
+
         # Sanitize error message to prevent token leakage
-        error_msg = str(e).replace(access_token, "***") if access_token else str(e)
+        error_msg = output.replace(access_token, "***") if access_token else output
         return {
             "status": "error",
             "path": None,
             "message": f"Clone failed: {error_msg}"
         }
 
+    branches_created = await _create_local_branches_async(repo_path)
+    logger.info(f"Created {branches_created} local branches from remotes")
+    await asyncio.to_thread(refresh_search_index, repo_path)
+
+    return {
+        "status": "success",
+        "path": str(repo_path),
+        "message": f"Repository cloned successfully ({branches_created} branches created)",
+        "branches_created": branches_created
+    }
+
 
-def reclone_repo(
+async def reclone_repo_async(
     clone_url: str,
     access_token: str,
     user_id: str,
@@ -155,15 +461,9 @@ def reclone_repo(
 ) -> Dict[str, Any]:
     """
     Delete existing repository and clone fresh.
-    
+
     Useful when clone is corrupted or needs to be reset.
-    
-    Args:
-        clone_url: GitHub HTTPS clone URL
-        access_token: GitHub OAuth access token
-        user_id: User's GitHub ID
-        repo_name: Repository name
-        
+
     Returns:
         Dict:
             - status: "success" | "error"
@@ -171,12 +471,17 @@ def reclone_repo(
             - message: Status message
             - branches_created: Number of local branches created (on success)
     """
+    error = validate_repo_ref(user_id, repo_name)
+    if error:
+        return {"status": "error", "message": error, "path": None}
+
     repo_path = get_repo_path(user_id, repo_name)
-    
+
     # Delete existing repository if it exists
     if repo_path.exists():
         try:
             shutil.rmtree(repo_path)
+            invalidate_list_cache(repo_path)
             logger.info(f"Deleted existing repository at {repo_path}")
         except OSError as e:
             logger.error(f"Failed to delete repository at {repo_path}: {e}")
@@ -185,116 +490,96 @@ def reclone_repo(
                 "path": None,
                 "message": f"Failed to delete existing repository: {str(e)}"
             }
-    
-    # Clone fresh
-    result = clone_repo(clone_url, access_token, user_id, repo_name)
-    
+
+    result = await clone_repo_async(clone_url, access_token, user_id, repo_name)
+
     # Update message to indicate reclone
     if result["status"] == "success":
         result["message"] = f"Repository re-cloned successfully ({result.get('branches_created', 0)} branches created)"
-    
+
     return result
 
 
-def create_local_branches_from_remotes(
-    repo_path: Union[str, Path],
-    skip_fetch: bool = False
-) -> int:
+async def pull_repo_async(user_id: str, repo_name: str) -> Dict[str, Any]:
     """
-    Create local tracking branches for all remote branches.
-    
-    Args:
-        repo_path: Path to the repository
-        skip_fetch: If True, skip fetching remote refs (useful after fresh clone)
-        
-    Returns:
-        int: Number of local branches created
-    """
-    try:
-        repo = Repo(repo_path)
-        created_count = 0
-        
-        # Get existing local branch names
-        local_branch_names = {branch.name for branch in repo.branches}
-        
-        # Iterate over remote refs (fetch only if not skipped)
-        for remote in repo.remotes:
-            if not skip_fetch:
-                try:
-                    remote.fetch()
-                except GitCommandError as fetch_err:
-                    logger.warning(f"Fetch failed for remote {remote.name}: {fetch_err}")
-                    # Continue with cached refs
-                
-            for ref in remote.refs:
-                # Skip HEAD reference
-                if ref.name.endswith('/HEAD'):
-                    continue
-                    
-                # Extract branch name (remove remote prefix like 'origin/')
-                branch_name = ref.name.split('/', 1)[1] if '/' in ref.name else ref.name
-                
-                # Skip if local branch already exists
-                if branch_name in local_branch_names:
-                    continue
-                
-                try:
-                    # Create local branch tracking the remote
-                    local_branch = repo.create_head(branch_name, ref.commit)
-                    # Set up tracking to the remote branch
-                    local_branch.set_tracking_branch(ref)
-                    local_branch_names.add(branch_name)
-                    created_count += 1
-                    logger.info(f"Created local branch: {branch_name} (tracking {ref.name})")
-                except GitCommandError as e:
-                    logger.warning(f"Failed to create branch {branch_name}: {e}")
-                    
-        return created_count
-    except Exception as e:
-        logger.exception(f"Error creating local branches: {e}")
-        return 0
-
+    Pull latest changes for a cloned repository.
 
-def pull_repo(user_id: str, repo_name: str) -> Dict[str, Any]:
-    """
-    Pull latest changes for a cloned repository
-    
-    Args:
-        user_id: User's GitHub ID
-        repo_name: Repository name
-        
     Returns:
         Dict:
             - status: "success" | "error"
             - message: Result message
     """
+    error = validate_repo_ref(user_id, repo_name)
+    if error:
+        return {"status": "error", "message": error}
+
     repo_path = get_repo_path(user_id, repo_name)
-    
+
     if not repo_path.exists():
         return {
             "status": "error",
             "message": "Repository not cloned"
         }
-    
-    try:
-        repo = Repo(repo_path)
-        origin = repo.remotes.origin
-        origin.pull()
-        return {
-            "status": "success",
-            "message": "Repository updated successfully"
-        }
-    except GitCommandError as e:
+
+    code, output = await _run_git("pull", "origin", cwd=repo_path)
+    if code != 0:
         return {
             "status": "error",
-            "message": f"Pull failed: {str(e)}"
+            "message": f"Pull failed: {output}"
         }
+    invalidate_list_cache(repo_path)
+    await asyncio.to_thread(refresh_search_index, repo_path)
+    return {
+        "status": "success",
+        "message": "Repository updated successfully"
+    }
 
 
 # ==============================================================================
 # File Operations
 # ==============================================================================
 
+# Directory listings keyed by (repo, path, HEAD sha, version, directory
+# mtime). clone/pull/checkout bump the repo version; the directory's
+# st_mtime_ns catches entries added, removed or renamed from outside the
+# backend (the terminal service edits the working tree directly).
+_list_cache: TTLCache = TTLCache(maxsize=10000, ttl=300)
+_list_cache_lock = threading.Lock()
+_repo_versions: Dict[str, int] = {}
+
+
+def _read_head_sha(repo_path: Path) -> str | None:
+    """
+    Resolve HEAD to a commit sha by reading .git directly (no git subprocess).
+
+    Returns:
+        str: Commit sha, or None if HEAD cannot be resolved
+    """
+    git_dir = repo_path / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref: "):
+            return head  # Detached HEAD
+        ref = head[len("ref: "):]
+        ref_file = git_dir / ref
+        if ref_file.is_file():
+            return ref_file.read_text().strip()
+        # Ref may only exist in packed-refs (e.g. right after clone)
+        for line in (git_dir / "packed-refs").read_text().splitlines():
+            if line.endswith(" " + ref):
+                return line.split(" ", 1)[0]
+    except OSError:
+        pass
+    return None
+
+
+def invalidate_list_cache(repo_path: Path) -> None:
+    """Invalidate cached directory listings for a repository"""
+    key = str(repo_path)
+    with _list_cache_lock:
+        _repo_versions[key] = _repo_versions.get(key, 0) + 1
+
+
 def list_files(user_id: str, repo_name: str, subpath: str = "") -> Dict[str, Any]:
     """
     List files/directories in a repository
@@ -331,6 +616,19 @@ def list_files(user_id: str, repo_name: str, subpath: str = "") -> Dict[str, Any
 
     if not target_path.exists():
         return {"status": "error", "message": "Path not found", "files": []}
+
+    head_sha = _read_head_sha(repo_path)
+    cache_key = None
+    if head_sha:
+        dir_mtime = target_path.stat().st_mtime_ns
+        with _list_cache_lock:
+            cache_key = (
+                str(repo_path), str(target_path), head_sha,
+                _repo_versions.get(str(repo_path), 0), dir_mtime,
+            )
+            cached = _list_cache.get(cache_key)
+        if cached is not None:
+            return cached
     
     files = []
     try:
@@ -348,11 +646,15 @@ def list_files(user_id: str, repo_name: str, subpath: str = "") -> Dict[str, Any
         # Sort: directories first, then alphabetically
         files.sort(key=lambda x: (x["type"] != "directory", x["name"].lower()))
         
-        return {
+        result = {
             "status": "success",
             "path": subpath or "/",
             "files": files
         }
+        if cache_key is not None:
+            with _list_cache_lock:
+                _list_cache[cache_key] = result
+        return result
     except Exception as e:
         return {"status": "error", "message": str(e), "files": []}
 
@@ -444,6 +746,10 @@ def delete_repo(user_id: str, repo_name: str) -> Dict[str, Any]:
     Warning:
         This operation is irreversible
     """
+    error = validate_repo_ref(user_id, repo_name)
+    if error:
+        return {"status": "error", "message": error}
+
     repo_path = get_repo_path(user_id, repo_name)
     
     if not repo_path.exists():
@@ -451,15 +757,390 @@ def delete_repo(user_id: str, repo_name: str) -> Dict[str, Any]:
     
     try:
         shutil.rmtree(repo_path)
+        invalidate_list_cache(repo_path)
         return {"status": "success", "message": "Repository deleted"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
 
+# ==============================================================================
+# Search Index
+# ==============================================================================
+# Tracked and untracked, non-ignored files (`git ls-files -co --exclude-standard`)
+# and their text are stored in an SQLite FTS5 table with the trigram tokenizer,
+# which answers case-insensitive substring queries of 3+ characters from the
+# index instead of re-reading every file on each search. The index is rebuilt
+# after clone/pull and dropped on checkout; search_files builds it lazily when
+# missing.
+#
+# The working tree is also changed outside the backend (the terminal service
+# edits, checks out and pulls directly), so the `files` table keeps each
+# file's mtime and size. Every search re-stats the file list and re-indexes
+# only the files that were added, changed or removed since.
+# Files over SEARCH_INDEX_MAX_FILE_BYTES are indexed by path only and flagged
+# `oversized`; their content is matched from disk at search time.
+
+# A failed build leaves a marker file next to the index, so searches fall back
+# to a file scan instead of retrying the full rebuild on every request. It
+# lives on disk because searches (and builds) run in git process pool workers.
+
+_SEARCH_INDEX_SCHEMA = (
+    "CREATE VIRTUAL TABLE docs USING fts5(path, content, tokenize='trigram')",
+    "CREATE TABLE files(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER,"
+    " doc_id INTEGER, oversized INTEGER)",
+)
+
+
+def _get_search_index_path(repo_path: Path) -> Path:
+    """Get the search index path for a cloned repository"""
+    return repo_path / ".git" / SEARCH_INDEX_FILENAME
+
+
+def _get_search_index_failure_path(repo_path: Path) -> Path:
+    """Get the failed-build marker path for a cloned repository"""
+    return repo_path / ".git" / SEARCH_INDEX_FAILED_FILENAME
+
+
+def _recent_index_failure(repo_path: Path) -> bool:
+    """Check whether the last index build failed within SEARCH_INDEX_FAILURE_TTL"""
+    try:
+        failed_at = _get_search_index_failure_path(repo_path).stat().st_mtime
+    except OSError:
+        return False
+    return time.time() - failed_at < SEARCH_INDEX_FAILURE_TTL
+
+
+def _read_indexable_text(file_path: Path) -> str | None:
+    """
+    Read file text for indexing.
+
+    Returns:
+        File text (empty for binary or unreadable files), or None if the
+        file is too large to index and must be searched on disk
+    """
+    if file_path.suffix.lower() in BINARY_EXTENSIONS:
+        return ""
+    try:
+        if file_path.stat().st_size > SEARCH_INDEX_MAX_FILE_BYTES:
+            return None
+        return file_path.read_text(encoding='utf-8', errors='ignore')
+    except OSError:
+        # Directories (submodules), broken symlinks, permission errors
+        return ""
+
+
+def _stat_indexable_files(repo_path: Path) -> Dict[str, Tuple[int, int]]:
+    """
+    Stat every tracked or untracked, non-ignored file in the working tree.
+
+    Returns:
+        Dict: relative path -> (st_mtime_ns, st_size); tracked files deleted
+        from the working tree are left out
+    """
+    listed = Repo(repo_path).git.ls_files("-z", "-c", "-o", "--exclude-standard")
+    stats = {}
+    for rel in listed.split("\0"):
+        if not rel or rel in stats:
+            continue
+        try:
+            st = os.stat(repo_path / rel)
+        except OSError:
+            continue
+        stats[rel] = (st.st_mtime_ns, st.st_size)
+    return stats
+
+
+def _stale_index_paths(
+    conn: sqlite3.Connection,
+    current: Dict[str, Tuple[int, int]]
+) -> Tuple[Dict[str, Tuple[int, int, int]], list, list]:
+    """
+    Compare the indexed files with the working tree.
+
+    Returns:
+        Tuple:
+            - stored: Indexed path -> (mtime_ns, size, doc_id)
+            - changed: Paths added or modified since they were indexed
+            - removed: Indexed paths no longer in the working tree
+    """
+    stored = {
+        path: (mtime_ns, size, doc_id)
+        for path, mtime_ns, size, doc_id in conn.execute(
+            "SELECT path, mtime_ns, size, doc_id FROM files"
+        )
+    }
+    changed = [
+        path for path, stat in current.items()
+        if path not in stored or stored[path][:2] != stat
+    ]
+    removed = [path for path in stored if path not in current]
+    return stored, changed, removed
+
+
+def _update_search_index(conn: sqlite3.Connection, repo_path: Path) -> int:
+    """
+    Bring an index in line with the working tree.
+
+    The diff is computed once without a lock; only when something changed
+    is it recomputed under a write lock and applied, so concurrent searches
+    never index the same file twice.
+
+    Returns:
+        int: Number of files re-indexed or removed
+    """
+    current = _stat_indexable_files(repo_path)
+    _stored, changed, removed = _stale_index_paths(conn, current)
+    if not changed and not removed:
+        return 0
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        stored, changed, removed = _stale_index_paths(conn, current)
+        for path in removed:
+            conn.execute("DELETE FROM docs WHERE rowid = ?", (stored[path][2],))
+            conn.execute("DELETE FROM files WHERE path = ?", (path,))
+        for path in changed:
+            if path in stored:
+                conn.execute("DELETE FROM docs WHERE rowid = ?", (stored[path][2],))
+            content = _read_indexable_text(repo_path / path)
+            doc_id = conn.execute(
+                "INSERT INTO docs(path, content) VALUES (?, ?)", (path, content or "")
+            ).lastrowid
+            conn.execute(
+                "INSERT OR REPLACE INTO files(path, mtime_ns, size, doc_id, oversized)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (path, *current[path], doc_id, content is None),
+            )
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return len(changed) + len(removed)
+
+
+def build_search_index(repo_path: Path) -> int:
+    """
+    (Re)build the full-text search index for a cloned repository.
+
+    The index is written to a temporary file and swapped in atomically,
+    so concurrent searches never see a half-built index.
+
+    Args:
+        repo_path: Repository working tree path
+
+    Returns:
+        int: Number of files indexed
+    """
+    index_path = _get_search_index_path(repo_path)
+
+    fd, tmp_name = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp_name)
+        try:
+            for statement in _SEARCH_INDEX_SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            count = _update_search_index(conn, repo_path)
+        finally:
+            conn.close()
+        os.replace(tmp_name, index_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    logger.info(f"Search index built for {repo_path} ({count} files)")
+    return count
+
+
+def invalidate_search_index(repo_path: Path) -> None:
+    """Drop the search index so the next search rebuilds it"""
+    _get_search_index_path(repo_path).unlink(missing_ok=True)
+
+
+def refresh_search_index(repo_path: Path) -> bool:
+    """
+    Rebuild the search index, logging instead of raising on failure.
+
+    Used after clone/pull where a failed index build must not fail the
+    git operation itself; search falls back to a file scan. The outcome is
+    remembered so searches don't retry a failed build on every request.
+
+    Returns:
+        bool: True if the index was built
+    """
+    marker = _get_search_index_failure_path(repo_path)
+    try:
+        build_search_index(repo_path)
+    except Exception as e:
+        logger.warning(f"Search index build failed for {repo_path}: {e}")
+        invalidate_search_index(repo_path)
+        try:
+            marker.touch()
+        except OSError:
+            pass
+        return False
+    marker.unlink(missing_ok=True)
+    return True
+
+
+def _ensure_search_index(repo_path: Path) -> Path | None:
+    """
+    Get an up-to-date search index path, building it first if missing.
+
+    An existing index is synced with the working tree; one that can't be
+    synced (unreadable or an older format) is rebuilt. A repo whose last
+    build failed isn't rebuilt until the failure expires or a clone/pull
+    refreshes the index.
+
+    Returns:
+        Path of the index, or None if unavailable (caller scans files instead)
+    """
+    index_path = _get_search_index_path(repo_path)
+    if not (repo_path / ".git").is_dir():
+        return None
+    if index_path.is_file():
+        try:
+            conn = sqlite3.connect(index_path)
+            try:
+                _update_search_index(conn, repo_path)
+            finally:
+                conn.close()
+            return index_path
+        except (sqlite3.Error, GitCommandError, OSError) as e:
+            logger.warning(f"Search index sync failed for {repo_path}, rebuilding: {e}")
+            invalidate_search_index(repo_path)
+    if _recent_index_failure(repo_path):
+        return None
+    return index_path if refresh_search_index(repo_path) else None
+
+
 # ==============================================================================
 # Search
 # ==============================================================================
 
+def _match_lines(
+    relative_path: str,
+    filename: str,
+    content: str,
+    query: str,
+    limit: int
+) -> list:
+    """
+    Find lines containing query (case-insensitive) in file content.
+
+    Returns:
+        list: Up to limit content results [{type, path, name, match, line, context}, ...]
+    """
+    query_lower = query.lower()
+    matches = []
+
+    for line_num, line in enumerate(content.split('\n'), 1):
+        if len(matches) >= limit:
+            break
+
+        if query_lower in line.lower():
+            # Extract context (truncate long lines)
+            context = line.strip()
+            if len(context) > 200:
+                idx = line.lower().find(query_lower)
+                start = max(0, idx - 50)
+                end = min(len(line), idx + len(query) + 50)
+                context = (
+                    ("..." if start > 0 else "") +
+                    line[start:end].strip() +
+                    ("..." if end < len(line) else "")
+                )
+
+            matches.append({
+                "type": "content",
+                "path": relative_path,
+                "name": filename,
+                "match": query,
+                "line": line_num,
+                "context": context
+            })
+    return matches
+
+
+def _search_index(
+    index_path: Path,
+    query: str,
+    search_content: bool,
+    max_results: int
+) -> list:
+    """
+    Search the FTS5 index.
+
+    Queries of 3+ characters are answered by the trigram index; shorter
+    ones scan the indexed text, which still avoids touching the working tree.
+    Oversized files are not in the index text, so their content is read
+    from the working tree.
+    """
+    query_lower = query.lower()
+    results = []
+
+    columns = "path, content" if search_content else "path, ''"
+    conn = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True)
+    try:
+        if len(query) >= 3:
+            # Quote as an FTS5 phrase so query text is never parsed as syntax
+            phrase = '"' + query.replace('"', '""') + '"'
+            target = "docs" if search_content else "path"
+            rows = conn.execute(
+                f"SELECT {columns} FROM docs WHERE {target} MATCH ? ORDER BY rowid",
+                (phrase,),
+            )
+        else:
+            rows = conn.execute(f"SELECT {columns} FROM docs ORDER BY rowid")
+
+        for relative_path, content in rows:
+            if len(results) >= max_results:
+                break
+
+            filename = relative_path.rsplit("/", 1)[-1]
+
+            # 1. Filename search
+            if query_lower in filename.lower():
+                results.append({
+                    "type": "filename",
+                    "path": relative_path,
+                    "name": filename,
+                    "match": filename,
+                    "line": None,
+                    "context": None
+                })
+                continue
+
+            # 2. Content search
+            if search_content and content:
+                results.extend(_match_lines(
+                    relative_path, filename, content, query, max_results - len(results)
+                ))
+
+        if search_content:
+            # index_path is <repo>/.git/<index file>
+            repo_path = index_path.parent.parent
+            for (relative_path,) in conn.execute("SELECT path FROM files WHERE oversized ORDER BY path"):
+                if len(results) >= max_results:
+                    break
+
+                filename = relative_path.rsplit("/", 1)[-1]
+                if query_lower in filename.lower():
+                    # Already reported as a filename match
+                    continue
+                try:
+                    content = (repo_path / relative_path).read_text(encoding='utf-8', errors='ignore')
+                except OSError:
+                    continue
+                results.extend(_match_lines(
+                    relative_path, filename, content, query, max_results - len(results)
+                ))
+    finally:
+        conn.close()
+    return results
+
+
 def search_files(
     user_id: str,
     repo_name: str,
@@ -490,7 +1171,21 @@ def search_files(
     
     if not repo_path.exists():
         return {"status": "error", "message": "Repository not cloned", "results": []}
-    
+
+    # Fast path: answer from the FTS5 index
+    index_path = _ensure_search_index(repo_path)
+    if index_path is not None:
+        try:
+            results = _search_index(index_path, query, search_content, max_results)
+            return {
+                "status": "success",
+                "query": query,
+                "total": len(results),
+                "results": results
+            }
+        except sqlite3.Error as e:
+            logger.warning(f"Search index query failed for {repo_path}, scanning files: {e}")
+
     query_lower = query.lower()
     results = []
     
@@ -527,33 +1222,9 @@ def search_files(
             if search_content and file_path.suffix.lower() not in BINARY_EXTENSIONS:
                 try:
                     content = file_path.read_text(encoding='utf-8', errors='ignore')
-                    lines = content.split('\n')
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        if len(results) >= max_results:
-                            break
-                        
-                        if query_lower in line.lower():
-                            # Extract context (truncate long lines)
-                            context = line.strip()
-                            if len(context) > 200:
-                                idx = line.lower().find(query_lower)
-                                start = max(0, idx - 50)
-                                end = min(len(line), idx + len(query) + 50)
-                                context = (
-                                    ("..." if start > 0 else "") +
-                                    line[start:end].strip() +
-                                    ("..." if end < len(line) else "")
-                                )
-                            
-                            results.append({
-                                "type": "content",
-                                "path": relative_path,
-                                "name": filename,
-                                "match": query,
-                                "line": line_num,
-                                "context": context
-                            })
+                    results.extend(_match_lines(
+                        relative_path, filename, content, query, max_results - len(results)
+                    ))
                 except (UnicodeDecodeError, PermissionError):
                     continue
         
@@ -756,6 +1427,10 @@ def checkout_branch(user_id: str, repo_name: str, branch_name: str) -> Dict[str,
         1. If local branch exists, checkout directly
         2. If not, create local branch from remote and checkout
     """
+    error = validate_repo_ref(user_id, repo_name)
+    if error:
+        return {"status": "error", "message": error}
+
     repo_path = get_repo_path(user_id, repo_name)
     
     if not repo_path.exists():
@@ -775,6 +1450,10 @@ def checkout_branch(user_id: str, repo_name: str, branch_name: str) -> Dict[str,
                 # May already exist, try direct checkout
                 repo.git.checkout(branch_name)
         
+        # Working tree changed; search index is rebuilt on next search
+        invalidate_search_index(repo_path)
+        invalidate_list_cache(repo_path)
+
         # Pull latest changes from remote after checkout (using tracking info)
         pull_result = None
         try:
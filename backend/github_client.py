@@ -0,0 +1,202 @@
+"""
+==============================================================================
+GitHub HTTP Client Module (github_client.py)
+==============================================================================
+Description: Shared httpx.AsyncClient for all GitHub API / OAuth calls
+
+Main Features:
+    - get_client: Get the shared client (created lazily on first use)
+    - close_client: Close the client on app shutdown
+    - github_headers: Cached per-token GitHub API request headers
+    - conditional_get / store_etag: Cached, ETag-revalidated GETs for list endpoints
+
+Connection Strategy:
+    - HTTP/2 enabled: concurrent calls from one process (user + emails,
+      issues + pulls, ...) multiplex over a single TCP+TLS connection
+    - Keep-alive pool: no per-request TCP/TLS handshake to api.github.com
+    - Accept-Encoding br/gzip: GitHub responses are compressed on the wire and
+      decoded transparently by httpx
+    - Fresh window: a response body built within GITHUB_FRESH_TTL seconds is
+      served without contacting GitHub at all
+    - Conditional requests: older list responses are revalidated with
+      If-None-Match; a 304 replays our cached response body and does not
+      count against the GitHub rate limit
+    - Single-flight: concurrent identical requests share one GitHub call
+
+Environment Variables:
+    - GITHUB_ETAG_CACHE_TTL: Seconds an ETag/body pair is kept (default: 600)
+    - GITHUB_FRESH_TTL: Seconds a cached body is served without revalidation (default: 60)
+
+Dependencies:
+    - httpx[http2,brotli]: HTTP/2 support requires the h2 package; brotli
+      decoding requires the brotli package
+==============================================================================
+"""
+
+import os
+import time
+import asyncio
+import hashlib
+import logging
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from cachetools import TTLCache
+
+from single_flight import single_flight
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Per-host connection limits (GitHub is effectively the only upstream host)
+LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=50,
+    keepalive_expiry=60,
+)
+
+# Default timeout; callers may still override per request
+TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+# Global client
+_client: Optional[httpx.AsyncClient] = None
+
+# (token digest, url, params) -> (ETag, serialized response body, stored at)
+ETAG_CACHE_TTL = int(os.getenv("GITHUB_ETAG_CACHE_TTL", "600"))
+FRESH_TTL = float(os.getenv("GITHUB_FRESH_TTL", "60"))
+_etag_cache: TTLCache = TTLCache(maxsize=5000, ttl=ETAG_CACHE_TTL)
+
+# (token digest, url, params) -> pending (response, cached_body) of an in-flight GET
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared GitHub HTTP client.
+
+    The client is created on first use so importing this module never
+    requires a running event loop.
+
+    Returns:
+        httpx.AsyncClient: The shared client
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=LIMITS,
+            timeout=TIMEOUT,
+            headers={"Accept-Encoding": "br, gzip"},
+        )
+        logger.info("GitHub HTTP client initialized (HTTP/2)")
+    return _client
+
+
+async def close_client() -> None:
+    """
+    Close the shared GitHub HTTP client.
+    """
+    global _client
+
+    if _client is None:
+        return
+
+    await _client.aclose()
+    _client = None
+    logger.info("GitHub HTTP client closed")
+
+
+@lru_cache(maxsize=2048)
+def github_headers(token: str) -> dict:
+    """
+    Get GitHub API request headers for a token.
+
+    Cached per token, so the returned dict is shared between requests
+    and must not be mutated (httpx copies it into its own Headers).
+
+    Args:
+        token: GitHub OAuth access token (without "Bearer " prefix)
+
+    Returns:
+        dict: Authorization, Accept and User-Agent headers
+    """
+    return {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": "gition-auth-server",
+    }
+
+
+async def conditional_get(
+    url: str,
+    token: str,
+    params: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[httpx.Response], Optional[bytes], tuple]:
+    """
+    GET a GitHub URL, reusing a previously cached response when possible.
+
+    Args:
+        url: GitHub API URL
+        token: GitHub OAuth access token
+        params: Query parameters
+
+    Returns:
+        Tuple:
+            - response: The GitHub response (None if served from the fresh window)
+            - cached_body: Body stored by store_etag if it is still fresh or
+              GitHub answered 304 Not Modified, else None
+            - key: Cache key to pass to store_etag
+    """
+    token_key = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    key = (token_key, url, tuple(sorted((params or {}).items())))
+
+    cached = _etag_cache.get(key)
+    if cached is not None and time.monotonic() - cached[2] < FRESH_TTL:
+        return None, cached[1], key
+
+    # Bodies stored with revalidate=False have no ETag and are never replayed on 304
+    etag = cached[0] if cached is not None else None
+
+    async def fetch() -> Tuple[httpx.Response, Optional[bytes]]:
+        headers = github_headers(token)
+        if etag:
+            # Copy: the headers dict from github_headers is shared
+            headers = {**headers, "If-None-Match": etag}
+
+        response = await get_client().get(url, headers=headers, params=params)
+        cached_body = None
+        if response.status_code == 304 and etag:
+            cached_body = cached[1]
+            # Revalidated: restart the fresh window
+            _etag_cache[key] = (etag, cached_body, time.monotonic())
+        return response, cached_body
+
+    response, cached_body = await single_flight(_inflight, key, fetch)
+    return response, cached_body, key
+
+
+def store_etag(
+    key: tuple,
+    response: httpx.Response,
+    body: bytes,
+    revalidate: bool = True
+) -> None:
+    """
+    Remember the serialized body built from a 200 response under its ETag.
+
+    Args:
+        key: Cache key returned by conditional_get
+        response: The GitHub response the body was built from
+        body: Serialized response body to replay on 304
+        revalidate: False if the body also depends on responses the ETag
+            doesn't cover; it is then only served within the fresh window
+    """
+    if not revalidate:
+        _etag_cache[key] = (None, body, time.monotonic())
+        return
+
+    etag = response.headers.get("ETag")
+    if isinstance(etag, str) and etag:
+        _etag_cache[key] = (etag, body, time.monotonic())
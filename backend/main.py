@@ -14,6 +14,11 @@ Environment Variables (.env):
     - GITHUB_CLIENT_ID: GitHub OAuth app client ID
     - GITHUB_CLIENT_SECRET: GitHub OAuth app client secret
     - REPOS_PATH: Cloned repository storage path (default: /repos)
+    - CLONE_CONCURRENCY: Maximum concurrent clones (default: 4)
+    - CLONE_QUEUE_LIMIT: Clones allowed to wait for a slot before 429 (default: 16)
+    - GIT_POOL_WORKERS: Process pool size for search/commit history (default: 3/4 of cores, min 3)
+    - LOGIN_CACHE_TTL: Seconds a token -> login lookup is cached for audit logging (default: 300)
+    - VERIFY_CACHE_TTL: Seconds a verified token identity is cached (default: 120)
 
 Run Command:
     uvicorn main:app --host 0.0.0.0 --port 3001 --reload
@@ -21,20 +26,41 @@ Run Command:
 """
 
 from fastapi import FastAPI, Request, Response
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
-import httpx
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from cachetools import TLRUCache, TTLCache
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from typing import Annotated, Any, Dict, Literal, Optional, Type, TypeVar
+from datetime import datetime, timezone
 import asyncio
+import base64
+import hashlib
 import os
-import json
 import logging
+import multiprocessing
+import re
+import time
+import orjson
 from urllib.parse import urlencode
 from dotenv import load_dotenv
 
 # Database module
 import database
 
+# Shared GitHub HTTP client
+import github_client
+
+# Buffered audit log writer
+import audit_log
+
+# Coalescing of concurrent identical lookups
+from single_flight import single_flight
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -46,12 +72,33 @@ logger = logging.getLogger(__name__)
 # ==============================================================================
 # Application Lifespan (Startup/Shutdown)
 # ==============================================================================
+# CPU-heavy git_ops work (content search, commit history walks) runs in a
+# process pool so it doesn't contend for the GIL with the event loop.
+# 3/4 of the cores, but at least 3 workers.
+GIT_POOL_WORKERS = int(os.getenv("GIT_POOL_WORKERS", max(3, (os.cpu_count() or 4) * 3 // 4)))
+_git_pool: Optional[ProcessPoolExecutor] = None
+
+
+async def run_git_work(func, *args):
+    """
+    Run a CPU-bound git_ops function in the process pool.
+
+    Falls back to the default thread pool when the process pool is not
+    running (e.g. the app is used without its lifespan, as in tests).
+    """
+    if _git_pool is None:
+        return await asyncio.to_thread(func, *args)
+    return await asyncio.get_running_loop().run_in_executor(_git_pool, func, *args)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifespan context manager.
     Handles startup and shutdown events.
     """
+    global _git_pool
+
     # Startup
     logger.info("Starting up Gition Auth Server...")
     try:
@@ -60,17 +107,28 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         # Continue without database for now (graceful degradation)
+    audit_log.start()
+    # spawn, not fork: forking a process that runs an event loop and threads is unsafe
+    _git_pool = ProcessPoolExecutor(
+        max_workers=GIT_POOL_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
     
     yield  # Application runs here
     
     # Shutdown
     logger.info("Shutting down Gition Auth Server...")
+    await audit_log.stop()
+    pool, _git_pool = _git_pool, None
+    await asyncio.to_thread(pool.shutdown)
+    await github_client.close_client()
     await database.close_pool()
     logger.info("Database pool closed")
 
 
 # Create FastAPI app instance with lifespan
-app = FastAPI(title="Gition Auth Server", lifespan=lifespan)
+# Handlers returning dicts/lists are encoded by orjson instead of stdlib json
+app = FastAPI(title="Gition Auth Server", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # CORS middleware configuration
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost,http://localhost:80,http://localhost:5173").split(",")
@@ -83,6 +141,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (issues/pulls lists, file trees); small
+# bodies are sent as-is since gzip overhead outweighs the savings
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # GitHub OAuth configuration (loaded from environment variables)
 GITHUB_CLIENT_ID = os.getenv("GITHUB_CLIENT_ID")
 #: :meta private:
@@ -90,6 +152,102 @@ GITHUB_CLIENT_SECRET = os.getenv("GITHUB_CLIENT_SECRET")
 #: :meta private:
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost")  # Redirect URL after authentication
 
+# GitHub authorize URL (depends only on configuration, so built once)
+# Nginx proxies to port 80, so callback URL uses port 80;
+# 'repo' scope grants access to private repositories
+_GITHUB_AUTHORIZE_URL = "https://github.com/login/oauth/authorize?" + urlencode({
+    "client_id": GITHUB_CLIENT_ID,
+    "redirect_uri": "http://localhost/auth/github/callback",
+    "scope": "read:user user:email repo"
+})
+
+
+# ==============================================================================
+# Pre-serialized Constant Responses
+# ==============================================================================
+# Bodies that never change for the life of the process are encoded once at
+# import time so hot paths (liveness probes, unauthenticated polls) skip the
+# JSON encoder entirely. They use orjson like every dynamic body, so the same
+# response has the same compact bytes whichever path produced it.
+_HEALTH_BODY = orjson.dumps({
+    "status": "ok",
+    "github_configured": bool(GITHUB_CLIENT_ID and GITHUB_CLIENT_SECRET)
+})
+_VERIFY_NOT_AUTHENTICATED_BODY = orjson.dumps(
+    {"status": "error", "authenticated": False, "message": "Not authenticated"}
+)
+_VERIFY_INVALID_TOKEN_BODY = orjson.dumps(
+    {"status": "error", "authenticated": False, "message": "Invalid token"}
+)
+_VERIFY_UNAVAILABLE_BODY = orjson.dumps(
+    {"status": "error", "authenticated": False, "message": "Auth verification unavailable"}
+)
+_ISSUES_NO_TOKEN_BODY = orjson.dumps(
+    {"status": "error", "message": "No authorization token", "issues": []}
+)
+_PULLS_NO_TOKEN_BODY = orjson.dumps(
+    {"status": "error", "message": "No authorization token", "pulls": []}
+)
+_ACTIVITY_NO_TOKEN_BODY = orjson.dumps(
+    {"status": "error", "message": "No authorization token", "issues": [], "pulls": []}
+)
+_MISSING_FIELDS_BODY = orjson.dumps(
+    {"status": "error", "message": "Missing required fields"}
+)
+_NOT_AUTHENTICATED_BODY = orjson.dumps(
+    {"status": "error", "message": "Not authenticated"}
+)
+_CLONE_BUSY_BODY = orjson.dumps(
+    {"status": "error", "message": "Too many clones in progress. Please retry shortly."}
+)
+
+
+# ==============================================================================
+# Request Body Limits
+# ==============================================================================
+# Bodies are read with a hard cap before any JSON decoding, so an oversized
+# (or endless chunked) upload costs at most `limit` bytes of memory.
+AUDIT_BODY_LIMIT = 64 * 1024
+GIT_BODY_LIMIT = 8 * 1024           # Clone bodies carry a token and repo description
+PAGE_BODY_LIMIT = 1024 * 1024       # Branch page content
+
+_BODY_TOO_LARGE_BODY = orjson.dumps(
+    {"status": "error", "message": "Request body too large"}
+)
+
+
+class BodyTooLarge(Exception):
+    """Raised by read_body when a request body exceeds its limit"""
+
+
+@app.exception_handler(BodyTooLarge)
+async def body_too_large_handler(request: Request, exc: BodyTooLarge):
+    return Response(status_code=413, content=_BODY_TOO_LARGE_BODY, media_type="application/json")
+
+
+async def read_body(request: Request, limit: int) -> bytes:
+    """
+    Read a request body, rejecting it once it exceeds `limit` bytes.
+
+    A declared Content-Length over the limit is rejected without reading;
+    chunked bodies are counted as they stream in.
+
+    Raises:
+        BodyTooLarge: Body exceeds the limit (answered with 413)
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > limit:
+        raise BodyTooLarge()
+
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:
+            raise BodyTooLarge()
+        chunks.append(chunk)
+    return b"".join(chunks)
+
 
 # ==============================================================================
 # Health Check Endpoint
@@ -103,10 +261,7 @@ async def health():
         - status: Server status ("ok")
         - github_configured: Whether GitHub OAuth is configured
     """
-    return {
-        "status": "ok",
-        "github_configured": bool(GITHUB_CLIENT_ID and GITHUB_CLIENT_SECRET)
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # ==============================================================================
@@ -124,19 +279,7 @@ async def github_auth():
         - user:email: Read user email
         - repo: Access public/private repositories (important!)
     """
-    # Nginx proxies to port 80, so callback URL uses port 80
-    redirect_uri = "http://localhost/auth/github/callback"
-    
-    # 'repo' scope grants access to private repositories
-    scope = "read:user user:email repo"
-    
-    params = urlencode({
-        "client_id": GITHUB_CLIENT_ID,
-        "redirect_uri": redirect_uri,
-        "scope": scope
-    })
-    
-    return RedirectResponse(f"https://github.com/login/oauth/authorize?{params}")
+    return RedirectResponse(_GITHUB_AUTHORIZE_URL)
 
 
 @app.get("/auth/github/callback")
@@ -147,7 +290,7 @@ async def github_callback(code: str = None, error: str = None):
     Flow:
         1. Receive authorization code from GitHub
         2. Exchange code for access token
-        3. Fetch user info/email with access token
+        3. Fetch user info/email with access token (concurrently)
         4. Pass user info to frontend (via URL parameters)
     
     Args:
@@ -158,89 +301,113 @@ async def github_callback(code: str = None, error: str = None):
     if error or not code:
         return RedirectResponse(f"{FRONTEND_URL}/login?error=auth_failed")
     
-    async with httpx.AsyncClient() as client:
-        # Step 1: Exchange authorization code for access token
-        token_response = await client.post(
-            "https://github.com/login/oauth/access_token",
-            json={
-                "client_id": GITHUB_CLIENT_ID,
-                "client_secret": GITHUB_CLIENT_SECRET,
-                "code": code
-            },
-            headers={"Accept": "application/json"}
-        )
-        
-        token_data = token_response.json()
-        
-        if "error" in token_data:
-            return RedirectResponse(f"{FRONTEND_URL}/login?error=token_error")
-        
-        access_token = token_data.get("access_token")
-        
-        # Step 2: Fetch user info
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "gition-auth-server",
-        }
-        
-        user_response = await client.get("https://api.github.com/user", headers=headers)
-        user_data = user_response.json()
-        
-        # Step 3: Fetch user email (prefer primary email)
-        email_response = await client.get("https://api.github.com/user/emails", headers=headers)
-        emails = email_response.json()
-        primary_email = next(
-            (e["email"] for e in emails if e.get("primary")),
-            emails[0]["email"] if emails else None
-        )
-        
-        # Step 4: Prepare user info for frontend
-        user_info = {
-            "id": user_data.get("id"),
-            "login": user_data.get("login"),
-            "name": user_data.get("name") or user_data.get("login"),
-            "email": primary_email or f"{user_data.get('id')}+{user_data.get('login')}@users.noreply.github.com",
-            "avatar_url": user_data.get("avatar_url")
-        }
-        
-        # Step 5: Save/update user in database
-        try:
-            import user_ops
-            await user_ops.get_or_create_user(
-                github_id=user_data.get("id"),
-                login=user_data.get("login"),
-                name=user_data.get("name"),
-                email=user_info["email"],
-                avatar_url=user_data.get("avatar_url"),
-                access_token=access_token
-            )
-            logger.info(f"User saved to database: {user_data.get('login')}")
-        except Exception as e:
-            # Log error but don't fail authentication
-            logger.warning(f"Failed to save user to database: {e}")
-        
-        # Security: Use Secure, HttpOnly cookie instead of URL parameters
-        response = RedirectResponse(f"{FRONTEND_URL}/auth/callback?user={json.dumps(user_info)}")
-        
-        # Determine if we are on HTTPS (for Secure attribute)
-        is_https = FRONTEND_URL.startswith("https")
-        
-        response.set_cookie(
-            key="github_token",
-            value=access_token,
-            httponly=True,
-            secure=is_https,
-            samesite="lax",
-            max_age=60 * 60 * 24 * 7,  # 7 days
-            path="/"
+    client = github_client.get_client()
+    # Step 1: Exchange authorization code for access token
+    token_response = await client.post(
+        "https://github.com/login/oauth/access_token",
+        json={
+            "client_id": GITHUB_CLIENT_ID,
+            "client_secret": GITHUB_CLIENT_SECRET,
+            "code": code
+        },
+        headers={"Accept": "application/json"}
+    )
+
+    token_data = token_response.json()
+
+    if "error" in token_data:
+        return RedirectResponse(f"{FRONTEND_URL}/login?error=token_error")
+
+    access_token = token_data.get("access_token")
+
+    # Step 2 & 3: Fetch user info and emails concurrently (independent once token is known)
+    headers = github_client.github_headers(access_token)
+
+    user_response, email_response = await asyncio.gather(
+        client.get("https://api.github.com/user", headers=headers),
+        client.get("https://api.github.com/user/emails", headers=headers),
+    )
+    user_data = user_response.json()
+
+    # Prefer the primary verified email, then any primary, then the first listed
+    emails = email_response.json()
+    primary_email = None
+    for e in emails or ():
+        if e.get("primary"):
+            primary_email = e["email"]
+            if e.get("verified"):
+                break
+    if primary_email is None and emails:
+        primary_email = emails[0]["email"]
+
+    # Step 4: Prepare user info for frontend
+    user_info = {
+        "id": user_data.get("id"),
+        "login": user_data.get("login"),
+        "name": user_data.get("name") or user_data.get("login"),
+        "email": primary_email or f"{user_data.get('id')}+{user_data.get('login')}@users.noreply.github.com",
+        "avatar_url": user_data.get("avatar_url")
+    }
+
+    # Step 5: Save/update user in database
+    try:
+        import user_ops
+        await user_ops.get_or_create_user(
+            github_id=user_data.get("id"),
+            login=user_data.get("login"),
+            name=user_data.get("name"),
+            email=user_info["email"],
+            avatar_url=user_data.get("avatar_url"),
+            access_token=access_token
         )
-        
-        return response
+        logger.info(f"User saved to database: {user_data.get('login')}")
+    except Exception as e:
+        # Log error but don't fail authentication
+        logger.warning(f"Failed to save user to database: {e}")
+
+    # Security: Use Secure, HttpOnly cookie instead of URL parameters
+    # base64url keeps the payload free of characters that need percent-encoding
+    user_param = base64.urlsafe_b64encode(orjson.dumps(user_info)).rstrip(b"=").decode()
+    response = RedirectResponse(f"{FRONTEND_URL}/auth/callback?user={user_param}")
+
+    # Determine if we are on HTTPS (for Secure attribute)
+    is_https = FRONTEND_URL.startswith("https")
+
+    response.set_cookie(
+        key="github_token",
+        value=access_token,
+        httponly=True,
+        secure=is_https,
+        samesite="lax",
+        max_age=60 * 60 * 24 * 7,  # 7 days
+        path="/"
+    )
+
+    return response
 
 # ==============================================================================
 # Authentication Verification API
 # ==============================================================================
+# Verified identities are cached briefly so ProtectedRoute checks on every
+# navigation don't each cost a GitHub round-trip. Keys are token digests, so
+# raw tokens are never held as cache keys.
+VERIFY_CACHE_TTL = int(os.getenv("VERIFY_CACHE_TTL", "120"))
+_verify_cache: TTLCache = TTLCache(maxsize=10000, ttl=VERIFY_CACHE_TTL)
+
+
+def _token_cache_key(token: str) -> str:
+    """Hash a token into a compact cache key (blake2b is the fastest stdlib hash)"""
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+def _normalize_token(token: str) -> str:
+    """Strip a leading "Bearer " / "token " scheme from a token"""
+    if token.startswith("Bearer "):
+        token = token.replace("Bearer ", "", 1)
+    if token.startswith("token "):
+        token = token.replace("token ", "", 1)
+    return token
+
 
 @app.get("/api/auth/verify")
 async def verify_auth(request: Request):
@@ -250,67 +417,142 @@ async def verify_auth(request: Request):
     """
     token = get_token(request)
     if not token:
-        return Response(
-            status_code=401,
-            media_type="application/json",
-            content=json.dumps({"status": "error", "authenticated": False, "message": "Not authenticated"}),
-        )
+        return Response(status_code=401, media_type="application/json", content=_VERIFY_NOT_AUTHENTICATED_BODY)
+
+    normalized = _normalize_token(token)
+
+    # Fast path: recently verified token, served as pre-serialized bytes
+    cache_key = _token_cache_key(normalized)
+    cached_body = _verify_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            normalized = token
-            if normalized.startswith("Bearer "):
-                normalized = normalized.replace("Bearer ", "", 1)
-            if normalized.startswith("token "):
-                normalized = normalized.replace("token ", "", 1)
-
-            headers = {
-                "Authorization": f"token {normalized}",
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "gition-auth-server",
-            }
-            user_response = await client.get("https://api.github.com/user", headers=headers)
-
-            if user_response.status_code == 200:
-                user_data = user_response.json()
-                return {
-                    "status": "success",
-                    "authenticated": True,
-                    "user": {
-                        "id": user_data.get("id"),
-                        "login": user_data.get("login"),
-                        "name": user_data.get("name"),
-                    },
-                }
-
-            if user_response.status_code in (401,):
-                resp = Response(
-                    status_code=401,
-                    media_type="application/json",
-                    content=json.dumps({"status": "error", "authenticated": False, "message": "Invalid token"}),
-                    headers={"Cache-Control": "no-store"},
-                )
-                resp.delete_cookie("github_token", path="/")
-                return resp
-
-            # Treat rate limit / upstream issues as transient
-            return Response(
-                status_code=503,
+        client = github_client.get_client()
+        headers = github_client.github_headers(normalized)
+        user_response = await client.get("https://api.github.com/user", headers=headers)
+
+        if user_response.status_code == 200:
+            user_data = user_response.json()
+            body = orjson.dumps({
+                "status": "success",
+                "authenticated": True,
+                "user": {
+                    "id": user_data.get("id"),
+                    "login": user_data.get("login"),
+                    "name": user_data.get("name"),
+                },
+            })
+            # Only positive results are cached; failures always re-check
+            _verify_cache[cache_key] = body
+            _login_cache[cache_key] = user_data.get("login")
+            return Response(content=body, media_type="application/json")
+
+        if user_response.status_code in (401,):
+            resp = Response(
+                status_code=401,
                 media_type="application/json",
-                content=json.dumps({"status": "error", "authenticated": False, "message": "Auth verification unavailable"}),
+                content=_VERIFY_INVALID_TOKEN_BODY,
+                headers={"Cache-Control": "no-store"},
             )
+            resp.delete_cookie("github_token", path="/")
+            return resp
+
+        # Treat rate limit / upstream issues as transient
+        return Response(
+            status_code=503,
+            media_type="application/json",
+            content=_VERIFY_UNAVAILABLE_BODY,
+        )
     except Exception:
         logger.exception("Auth verification failed")
         return Response(
             status_code=503,
             media_type="application/json",
-            content=json.dumps({"status": "error", "authenticated": False, "message": "Auth verification unavailable"}),
+            content=_VERIFY_UNAVAILABLE_BODY,
         )
 
 
 # ==============================================================================
 # Audit Logging API
 # ==============================================================================
+# Clients emit COMMIT_INITIATED/SUCCESS/FAILURE in quick succession; caching
+# token -> login avoids a GitHub /user round-trip for each of them.
+LOGIN_CACHE_TTL = int(os.getenv("LOGIN_CACHE_TTL", "300"))
+_login_cache: TTLCache = TTLCache(maxsize=10000, ttl=LOGIN_CACHE_TTL)
+
+# Cache key -> pending /user lookup, so a burst of audits on a cold token
+# shares one GitHub call instead of each missing the cache
+_login_inflight: Dict[str, asyncio.Future] = {}
+
+
+ALLOWED_METADATA_KEYS = ("branch", "error", "file_count")
+
+
+class AuditBody(BaseModel):
+    """
+    Audit event request body, decoded and validated in one pass by pydantic-core.
+
+    event_type is the allowlist; the other fields stay untyped because
+    any JSON value is accepted there: repo_name and status are str()'d by
+    the handler and non-object metadata is ignored rather than rejected.
+    """
+    event_type: Literal["COMMIT_INITIATED", "COMMIT_SUCCESS", "COMMIT_FAILURE"]
+    repo_name: Any = None
+    status: Any = None
+    metadata: Any = None
+
+# Audit timestamps have one-second granularity, so the ISO string is only
+# reformatted when the wall-clock second changes
+_ts_cache = {"sec": 0, "str": ""}
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO 8601 string (second precision, cached per second)"""
+    sec = int(time.time())
+    if sec != _ts_cache["sec"]:
+        _ts_cache["str"] = datetime.fromtimestamp(sec, timezone.utc).isoformat()
+        _ts_cache["sec"] = sec
+    return _ts_cache["str"]
+
+
+async def get_github_login(token: str) -> str | None:
+    """
+    Resolve a GitHub token to the user's login, using a short-lived cache.
+
+    Args:
+        token: GitHub access token (with or without "Bearer "/"token " prefix)
+
+    Returns:
+        str: GitHub login, or None if GitHub rejects the token
+    """
+    normalized = _normalize_token(token)
+    cache_key = _token_cache_key(normalized)
+    login = _login_cache.get(cache_key)
+    if login is not None:
+        return login
+
+    async def fetch() -> str | None:
+        login = await _fetch_github_login(normalized)
+        if login:
+            _login_cache[cache_key] = login
+        return login
+
+    return await single_flight(_login_inflight, cache_key, fetch)
+
+
+async def _fetch_github_login(token: str) -> str | None:
+    """Call GitHub /user for a normalized token and return the login"""
+    client = github_client.get_client()
+    user_response = await client.get(
+        "https://api.github.com/user",
+        headers=github_client.github_headers(token),
+        timeout=5.0,
+    )
+    if user_response.status_code != 200:
+        return None
+    return user_response.json().get("login")
+
 
 @app.post("/api/audit/log")
 async def log_audit_event(request: Request):
@@ -323,107 +565,138 @@ async def log_audit_event(request: Request):
     # 1. Authentication Check
     token = get_token(request)
     if not token:
-        return Response(
+        return ORJSONResponse(
             status_code=401,
-            media_type="application/json",
-            content=json.dumps({"status": "error", "message": "Authentication required for auditing"}),
+            content={"status": "error", "message": "Authentication required for auditing"},
         )
 
+    # Size check before the GitHub round-trip
+    raw_body = await read_body(request, AUDIT_BODY_LIMIT)
+
     try:
         # Verify token and get user context
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            normalized = token
-            if normalized.startswith("Bearer "):
-                normalized = normalized.replace("Bearer ", "", 1)
-            if normalized.startswith("token "):
-                normalized = normalized.replace("token ", "", 1)
-
-            user_response = await client.get(
-                "https://api.github.com/user",
-                headers={
-                    "Authorization": f"token {normalized}",
-                    "Accept": "application/vnd.github.v3+json",
-                    "User-Agent": "gition-auth-server",
-                },
+        user_id = await get_github_login(token)
+        if not user_id:
+            return ORJSONResponse(
+                status_code=401,
+                content={"status": "error", "message": "Invalid session"},
             )
-            if user_response.status_code != 200:
-                return Response(
-                    status_code=401,
-                    media_type="application/json",
-                    content=json.dumps({"status": "error", "message": "Invalid session"}),
-                )
-            user_data = user_response.json()
-            user_id = user_data.get("login")
 
+        # 2. Validation: JSON decode + Event Type Allowlist (single pass)
         try:
-            body = await request.json()
-        except Exception:
-            return Response(
-                status_code=400,
-                media_type="application/json",
-                content=json.dumps({"status": "error", "message": "Invalid JSON body"}),
-            )
-
-        # 2. Validation: Event Type Allowlist
-        ALLOWED_EVENTS = {"COMMIT_INITIATED", "COMMIT_SUCCESS", "COMMIT_FAILURE"}
-        event_type = body.get("event_type")
-        if event_type not in ALLOWED_EVENTS:
-            return Response(
+            body = AuditBody.model_validate_json(raw_body)
+        except ValidationError as e:
+            bad_event = any(err["loc"][:1] == ("event_type",) for err in e.errors())
+            return ORJSONResponse(
                 status_code=400,
-                media_type="application/json",
-                content=json.dumps({"status": "error", "message": "Invalid event type"}),
+                content={
+                    "status": "error",
+                    "message": "Invalid event type" if bad_event else "Invalid JSON body",
+                },
             )
 
         # 3. Validation: Metadata Filtering
-        # Only allow specific keys and ensure values are strings/primitives
-        ALLOWED_METADATA_KEYS = {"branch", "error", "file_count"}
-        raw_metadata = body.get("metadata") or {}
+        # Only allow specific keys and ensure values are strings/primitives.
+        # Iterate the fixed allowlist, not the client-controlled dict, so cost
+        # doesn't grow with the size of the submitted metadata.
+        raw_metadata = body.metadata or {}
         if not isinstance(raw_metadata, dict):
             raw_metadata = {}
 
-        metadata = {
-            k: str(v)[:500]  # Sanitize/Truncate values
-            for k, v in raw_metadata.items()
-            if k in ALLOWED_METADATA_KEYS
-        }
+        metadata = {}
+        for k in ALLOWED_METADATA_KEYS:
+            if k in raw_metadata:
+                metadata[k] = str(raw_metadata[k])[:500]  # Sanitize/Truncate values
 
         # 4. Construct Trusted Log Entry
-        from datetime import datetime, timezone
-        repo_name = str(body.get("repo_name") or "")[:100]
-        status = str(body.get("status") or "info")[:20]
+        repo_name = str(body.repo_name or "")[:100]
+        status = str(body.status or "info")[:20]
 
         log_entry = {
             "version": "1.1",
-            "event": event_type,
+            "event": body.event_type,
             "user": user_id, # Derived from verified token
             "repo": repo_name,
             "status": status,
             "metadata": metadata,
-            "timestamp": datetime.now(timezone.utc).isoformat() # Trusted server time
+            "timestamp": _iso_now() # Trusted server time
         }
         
-        # 5. Structured Logging
-        # Outputting pure JSON allows external log aggregators (ELK, Stackdriver, etc.)
-        # to automatically parse the fields without complex regex or pattern matching.
-        logger.info(json.dumps({
-            "audit_log": True,
-            "data": log_entry
-        }))
+        # 5. Structured Logging (batched by a background writer, off the request path)
+        audit_log.enqueue(log_entry)
         return {"status": "success"}
     except Exception as e:
         logger.error(f"Failed to record audit event: {e}")
-        return Response(status_code=500, content=json.dumps({"status": "error", "message": "Logging failed"}))
+        return ORJSONResponse(status_code=500, content={"status": "error", "message": "Logging failed"})
 
 
 # ==============================================================================
 # Repository List API
 # ==============================================================================
 
+# Fixed-schema field projection: itemgetter fetches all keys in one C call
+_REPO_FIELDS = (
+    "id", "name", "full_name", "description", "private", "html_url", "clone_url",
+    "ssh_url", "language", "stargazers_count", "updated_at", "default_branch",
+)
+_get_repo_fields = itemgetter(*_REPO_FIELDS)
+_REPO_PRIVATE_INDEX = _REPO_FIELDS.index("private")
+
+_REPOS_URL = "https://api.github.com/user/repos"
+_REPOS_PARAMS = {
+    "visibility": "all",                                  # Public + private
+    "affiliation": "owner,collaborator,organization_member",
+    "sort": "updated",                                    # Most recently updated first
+    "per_page": 100
+}
+# Pages after the first are fetched concurrently; bounded to stay under
+# GitHub's secondary rate limits
+REPO_PAGE_CONCURRENCY = 10
+REPO_MAX_PAGES = 50
+_LINK_LAST_PAGE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def _last_page(response) -> int:
+    """Read the last page number from a GitHub Link header (1 if not paginated)"""
+    link = response.headers.get("Link")
+    if not isinstance(link, str):
+        return 1
+    match = _LINK_LAST_PAGE.search(link)
+    return min(int(match.group(1)), REPO_MAX_PAGES) if match else 1
+
+
+async def _fetch_repo_pages(token: str, last_page: int) -> list | None:
+    """
+    Fetch repo list pages 2..last_page concurrently over the shared client.
+
+    Returns:
+        list: Response bodies in page order, or None if any page failed
+    """
+    client = github_client.get_client()
+    headers = github_client.github_headers(token)
+    sem = asyncio.Semaphore(REPO_PAGE_CONCURRENCY)
+
+    async def fetch(page: int):
+        async with sem:
+            return await client.get(_REPOS_URL, headers=headers, params={**_REPOS_PARAMS, "page": page})
+
+    responses = await asyncio.gather(*(fetch(page) for page in range(2, last_page + 1)))
+    if any(r.status_code != 200 for r in responses):
+        return None
+    return [r.content for r in responses]
+
+
+@lru_cache(maxsize=4096)
+def _parse_bearer(header: str) -> str:
+    """Strip the "Bearer " scheme from an Authorization header (memoized per header value)"""
+    return header.removeprefix("Bearer ")
+
+
 def get_token(request: Request) -> str | None:
     """Helper to extract token from header or cookie"""
     auth = request.headers.get("Authorization")
     if auth:
-        return auth.replace("Bearer ", "") if auth.startswith("Bearer ") else auth
+        return _parse_bearer(auth)
     return request.cookies.get("github_token")
 
 
@@ -433,54 +706,51 @@ async def get_repos(request: Request):
     if not token:
         return {"error": "Not authenticated", "repos": []}
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "gition-auth-server",
-        }
-        
-        repos_response = await client.get(
-            "https://api.github.com/user/repos",
-            headers=headers,
-            params={
-                "visibility": "all",                                  # Public + private
-                "affiliation": "owner,collaborator,organization_member",
-                "sort": "updated",                                    # Most recently updated first
-                "per_page": 100
-            }
-        )
-        
-        if repos_response.status_code != 200:
+    # The ETag is taken from page 1: with sort=updated, any repo change or
+    # addition moves that repo to the top, so page 1 changes with the list.
+    # A removal from a later page leaves page 1 untouched, so multi-page
+    # lists are only cached for the fresh window and never replayed on 304
+    repos_response, cached_body, etag_key = await github_client.conditional_get(
+        _REPOS_URL, token, params=_REPOS_PARAMS
+    )
+
+    # 304 Not Modified: replay the previously built response
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+
+    if repos_response.status_code != 200:
+        return {"error": "Failed to fetch repos", "repos": []}
+
+    pages = [repos_response.content]
+    last_page = _last_page(repos_response)
+    if last_page > 1:
+        rest = await _fetch_repo_pages(token, last_page)
+        if rest is None:
             return {"error": "Failed to fetch repos", "repos": []}
-        
-        repos_data = repos_response.json()
-        
-        # Extract necessary fields for response
-        repos = [
-            {
-                "id": repo["id"],
-                "name": repo["name"],
-                "full_name": repo["full_name"],
-                "description": repo["description"],
-                "private": repo["private"],
-                "html_url": repo["html_url"],
-                "clone_url": repo["clone_url"],
-                "ssh_url": repo["ssh_url"],
-                "language": repo["language"],
-                "stargazers_count": repo["stargazers_count"],
-                "updated_at": repo["updated_at"],
-                "default_branch": repo["default_branch"]
-            }
-            for repo in repos_data
-        ]
-        
-        return {
-            "total": len(repos),
-            "public": len([r for r in repos if not r["private"]]),
-            "private": len([r for r in repos if r["private"]]),
-            "repos": repos
-        }
+        pages.extend(rest)
+
+    # Extract necessary fields and count public repos in a single pass
+    # (orjson decodes straight from the raw body bytes). Pages are decoded
+    # one at a time and released once projected, so at most one parsed page
+    # is alive alongside the trimmed output.
+    repos = []
+    public = 0
+    pages.reverse()
+    while pages:
+        for repo in orjson.loads(pages.pop()):
+            values = _get_repo_fields(repo)
+            public += not values[_REPO_PRIVATE_INDEX]
+            repos.append(dict(zip(_REPO_FIELDS, values)))
+
+    total = len(repos)
+    body = orjson.dumps({
+        "total": total,
+        "public": public,
+        "private": total - public,
+        "repos": repos
+    })
+    github_client.store_etag(etag_key, repos_response, body, revalidate=last_page == 1)
+    return Response(content=body, media_type="application/json")
 
 
 # ==============================================================================
@@ -488,11 +758,102 @@ async def get_repos(request: Request):
 # ==============================================================================
 # Import actual Git operation functions from git_ops.py
 from git_ops import (
-    clone_repo, reclone_repo, pull_repo, list_files, read_file,
+    clone_repo_async, reclone_repo_async, pull_repo_async, list_files, read_file,
     is_cloned, delete_repo, search_files, get_commits,
     get_branches, checkout_branch
 )
 
+# Request bodies are decoded and validated in one pass by pydantic-core
+# (model_validate_json), replacing request.json() + manual field checks.
+# Numeric user_id values are coerced to str at decode time.
+
+NonEmptyStr = Annotated[str, Field(min_length=1)]
+
+
+class RepoRef(BaseModel):
+    """Body identifying a cloned repository"""
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    user_id: NonEmptyStr
+    repo_name: NonEmptyStr
+
+
+class CloneRequest(RepoRef):
+    """Body for clone/reclone (extra fields are used for DB registration)"""
+    clone_url: NonEmptyStr
+    github_repo_id: Optional[int] = 0
+    full_name: Optional[str] = None
+    html_url: Optional[str] = None
+    description: Optional[str] = None
+    private: Optional[bool] = False
+    language: Optional[str] = None
+    default_branch: Optional[str] = "main"
+
+
+class CheckoutRequest(RepoRef):
+    """Body for branch checkout"""
+    branch_name: NonEmptyStr
+
+
+BodyT = TypeVar("BodyT", bound=BaseModel)
+
+
+# Clone admission control: at most CLONE_CONCURRENCY clones run at once and
+# at most CLONE_QUEUE_LIMIT wait for a slot; beyond that requests get 429
+# instead of piling up git processes and network bandwidth.
+CLONE_CONCURRENCY = int(os.getenv("CLONE_CONCURRENCY", "4"))
+CLONE_QUEUE_LIMIT = int(os.getenv("CLONE_QUEUE_LIMIT", "16"))
+_clone_sem = asyncio.Semaphore(CLONE_CONCURRENCY)
+_clone_waiting = 0
+
+
+def _clone_saturated() -> bool:
+    """True if all clone slots are busy and the wait queue is full"""
+    return _clone_sem.locked() and _clone_waiting >= CLONE_QUEUE_LIMIT
+
+
+def _clone_busy_response() -> Response:
+    """429 response for a saturated clone gate"""
+    return Response(
+        status_code=429,
+        content=_CLONE_BUSY_BODY,
+        media_type="application/json",
+        headers={"Retry-After": "5"},
+    )
+
+
+@asynccontextmanager
+async def _clone_slot():
+    """Hold one clone slot for the duration of the block"""
+    global _clone_waiting
+    _clone_waiting += 1
+    try:
+        await _clone_sem.acquire()
+    finally:
+        _clone_waiting -= 1
+    try:
+        yield
+    finally:
+        _clone_sem.release()
+
+
+async def parse_body(request: Request, model: Type[BodyT], limit: int = GIT_BODY_LIMIT) -> Optional[BodyT]:
+    """
+    Decode and validate a JSON request body.
+
+    Returns:
+        The parsed model, or None if the body is malformed or missing required fields
+
+    Raises:
+        BodyTooLarge: Body exceeds `limit` bytes
+    """
+    raw_body = await read_body(request, limit)
+    try:
+        return model.model_validate_json(raw_body)
+    except ValidationError:
+        return None
+
+
 # Import page operations for branch pages (using legacy wrappers that accept login/repo_name)
 from page_ops import (
     create_branch_page_by_login as create_branch_page,
@@ -517,22 +878,24 @@ async def api_clone_repo(request: Request):
     
     Storage Path: /repos/{user_id}/{repo_name}/
     """
+    body = await parse_body(request, CloneRequest)
+    if body is None:
+        return Response(content=_MISSING_FIELDS_BODY, media_type="application/json")
+    user_id = body.user_id
+    repo_name = body.repo_name
+    
+    # Get access_token from cookie instead of body
+    access_token = get_token(request)
+    if not access_token:
+        return Response(content=_NOT_AUTHENTICATED_BODY, media_type="application/json")
+    if _clone_saturated():
+        return _clone_busy_response()
+    
     try:
-        body = await request.json()
-        clone_url = body.get("clone_url")
-        user_id = body.get("user_id")
-        repo_name = body.get("repo_name")
-        
-        # Get access_token from cookie instead of body
-        access_token = get_token(request)
-        
-        if not all([clone_url, user_id, repo_name]):
-            return {"status": "error", "message": "Missing required fields"}
-        if not access_token:
-            return {"status": "error", "message": "Not authenticated"}
-        
-        # Performance: Use to_thread for blocking Git operations
-        result = await asyncio.to_thread(clone_repo, clone_url, access_token, str(user_id), repo_name)
+        # Performance: git runs as an asyncio subprocess, no thread pool slot held
+        async with _clone_slot():
+            result = await clone_repo_async(body.clone_url, access_token, user_id, repo_name)
+        _invalidate_clone_status(user_id, repo_name)
         
         # Register repository in database after successful clone
         if result.get("status") == "success":
@@ -543,15 +906,15 @@ async def api_clone_repo(request: Request):
                 if db_user:
                     await repo_ops.ensure_repo(
                         user_id=db_user["id"],
-                        github_repo_id=body.get("github_repo_id", 0),
+                        github_repo_id=body.github_repo_id,
                         name=repo_name,
-                        full_name=body.get("full_name", f"{db_user['login']}/{repo_name}"),
-                        clone_url=clone_url,
-                        html_url=body.get("html_url"),
-                        description=body.get("description"),
-                        private=body.get("private", False),
-                        language=body.get("language"),
-                        default_branch=body.get("default_branch", "main"),
+                        full_name=body.full_name or f"{db_user['login']}/{repo_name}",
+                        clone_url=body.clone_url,
+                        html_url=body.html_url,
+                        description=body.description,
+                        private=body.private,
+                        language=body.language,
+                        default_branch=body.default_branch,
                     )
                     logger.info(f"Repository registered in database: {repo_name}")
             except Exception as e:
@@ -560,7 +923,8 @@ async def api_clone_repo(request: Request):
         
         return result
     except Exception as e:
-        return {"status": "error", "message": str(e)}
+        logger.exception(f"[Internal] Clone failed for {repo_name}: {e}")
+        return {"status": "error", "message": "Clone failed. Please try again."}
 
 
 @app.post("/api/git/reclone")
@@ -575,24 +939,26 @@ async def api_reclone_repo(request: Request):
         - user_id: User ID
         - repo_name: Repository name
     """
+    body = await parse_body(request, CloneRequest)
+    if body is None:
+        return Response(content=_MISSING_FIELDS_BODY, media_type="application/json")
+    
+    # Get access_token from cookie instead of body
+    access_token = get_token(request)
+    if not access_token:
+        return Response(content=_NOT_AUTHENTICATED_BODY, media_type="application/json")
+    
+    if _clone_saturated():
+        return _clone_busy_response()
+    
     try:
-        body = await request.json()
-        clone_url = body.get("clone_url")
-        user_id = body.get("user_id")
-        repo_name = body.get("repo_name")
-        
-        # Get access_token from cookie instead of body
-        access_token = get_token(request)
-        
-        if not all([clone_url, user_id, repo_name]):
-            return {"status": "error", "message": "Missing required fields"}
-        if not access_token:
-            return {"status": "error", "message": "Not authenticated"}
-        
-        result = await asyncio.to_thread(reclone_repo, clone_url, access_token, str(user_id), repo_name)
+        async with _clone_slot():
+            result = await reclone_repo_async(body.clone_url, access_token, body.user_id, body.repo_name)
+        _invalidate_clone_status(body.user_id, body.repo_name)
         return result
     except Exception as e:
-        return {"status": "error", "message": str(e)}
+        logger.exception(f"[Internal] Reclone failed for {body.repo_name}: {e}")
+        return {"status": "error", "message": "Reclone failed. Please try again."}
 
 
 @app.post("/api/git/pull")
@@ -604,19 +970,16 @@ async def api_pull_repo(request: Request):
         - user_id: User ID
         - repo_name: Repository name
     """
+    body = await parse_body(request, RepoRef)
+    if body is None:
+        return Response(content=_MISSING_FIELDS_BODY, media_type="application/json")
+    
     try:
-        body = await request.json()
-        user_id = body.get("user_id")
-        repo_name = body.get("repo_name")
-        
-        if not all([user_id, repo_name]):
-            return {"status": "error", "message": "Missing required fields"}
-        
-        # Performance: Use to_thread for blocking Git operations
-        result = await asyncio.to_thread(pull_repo, str(user_id), repo_name)
-        return result
+        # Performance: git runs as an asyncio subprocess, no thread pool slot held
+        return await pull_repo_async(body.user_id, body.repo_name)
     except Exception as e:
-        return {"status": "error", "message": str(e)}
+        logger.exception(f"[Internal] Pull failed for {body.repo_name}: {e}")
+        return {"status": "error", "message": "Pull failed. Please try again."}
 
 
 @app.get("/api/git/files")
@@ -656,10 +1019,31 @@ async def api_read_file(user_id: str, repo_name: str, path: str):
     return result
 
 
+# The frontend polls /api/git/status while a clone runs; cache the filesystem
+# check briefly (negative results shorter) and drop the entry whenever
+# clone/reclone/delete changes the answer.
+CLONE_STATUS_TTL = 2.0
+CLONE_STATUS_NEGATIVE_TTL = 0.5
+_clone_status_cache: TLRUCache = TLRUCache(
+    maxsize=4096,
+    ttu=lambda key, cloned, now: now + (CLONE_STATUS_TTL if cloned else CLONE_STATUS_NEGATIVE_TTL),
+    timer=time.monotonic,
+)
+
+
+def _invalidate_clone_status(user_id: str, repo_name: str) -> None:
+    """Forget the cached is_cloned result for a repository"""
+    _clone_status_cache.pop((user_id, repo_name), None)
+
+
 @app.get("/api/git/status")
 async def api_repo_status(user_id: str, repo_name: str):
     """Check if a repository is cloned"""
-    cloned = await asyncio.to_thread(is_cloned, user_id, repo_name)
+    key = (user_id, repo_name)
+    cloned = _clone_status_cache.get(key)
+    if cloned is None:
+        cloned = await asyncio.to_thread(is_cloned, user_id, repo_name)
+        _clone_status_cache[key] = cloned
     return {
         "cloned": cloned
     }
@@ -674,19 +1058,18 @@ async def api_delete_repo(request: Request):
         - user_id: User ID
         - repo_name: Repository name
     """
+    body = await parse_body(request, RepoRef)
+    if body is None:
+        return Response(content=_MISSING_FIELDS_BODY, media_type="application/json")
+    
     try:
-        body = await request.json()
-        user_id = body.get("user_id")
-        repo_name = body.get("repo_name")
-        
-        if not all([user_id, repo_name]):
-            return {"status": "error", "message": "Missing required fields"}
-        
         # Performance: Use to_thread for blocking Git operations
-        result = await asyncio.to_thread(delete_repo, str(user_id), repo_name)
+        result = await asyncio.to_thread(delete_repo, body.user_id, body.repo_name)
+        _invalidate_clone_status(body.user_id, body.repo_name)
         return result
     except Exception as e:
-        return {"status": "error", "message": str(e)}
+        logger.exception(f"[Internal] Delete failed for {body.repo_name}: {e}")
+        return {"status": "error", "message": "Delete failed. Please try again."}
 
 
 @app.get("/api/git/search")
@@ -710,8 +1093,8 @@ async def api_search_files(
     if not query or len(query) < 2:
         return {"status": "error", "message": "Query must be at least 2 characters", "results": []}
     
-    # Performance: Use to_thread for blocking Git operations
-    result = await asyncio.to_thread(search_files, user_id, repo_name, query, content, min(max_results, 100))
+    # Performance: CPU-bound matching runs in the git process pool
+    result = await run_git_work(search_files, user_id, repo_name, query, content, min(max_results, 100))
     return result
 
 
@@ -731,8 +1114,8 @@ async def api_get_commits(
         - branch: Branch name (optional, defaults to current branch)
         - max_count: Maximum commit count (max: 100)
     """
-    # Performance: Use to_thread for blocking Git operations
-    result = await asyncio.to_thread(get_commits, user_id, repo_name, branch, min(max_count, 100))
+    # Performance: CPU-bound history walk runs in the git process pool
+    result = await run_git_work(get_commits, user_id, repo_name, branch, min(max_count, 100))
     return result
 
 
@@ -753,6 +1136,63 @@ async def api_get_branches(
     return result
 
 
+# Per-repo cap on concurrent blocking git calls, so bursts of overview
+# requests for one repository can't monopolize the default thread pool.
+# Keys come from query params, so the map is bounded and idle entries expire
+# (an evicted semaphore only loosens the cap briefly for that repository)
+REPO_GIT_CONCURRENCY = 3
+_repo_semaphores: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
+
+async def _run_repo_op(user_id: str, repo_name: str, func, *args, process_pool: bool = False):
+    """
+    Run a blocking git_ops function off the event loop, bounded per repository.
+
+    CPU-bound calls (process_pool=True) go through run_git_work, like their
+    dedicated endpoints; the rest run in the default thread pool.
+    """
+    sem = _repo_semaphores.setdefault((user_id, repo_name), asyncio.Semaphore(REPO_GIT_CONCURRENCY))
+    async with sem:
+        if process_pool:
+            return await run_git_work(func, user_id, repo_name, *args)
+        return await asyncio.to_thread(func, user_id, repo_name, *args)
+
+
+@app.get("/api/git/overview")
+async def api_repo_overview(
+    user_id: str,
+    repo_name: str,
+    max_count: int = 50
+):
+    """
+    Get root file listing, commit history and branches in one request
+    
+    The three lookups are independent, so they run concurrently; the
+    repository view needs all of them on open.
+    
+    Query Params:
+        - user_id: User ID
+        - repo_name: Repository name
+        - max_count: Maximum commit count (max: 100)
+    
+    Returns:
+        - files: Same as /api/git/files (root path)
+        - commits: Same as /api/git/commits (current branch)
+        - branches: Same as /api/git/branches
+    """
+    files, commits, branches = await asyncio.gather(
+        _run_repo_op(user_id, repo_name, list_files, ""),
+        _run_repo_op(user_id, repo_name, get_commits, None, min(max_count, 100), process_pool=True),
+        _run_repo_op(user_id, repo_name, get_branches),
+    )
+    return {
+        "status": "success",
+        "files": files,
+        "commits": commits,
+        "branches": branches
+    }
+
+
 @app.post("/api/git/checkout")
 async def api_checkout_branch(request: Request):
     """
@@ -763,28 +1203,29 @@ async def api_checkout_branch(request: Request):
         - repo_name: Repository name
         - branch_name: Branch name to checkout
     """
+    body = await parse_body(request, CheckoutRequest)
+    if body is None:
+        return Response(content=_MISSING_FIELDS_BODY, media_type="application/json")
+    user_id = body.user_id
+    repo_name = body.repo_name
+    branch_name = body.branch_name
+    
     try:
-        body = await request.json()
-        user_id = body.get("user_id")
-        repo_name = body.get("repo_name")
-        branch_name = body.get("branch_name")
-        
-        if not all([user_id, repo_name, branch_name]):
-            return {"status": "error", "message": "Missing required fields"}
-        
         # Performance: Use to_thread for blocking Git operations
         result = await asyncio.to_thread(checkout_branch, user_id, repo_name, branch_name)
         
         # Auto-create page for this branch if checkout was successful
         if result.get("status") == "success":
             try:
-                await asyncio.to_thread(ensure_branch_page, user_id, repo_name, branch_name)
+                # page_ops is async (aiomysql): await it on the loop, not in a thread
+                await ensure_branch_page(user_id, repo_name, branch_name)
             except Exception as e:
                 logger.warning(f"Auto-create page failed for {branch_name}: {e}")
         
         return result
     except Exception as e:
-        return {"status": "error", "message": str(e)}
+        logger.exception(f"[Internal] Checkout failed for {repo_name}: {e}")
+        return {"status": "error", "message": "Checkout failed. Please try again."}
 
 
 # ==============================================================================
@@ -793,18 +1234,29 @@ async def api_checkout_branch(request: Request):
 # CRUD operations for branch-specific pages stored in .gition directory
 
 @app.get("/api/pages/{user_id}/{repo_name}")
-async def api_list_pages(request: Request, user_id: str, repo_name: str):
+async def api_list_pages(
+    request: Request,
+    user_id: str,
+    repo_name: str,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+):
     """
-    List all branch pages for a repository
+    List branch pages for a repository, most recently updated first
     
     Path Params:
         - user_id: User's GitHub ID
         - repo_name: Repository name
     
+    Query Params:
+        - limit: Page size (optional; all pages when omitted, max 500)
+        - cursor: next_cursor from the previous response
+    
     Returns:
         - status: success | error
         - pages: List of page summaries
-        - total: Total count
+        - total: Number of pages returned
+        - next_cursor: Cursor for the next page (only with limit; null on the last page)
     """
     # Auth check
     token = get_token(request)
@@ -812,7 +1264,7 @@ async def api_list_pages(request: Request, user_id: str, repo_name: str):
         return {"status": "error", "message": "Not authenticated", "pages": [], "total": 0}
     
     try:
-        result = await list_branch_pages(user_id, repo_name)
+        result = await list_branch_pages(user_id, repo_name, limit, cursor)
         return result
     except Exception as e:
         logger.exception(f"[Internal] Failed to list pages for {repo_name}: {e}")
@@ -869,10 +1321,11 @@ async def api_create_page(request: Request, user_id: str, repo_name: str, branch
     if not token:
         return {"status": "error", "message": "Not authenticated", "page": None}
     
+    raw_body = await read_body(request, PAGE_BODY_LIMIT)
     try:
         body = {}
         try:
-            body = await request.json()
+            body = orjson.loads(raw_body)
         except Exception:
             pass  # Body is optional
         
@@ -909,8 +1362,9 @@ async def api_update_page(request: Request, user_id: str, repo_name: str, branch
     if not token:
         return {"status": "error", "message": "Not authenticated", "page": None}
     
+    raw_body = await read_body(request, PAGE_BODY_LIMIT)
     try:
-        body = await request.json()
+        body = orjson.loads(raw_body)
         title = body.get("title")
         content = body.get("content")
         
@@ -957,6 +1411,131 @@ async def api_delete_page(request: Request, user_id: str, repo_name: str, branch
 # Fetch Issues/PRs info by directly calling GitHub API
 # Works without cloning the repository
 
+# Fixed-schema field projections (see _REPO_FIELDS)
+_ISSUE_FIELDS = ("id", "number", "title", "state", "comments", "created_at", "updated_at", "html_url")
+_PULL_FIELDS = ("id", "number", "title", "state", "created_at", "updated_at", "html_url")
+_USER_FIELDS = ("login", "avatar_url")
+_LABEL_FIELDS = ("name", "color")
+_get_issue_fields = itemgetter(*_ISSUE_FIELDS)
+_get_pull_fields = itemgetter(*_PULL_FIELDS)
+_get_user_fields = itemgetter(*_USER_FIELDS)
+_get_label_fields = itemgetter(*_LABEL_FIELDS)
+
+
+def _project_issue(issue: dict) -> dict:
+    """Extract the fields the frontend uses from a GitHub issue"""
+    result = dict(zip(_ISSUE_FIELDS, _get_issue_fields(issue)))
+    result["user"] = dict(zip(_USER_FIELDS, _get_user_fields(issue["user"])))
+    result["labels"] = [
+        dict(zip(_LABEL_FIELDS, _get_label_fields(label)))
+        for label in issue.get("labels", [])
+    ]
+    return result
+
+
+def _project_pull(pr: dict) -> dict:
+    """Extract the fields the frontend uses from a GitHub pull request"""
+    result = dict(zip(_PULL_FIELDS, _get_pull_fields(pr)))
+    result["user"] = dict(zip(_USER_FIELDS, _get_user_fields(pr["user"])))
+    result["head"] = {
+        "ref": pr["head"]["ref"],       # Source branch
+        "sha": pr["head"]["sha"][:7]    # Commit SHA (abbreviated)
+    }
+    result["base"] = {
+        "ref": pr["base"]["ref"]        # Target branch
+    }
+    result["draft"] = pr.get("draft", False)
+    result["mergeable_state"] = pr.get("mergeable_state")
+    return result
+
+
+async def _fetch_issues_body(token: str, owner: str, repo: str, state: str) -> bytes:
+    """
+    Fetch and project a repository's issues.
+
+    Returns:
+        bytes: Serialized /api/github/issues response body (success or error)
+    """
+    try:
+        response, cached_body, etag_key = await github_client.conditional_get(
+            f"https://api.github.com/repos/{owner}/{repo}/issues",
+            token,
+            params={
+                "state": state,
+                "per_page": 50,
+                "sort": "updated",
+                "direction": "desc"
+            }
+        )
+
+        # 304 Not Modified: replay the previously built response
+        if cached_body is not None:
+            return cached_body
+
+        if response.status_code != 200:
+            return orjson.dumps({"status": "error", "message": "Failed to fetch issues", "issues": []})
+        
+        issues_data = orjson.loads(response.content)
+        
+        # Filter out PRs (they appear in issues endpoint too)
+        issues = [
+            _project_issue(issue)
+            for issue in issues_data
+            if "pull_request" not in issue  # Exclude PRs
+        ]
+        
+        body = orjson.dumps({
+            "status": "success",
+            "total": len(issues),
+            "issues": issues
+        })
+        github_client.store_etag(etag_key, response, body)
+        return body
+    except Exception as e:
+        return orjson.dumps({"status": "error", "message": str(e), "issues": []})
+
+
+async def _fetch_pulls_body(token: str, owner: str, repo: str, state: str) -> bytes:
+    """
+    Fetch and project a repository's pull requests.
+
+    Returns:
+        bytes: Serialized /api/github/pulls response body (success or error)
+    """
+    try:
+        response, cached_body, etag_key = await github_client.conditional_get(
+            f"https://api.github.com/repos/{owner}/{repo}/pulls",
+            token,
+            params={
+                "state": state,
+                "per_page": 50,
+                "sort": "updated",
+                "direction": "desc"
+            }
+        )
+
+        # 304 Not Modified: replay the previously built response
+        if cached_body is not None:
+            return cached_body
+
+        if response.status_code != 200:
+            return orjson.dumps({"status": "error", "message": "Failed to fetch pull requests", "pulls": []})
+        
+        pulls_data = orjson.loads(response.content)
+        
+        pulls = [_project_pull(pr) for pr in pulls_data]
+        
+        body = orjson.dumps({
+            "status": "success",
+            "total": len(pulls),
+            "pulls": pulls
+        })
+        github_client.store_etag(etag_key, response, body)
+        return body
+    except Exception as e:
+        return orjson.dumps({"status": "error", "message": str(e), "pulls": []})
+
+
 @app.get("/api/github/issues")
 async def api_get_issues(request: Request, owner: str, repo: str, state: str = "open"):
     """
@@ -974,58 +1553,10 @@ async def api_get_issues(request: Request, owner: str, repo: str, state: str = "
     """
     token = get_token(request)
     if not token:
-        return {"status": "error", "message": "No authorization token", "issues": []}
+        return Response(content=_ISSUES_NO_TOKEN_BODY, media_type="application/json")
     
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/issues",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github.v3+json",
-                    "User-Agent": "gition-auth-server",
-                },
-                params={
-                    "state": state,
-                    "per_page": 50,
-                    "sort": "updated",
-                    "direction": "desc"
-                }
-            )
-        
-        if response.status_code != 200:
-            return {"status": "error", "message": "Failed to fetch issues", "issues": []}
-        
-        issues_data = response.json()
-        
-        # Filter out PRs (they appear in issues endpoint too)
-        issues = [
-            {
-                "id": issue["id"],
-                "number": issue["number"],
-                "title": issue["title"],
-                "state": issue["state"],
-                "user": {
-                    "login": issue["user"]["login"],
-                    "avatar_url": issue["user"]["avatar_url"]
-                },
-                "labels": [{"name": l["name"], "color": l["color"]} for l in issue.get("labels", [])],
-                "comments": issue["comments"],
-                "created_at": issue["created_at"],
-                "updated_at": issue["updated_at"],
-                "html_url": issue["html_url"]
-            }
-            for issue in issues_data
-            if "pull_request" not in issue  # Exclude PRs
-        ]
-        
-        return {
-            "status": "success",
-            "total": len(issues),
-            "issues": issues
-        }
-    except Exception as e:
-        return {"status": "error", "message": str(e), "issues": []}
+    body = await _fetch_issues_body(token, owner, repo, state)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/github/pulls")
@@ -1043,63 +1574,60 @@ async def api_get_pulls(request: Request, owner: str, repo: str, state: str = "o
     """
     token = get_token(request)
     if not token:
-        return {"status": "error", "message": "No authorization token", "pulls": []}
+        return Response(content=_PULLS_NO_TOKEN_BODY, media_type="application/json")
     
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"https://api.github.com/repos/{owner}/{repo}/pulls",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Accept": "application/vnd.github.v3+json",
-                    "User-Agent": "gition-auth-server",
-                },
-                params={
-                    "state": state,
-                    "per_page": 50,
-                    "sort": "updated",
-                    "direction": "desc"
-                }
-            )
-        
-        if response.status_code != 200:
-            return {"status": "error", "message": "Failed to fetch pull requests", "pulls": []}
-        
-        pulls_data = response.json()
-        
-        pulls = [
-            {
-                "id": pr["id"],
-                "number": pr["number"],
-                "title": pr["title"],
-                "state": pr["state"],
-                "user": {
-                    "login": pr["user"]["login"],
-                    "avatar_url": pr["user"]["avatar_url"]
-                },
-                "head": {
-                    "ref": pr["head"]["ref"],       # Source branch
-                    "sha": pr["head"]["sha"][:7]    # Commit SHA (abbreviated)
-                },
-                "base": {
-                    "ref": pr["base"]["ref"]        # Target branch
-                },
-                "draft": pr.get("draft", False),
-                "mergeable_state": pr.get("mergeable_state"),
-                "created_at": pr["created_at"],
-                "updated_at": pr["updated_at"],
-                "html_url": pr["html_url"]
-            }
-            for pr in pulls_data
-        ]
-        
-        return {
-            "status": "success",
-            "total": len(pulls),
-            "pulls": pulls
-        }
-    except Exception as e:
-        return {"status": "error", "message": str(e), "pulls": []}
+    body = await _fetch_pulls_body(token, owner, repo, state)
+    return Response(content=body, media_type="application/json")
+
+
+def _is_success_body(body: bytes) -> bool:
+    """
+    Check a serialized issues/pulls body for status "success" without parsing it.
+
+    Every such body is built by orjson.dumps from a dict whose first key
+    is "status", so the prefix is exact.
+    """
+    return body.startswith(b'{"status":"success"')
+
+
+@app.get("/api/github/activity")
+async def api_get_activity(request: Request, owner: str, repo: str, state: str = "open"):
+    """
+    Get issues and pull requests for a GitHub repository in one call
+    
+    Both GitHub requests run concurrently and are multiplexed over the
+    shared HTTP/2 connection, so a dashboard pays one round-trip instead of two.
+    
+    Query Params:
+        - owner: Repository owner
+        - repo: Repository name
+        - state: Issue/PR state (open, closed, all)
+    
+    Headers:
+        Authorization: Bearer <access_token>
+    
+    Returns:
+        status: "error" if both lookups failed, else "success"
+        partial: True if exactly one of the lookups failed
+        issues / pulls: The /api/github/issues and /api/github/pulls responses
+    """
+    token = get_token(request)
+    if not token:
+        return Response(content=_ACTIVITY_NO_TOKEN_BODY, media_type="application/json")
+    
+    issues_body, pulls_body = await asyncio.gather(
+        _fetch_issues_body(token, owner, repo, state),
+        _fetch_pulls_body(token, owner, repo, state),
+    )
+    succeeded = _is_success_body(issues_body) + _is_success_body(pulls_body)
+    # Fragment embeds the already-serialized bodies without re-parsing them
+    body = orjson.dumps({
+        "status": "success" if succeeded else "error",
+        "partial": succeeded == 1,
+        "issues": orjson.Fragment(issues_body),
+        "pulls": orjson.Fragment(pulls_body)
+    })
+    return Response(content=body, media_type="application/json")
 
 
 # ==============================================================================
@@ -14,6 +14,14 @@ Main Features:
 
 Data Storage:
     Pages are stored in: branch_pages table
+
+Caching:
+    Full list_branch_pages summaries are cached per repository for
+    PAGE_LIST_CACHE_TTL seconds (default: 30) and dropped on every
+    create/update/delete through this module
+    login/repo_name -> internal ID resolution is cached for
+    PAGE_RESOLVE_CACHE_TTL seconds (default: 60) and dropped per user by
+    repo_ops.sync_user_repos, since a sync may rename or re-create repositories
     
 Data Structure:
     {
@@ -33,17 +41,22 @@ Data Structure:
 ==============================================================================
 """
 
-import json
 import uuid
 import os
+import time
+import asyncio
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
+from aiomysql import IntegrityError
+from cachetools import TTLCache
+
 import database
-import user_ops
 import repo_ops
+from single_flight import single_flight
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -51,6 +64,50 @@ logger = logging.getLogger(__name__)
 # Base path for cloned repositories
 REPOS_BASE_PATH = os.getenv("REPOS_PATH", "/repos")
 
+# MySQL error code for a unique key violation
+ER_DUP_ENTRY = 1062
+
+# (login, repo_name) -> (user_id, repo_id); IDs never change for a row, so
+# the TTL only bounds how long a deleted/renamed repository keeps resolving
+RESOLVE_CACHE_TTL = int(os.getenv("PAGE_RESOLVE_CACHE_TTL", "60"))
+_resolve_cache: TTLCache = TTLCache(maxsize=10000, ttl=RESOLVE_CACHE_TTL)
+_resolve_inflight: Dict[tuple, asyncio.Future] = {}
+
+# (user_id, repo_id) -> page summaries, newest first
+PAGE_LIST_CACHE_TTL = int(os.getenv("PAGE_LIST_CACHE_TTL", "30"))
+_page_list_cache: TTLCache = TTLCache(maxsize=1024, ttl=PAGE_LIST_CACHE_TTL)
+
+# Upper bound for one paged list_branch_pages call
+PAGE_LIST_MAX_LIMIT = 500
+
+# (user_id, repo_id, branch_name, with_body) -> pending ensure_branch_page result
+_ensure_inflight: Dict[tuple, asyncio.Future] = {}
+
+# Full row of one branch page (the payload returned to callers)
+_SELECT_PAGE = """SELECT * FROM branch_pages 
+                  WHERE user_id = %s AND repo_id = %s AND branch_name = %s"""
+# Existence check for one branch page (unique key lookup, no content)
+_SELECT_PAGE_ID = """SELECT id FROM branch_pages 
+                     WHERE user_id = %s AND repo_id = %s AND branch_name = %s"""
+
+# UPDATE statement per (title given, content given), so update_branch_page
+# does no SQL string building per call
+_PAGE_WHERE = "WHERE user_id = %s AND repo_id = %s AND branch_name = %s"
+_UPDATE_PAGE_SQL = {
+    (True, False): f"UPDATE branch_pages SET title = %s {_PAGE_WHERE}",
+    (False, True): f"UPDATE branch_pages SET content = %s {_PAGE_WHERE}",
+    (True, True): f"UPDATE branch_pages SET title = %s, content = %s {_PAGE_WHERE}",
+}
+
+# Row columns converted to ISO strings by _row_to_page
+_DATETIME_KEYS = ("created_at", "updated_at")
+
+# Metadata stored with every newly created page (serialized once)
+_NEW_PAGE_METADATA = orjson.dumps({
+    "created_from_branch": True,
+    "branch_exists": True
+}).decode()
+
 
 async def _resolve_ids(
     user_login: str,
@@ -62,6 +119,9 @@ async def _resolve_ids(
     If repository exists on filesystem but not in database,
     automatically creates a minimal database entry.
     
+    Concurrent calls for the same pair share one lookup (the editor
+    typically requests a page and the page list for a repo together).
+    
     Args:
         user_login: GitHub login (username)
         repo_name: Repository name
@@ -69,22 +129,57 @@ async def _resolve_ids(
     Returns:
         Tuple of (user_id, repo_id) or (None, None) if not found
     """
-    user_id = await user_ops.get_user_id_by_login(user_login)
-    if not user_id:
+    key = (user_login, repo_name)
+    cached = _resolve_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    ids = await single_flight(
+        _resolve_inflight, key, lambda: _lookup_ids(user_login, repo_name)
+    )
+    
+    # Only complete mappings are cached, so a repo registered later is seen at once
+    if ids[1]:
+        _resolve_cache[key] = ids
+    return ids
+
+
+async def _lookup_ids(
+    user_login: str,
+    repo_name: str
+) -> tuple[Optional[int], Optional[int]]:
+    """Query (and if needed auto-register) the IDs for _resolve_ids"""
+    # One round-trip instead of a user lookup followed by a repo lookup
+    row = await database.fetchone(
+        """SELECT u.id AS user_id, r.id AS repo_id
+           FROM users u
+           LEFT JOIN repositories r ON r.user_id = u.id AND r.name = %s
+           WHERE u.login = %s
+           LIMIT 1""",
+        (repo_name, user_login)
+    )
+    if not row:
         return None, None
     
-    repo_id = await repo_ops.get_repo_id(user_id, repo_name)
+    user_id = row["user_id"]
+    repo_id = row["repo_id"]
     
     # Fallback: Check if repo exists on filesystem and auto-register
     if not repo_id:
         repo_path = Path(REPOS_BASE_PATH) / user_login / repo_name
-        if repo_path.exists() and repo_path.is_dir():
-            logger.info(f"Auto-registering cloned repo: {user_login}/{repo_name}")
+        if await asyncio.to_thread(repo_path.is_dir):
+            logger.info("Auto-registering cloned repo: %s/%s", user_login, repo_name)
             repo_id = await repo_ops.ensure_repo_minimal(user_id, user_login, repo_name)
     
     return user_id, repo_id
 
 
+def invalidate_resolved_ids(user_id: int) -> None:
+    """Drop a user's cached login/repo_name -> ID resolutions"""
+    for key in [key for key, ids in _resolve_cache.items() if ids[0] == user_id]:
+        _resolve_cache.pop(key, None)
+
+
 async def create_branch_page(
     user_id: int,
     repo_id: int,
@@ -109,40 +204,34 @@ async def create_branch_page(
             - message: Status message
     """
     try:
-        # Check if page already exists
-        existing = await database.fetchone(
-            """SELECT * FROM branch_pages 
-               WHERE user_id = %s AND repo_id = %s AND branch_name = %s""",
-            (user_id, repo_id, branch_name)
-        )
-        
-        if existing:
+        # Insert directly and let the (user_id, repo_id, branch_name) unique key
+        # decide: no check-then-insert window for a concurrent create to race
+        page_id = _new_page_id()
+        try:
+            # INSERT and re-read share one connection and one commit
+            async with database.transaction() as cur:
+                await cur.execute(
+                    """INSERT INTO branch_pages 
+                       (id, user_id, repo_id, branch_name, title, content, metadata)
+                       VALUES (%s, %s, %s, %s, %s, %s, %s)""",
+                    (page_id, user_id, repo_id, branch_name, title or branch_name, content, _NEW_PAGE_METADATA)
+                )
+                await cur.execute(
+                    "SELECT * FROM branch_pages WHERE id = %s", (page_id,)
+                )
+                page = await cur.fetchone()
+        except IntegrityError as e:
+            if e.args[0] != ER_DUP_ENTRY:
+                raise
+            existing = await _fetch_page_row(user_id, repo_id, branch_name)
             return {
                 "status": "exists",
                 "message": f"Page for branch '{branch_name}' already exists",
                 "page": _row_to_page(existing)
             }
+        _page_list_cache.pop((user_id, repo_id), None)
         
-        # Create page
-        page_id = str(uuid.uuid4())
-        metadata = json.dumps({
-            "created_from_branch": True,
-            "branch_exists": True
-        })
-        
-        await database.execute(
-            """INSERT INTO branch_pages 
-               (id, user_id, repo_id, branch_name, title, content, metadata)
-               VALUES (%s, %s, %s, %s, %s, %s, %s)""",
-            (page_id, user_id, repo_id, branch_name, title or branch_name, content, metadata)
-        )
-        
-        # Fetch created page
-        page = await database.fetchone(
-            "SELECT * FROM branch_pages WHERE id = %s", (page_id,)
-        )
-        
-        logger.info(f"Created page for branch '{branch_name}' (id={page_id})")
+        logger.info("Created page for branch '%s' (id=%s)", branch_name, page_id)
         
         return {
             "status": "success",
@@ -151,7 +240,7 @@ async def create_branch_page(
         }
         
     except Exception as e:
-        logger.exception(f"Failed to create page for branch '{branch_name}': {e}")
+        logger.exception("Failed to create page for branch '%s': %s", branch_name, e)
         return {
             "status": "error",
             "message": str(e),
@@ -199,7 +288,7 @@ async def get_branch_page(
         }
         
     except Exception as e:
-        logger.exception(f"Failed to get page for branch '{branch_name}': {e}")
+        logger.exception("Failed to get page for branch '%s': %s", branch_name, e)
         return {
             "status": "error",
             "message": str(e),
@@ -212,7 +301,8 @@ async def update_branch_page(
     repo_id: int,
     branch_name: str,
     title: Optional[str] = None,
-    content: Optional[str] = None
+    content: Optional[str] = None,
+    return_page: bool = True
 ) -> Dict[str, Any]:
     """
     Update a branch page.
@@ -223,6 +313,8 @@ async def update_branch_page(
         branch_name: Branch name
         title: New title (optional)
         content: New content (optional)
+        return_page: Re-read the updated page for the response; when False,
+            page is None after a successful change (saves a round-trip)
         
     Returns:
         Dict:
@@ -231,55 +323,34 @@ async def update_branch_page(
             - message: Status message
     """
     try:
-        # Check if page exists
-        existing = await database.fetchone(
-            """SELECT * FROM branch_pages 
-               WHERE user_id = %s AND repo_id = %s AND branch_name = %s""",
-            (user_id, repo_id, branch_name)
-        )
-        
-        if not existing:
-            return {
-                "status": "not_found",
-                "message": f"Page for branch '{branch_name}' not found",
-                "page": None
-            }
-        
-        # Build update query
-        updates = []
-        params = []
-        
-        if title is not None:
-            updates.append("title = %s")
-            params.append(title)
-        if content is not None:
-            updates.append("content = %s")
-            params.append(content)
-        
-        if not updates:
+        query = _UPDATE_PAGE_SQL.get((title is not None, content is not None))
+        if query is None:
+            existing = await _fetch_page_row(user_id, repo_id, branch_name)
+            if not existing:
+                return _page_not_found(branch_name)
             return {
                 "status": "success",
                 "message": "No changes made",
                 "page": _row_to_page(existing)
             }
         
-        # Add WHERE clause params
-        params.extend([user_id, repo_id, branch_name])
+        params = tuple(v for v in (title, content) if v is not None) + (user_id, repo_id, branch_name)
         
-        await database.execute(
-            f"""UPDATE branch_pages SET {', '.join(updates)}
-                WHERE user_id = %s AND repo_id = %s AND branch_name = %s""",
-            tuple(params)
-        )
-        
-        # Fetch updated page
-        page = await database.fetchone(
-            """SELECT * FROM branch_pages 
-               WHERE user_id = %s AND repo_id = %s AND branch_name = %s""",
-            (user_id, repo_id, branch_name)
-        )
+        # No existence pre-check: the UPDATE's affected row count tells us.
+        # UPDATE and re-read share one connection and one commit.
+        page = None
+        async with database.transaction() as cur:
+            changed = await cur.execute(query, params)
+            # 0 rows: either no such page or the values were already current
+            if return_page or not changed:
+                await cur.execute(_SELECT_PAGE, (user_id, repo_id, branch_name))
+                page = await cur.fetchone()
         
-        logger.info(f"Updated page for branch '{branch_name}'")
+        if changed:
+            _page_list_cache.pop((user_id, repo_id), None)
+            logger.info("Updated page for branch '%s'", branch_name)
+        elif not page:
+            return _page_not_found(branch_name)
         
         return {
             "status": "success",
@@ -288,7 +359,7 @@ async def update_branch_page(
         }
         
     except Exception as e:
-        logger.exception(f"Failed to update page for branch '{branch_name}': {e}")
+        logger.exception("Failed to update page for branch '%s': %s", branch_name, e)
         return {
             "status": "error",
             "message": str(e),
@@ -296,37 +367,72 @@ async def update_branch_page(
         }
 
 
-async def list_branch_pages(user_id: int, repo_id: int) -> Dict[str, Any]:
+async def _fetch_page_row(user_id: int, repo_id: int, branch_name: str) -> Optional[Dict[str, Any]]:
+    """Fetch a full branch_pages row"""
+    return await database.fetchone(_SELECT_PAGE, (user_id, repo_id, branch_name))
+
+
+def _page_not_found(branch_name: str) -> Dict[str, Any]:
+    """Standard not_found result for a missing branch page"""
+    return {
+        "status": "not_found",
+        "message": f"Page for branch '{branch_name}' not found",
+        "page": None
+    }
+
+
+async def list_branch_pages(
+    user_id: int,
+    repo_id: int,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
     """
-    List all branch pages for a repository.
+    List branch pages for a repository, most recently updated first.
+    
+    Without a limit every page is returned (cached per repository). With a
+    limit the list is paged by keyset on (updated_at, id), so each page is
+    one index range scan no matter how deep the client has paged.
     
     Args:
         user_id: Internal user ID
         repo_id: Internal repository ID
+        limit: Maximum pages to return (capped at PAGE_LIST_MAX_LIMIT)
+        cursor: next_cursor from the previous call
         
     Returns:
         Dict:
             - status: "success" | "error"
             - pages: List of page summaries
-            - total: Total count
+            - total: Number of pages returned
+            - next_cursor: Cursor for the following call, None on the
+              last page (only when limit is given)
     """
     try:
-        pages = await database.fetchall(
-            """SELECT id, branch_name, title, created_at, updated_at
-               FROM branch_pages 
-               WHERE user_id = %s AND repo_id = %s
-               ORDER BY updated_at DESC""",
-            (user_id, repo_id)
-        )
+        if limit is not None:
+            return await _list_branch_pages_after(user_id, repo_id, limit, cursor)
+        
+        key = (user_id, repo_id)
+        pages = _page_list_cache.get(key)
+        if pages is None:
+            rows = await database.fetchall(
+                """SELECT id, branch_name, title, created_at, updated_at
+                   FROM branch_pages 
+                   WHERE user_id = %s AND repo_id = %s
+                   ORDER BY updated_at DESC""",
+                (user_id, repo_id)
+            )
+            pages = [_row_to_page(p) for p in rows]
+            _page_list_cache[key] = pages
         
         return {
             "status": "success",
-            "pages": [_row_to_page(p) for p in pages],
+            "pages": pages,
             "total": len(pages)
         }
         
     except Exception as e:
-        logger.exception(f"Failed to list pages: {e}")
+        logger.exception("Failed to list pages: %s", e)
         return {
             "status": "error",
             "message": str(e),
@@ -335,10 +441,61 @@ async def list_branch_pages(user_id: int, repo_id: int) -> Dict[str, Any]:
         }
 
 
+async def _list_branch_pages_after(
+    user_id: int,
+    repo_id: int,
+    limit: int,
+    cursor: Optional[str]
+) -> Dict[str, Any]:
+    """One keyset page of list_branch_pages (cursor is "updated_at|id")"""
+    limit = max(1, min(limit, PAGE_LIST_MAX_LIMIT))
+    
+    where = "user_id = %s AND repo_id = %s"
+    params: List[Any] = [user_id, repo_id]
+    if cursor:
+        updated_at, sep, page_id = cursor.rpartition("|")
+        if not sep or not updated_at or not page_id:
+            return {
+                "status": "error",
+                "message": "Invalid cursor",
+                "pages": [],
+                "total": 0
+            }
+        # Ties on updated_at (second resolution) are broken by id
+        where += " AND (updated_at < %s OR (updated_at = %s AND id < %s))"
+        params.extend([updated_at, updated_at, page_id])
+    
+    # Fetch one extra row to learn whether another page follows
+    params.append(limit + 1)
+    rows = await database.fetchall(
+        f"""SELECT id, branch_name, title, created_at, updated_at
+            FROM branch_pages 
+            WHERE {where}
+            ORDER BY updated_at DESC, id DESC
+            LIMIT %s""",
+        tuple(params)
+    )
+    
+    has_more = len(rows) > limit
+    pages = [_row_to_page(p) for p in rows[:limit]]
+    next_cursor = None
+    if has_more:
+        last = pages[-1]
+        next_cursor = f"{last['updated_at']}|{last['id']}"
+    
+    return {
+        "status": "success",
+        "pages": pages,
+        "total": len(pages),
+        "next_cursor": next_cursor
+    }
+
+
 async def ensure_branch_page(
     user_id: int,
     repo_id: int,
-    branch_name: str
+    branch_name: str,
+    with_body: bool = False
 ) -> Dict[str, Any]:
     """
     Ensure a page exists for a branch (create if not exists).
@@ -349,33 +506,76 @@ async def ensure_branch_page(
         user_id: Internal user ID
         repo_id: Internal repository ID
         branch_name: Branch name
+        with_body: Load the existing page (including content) when it exists;
+            otherwise only its existence is checked and page is None
         
     Returns:
         Dict:
             - status: "success" | "exists" | "error"
-            - page: Page data
+            - page: Page data (None for an existing page unless with_body)
             - created: True if newly created
     """
-    result = await get_branch_page(user_id, repo_id, branch_name)
-    
-    if result["status"] == "success":
-        return {
-            "status": "exists",
-            "page": result["page"],
-            "created": False
-        }
-    
-    if result["status"] == "not_found":
-        create_result = await create_branch_page(user_id, repo_id, branch_name)
-        if create_result["status"] in ("success", "exists"):
+    # Checkout fan-out (CI, several tabs) often ensures the same page at once:
+    # concurrent identical calls share one INSERT IGNORE (+ SELECT)
+    key = (user_id, repo_id, branch_name, with_body)
+    return await single_flight(
+        _ensure_inflight, key, lambda: _ensure_page(user_id, repo_id, branch_name, with_body)
+    )
+
+
+async def _ensure_page(
+    user_id: int,
+    repo_id: int,
+    branch_name: str,
+    with_body: bool
+) -> Dict[str, Any]:
+    """Create the page if missing and report it (see ensure_branch_page)"""
+    try:
+        # One INSERT IGNORE decides both existence and creation: the
+        # (user_id, repo_id, branch_name) unique key turns a duplicate into a
+        # no-op, so there is no check-then-create window and no extra round-trip
+        page_id = _new_page_id()
+        async with database.transaction() as cur:
+            created = await cur.execute(
+                """INSERT IGNORE INTO branch_pages 
+                   (id, user_id, repo_id, branch_name, title, content, metadata)
+                   VALUES (%s, %s, %s, %s, %s, %s, %s)""",
+                (page_id, user_id, repo_id, branch_name, branch_name, "", _NEW_PAGE_METADATA)
+            ) == 1
+            # IGNORE also downgrades FK errors (unknown or concurrently
+            # deleted user/repo) to warnings, so a skipped insert only means
+            # "exists" once the row is actually found
+            select = _SELECT_PAGE if created or with_body else _SELECT_PAGE_ID
+            await cur.execute(select, (user_id, repo_id, branch_name))
+            row = await cur.fetchone()
+        
+        if row is None:
             return {
-                "status": "success",
-                "page": create_result["page"],
-                "created": create_result["status"] == "success"
+                "status": "error",
+                "message": f"Failed to create page for branch '{branch_name}'",
+                "page": None
             }
-        return create_result
-    
-    return result
+        
+        if created:
+            _page_list_cache.pop((user_id, repo_id), None)
+            logger.info("Created page for branch '%s' (id=%s)", branch_name, page_id)
+        elif not with_body:
+            # Existing page and the caller only needs to know it is there
+            return {
+                "status": "exists",
+                "page": None,
+                "created": False
+            }
+        
+        return {
+            "status": "success" if created else "exists",
+            "page": _row_to_page(row),
+            "created": created
+        }
+        
+    except Exception as e:
+        logger.exception("Failed to ensure page for branch '%s': %s", branch_name, e)
+        return {"status": "error", "message": str(e), "page": None}
 
 
 async def delete_branch_page(
@@ -400,26 +600,21 @@ async def delete_branch_page(
             - message: Status message
     """
     try:
-        # Check if page exists
-        existing = await database.fetchone(
-            """SELECT id FROM branch_pages 
+        # DELETE reports the rows it removed, so no existence SELECT is needed
+        deleted = await database.execute_rowcount(
+            """DELETE FROM branch_pages 
                WHERE user_id = %s AND repo_id = %s AND branch_name = %s""",
             (user_id, repo_id, branch_name)
         )
         
-        if not existing:
+        if not deleted:
             return {
                 "status": "not_found",
                 "message": f"Page for branch '{branch_name}' not found"
             }
+        _page_list_cache.pop((user_id, repo_id), None)
         
-        await database.execute(
-            """DELETE FROM branch_pages 
-               WHERE user_id = %s AND repo_id = %s AND branch_name = %s""",
-            (user_id, repo_id, branch_name)
-        )
-        
-        logger.info(f"Deleted page for branch '{branch_name}'")
+        logger.info("Deleted page for branch '%s'", branch_name)
         
         return {
             "status": "success",
@@ -427,7 +622,7 @@ async def delete_branch_page(
         }
         
     except Exception as e:
-        logger.exception(f"Failed to delete page for branch '{branch_name}': {e}")
+        logger.exception("Failed to delete page for branch '%s': %s", branch_name, e)
         return {
             "status": "error",
             "message": str(e)
@@ -443,24 +638,46 @@ def _row_to_page(row: Dict[str, Any]) -> Dict[str, Any]:
     if not row:
         return None
     
-    page = dict(row)
+    # DictCursor yields a fresh dict per row, so convert it in place
+    page = row
     
     # Convert datetime objects to ISO strings
-    for key in ("created_at", "updated_at"):
-        if key in page and page[key]:
-            if hasattr(page[key], "isoformat"):
-                page[key] = page[key].isoformat()
+    for key in _DATETIME_KEYS:
+        value = page.get(key)
+        if isinstance(value, datetime):
+            page[key] = value.isoformat()
     
-    # Parse metadata JSON
-    if "metadata" in page and isinstance(page["metadata"], str):
+    # Parse metadata JSON (orjson accepts the driver's str or bytes as-is)
+    metadata = page.get("metadata")
+    if isinstance(metadata, (str, bytes)):
         try:
-            page["metadata"] = json.loads(page["metadata"])
-        except json.JSONDecodeError:
+            page["metadata"] = orjson.loads(metadata)
+        except orjson.JSONDecodeError:
             page["metadata"] = {}
     
     return page
 
 
+def _new_page_id() -> str:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562) page ID.
+    
+    branch_pages is clustered on id: a millisecond-timestamp prefix makes
+    new rows append to the right edge of the primary key B-tree instead of
+    splitting random leaf pages as uuid4 does.
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80   # unix_ts_ms
+        | 0x7 << 76                     # version 7
+        | (rand >> 68) << 64            # rand_a (12 bits)
+        | 0b10 << 62                    # RFC 4122 variant
+        | (rand & ((1 << 62) - 1))      # rand_b (62 bits)
+    )
+    return str(uuid.UUID(int=value))
+
+
 # ==============================================================================
 # Legacy API Compatibility Layer
 # ==============================================================================
@@ -521,7 +738,9 @@ async def update_branch_page_by_login(
 
 async def list_branch_pages_by_login(
     user_login: str,
-    repo_name: str
+    repo_name: str,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """Legacy wrapper using login/repo_name instead of IDs."""
     user_id, repo_id = await _resolve_ids(user_login, repo_name)
@@ -532,13 +751,14 @@ async def list_branch_pages_by_login(
             "pages": [],
             "total": 0
         }
-    return await list_branch_pages(user_id, repo_id)
+    return await list_branch_pages(user_id, repo_id, limit, cursor)
 
 
 async def ensure_branch_page_by_login(
     user_login: str,
     repo_name: str,
-    branch_name: str
+    branch_name: str,
+    with_body: bool = False
 ) -> Dict[str, Any]:
     """Legacy wrapper using login/repo_name instead of IDs."""
     user_id, repo_id = await _resolve_ids(user_login, repo_name)
@@ -548,7 +768,7 @@ async def ensure_branch_page_by_login(
             "message": "User or repository not found in database",
             "page": None
         }
-    return await ensure_branch_page(user_id, repo_id, branch_name)
+    return await ensure_branch_page(user_id, repo_id, branch_name, with_body)
 
 
 async def delete_branch_page_by_login(
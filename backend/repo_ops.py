@@ -12,17 +12,25 @@ Main Features:
 """
 
 import logging
+from itertools import chain
 from typing import Any, Dict, List, Optional
 
 import database
 
 logger = logging.getLogger(__name__)
 
+# Repositories upserted per INSERT statement in sync_user_repos
+SYNC_BATCH_SIZE = 500
+_SYNC_ROW_PLACEHOLDER = "(" + ", ".join(["%s"] * 12) + ")"
+
 
 async def sync_user_repos(user_id: int, repos: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Sync user's repositories from GitHub to database.
     
+    Rows are upserted with multi-row INSERT statements (SYNC_BATCH_SIZE rows
+    each) inside one transaction, instead of one round-trip per repository.
+    
     Args:
         user_id: Internal user ID
         repos: List of repository data from GitHub API
@@ -31,48 +39,59 @@ async def sync_user_repos(user_id: int, repos: List[Dict[str, Any]]) -> Dict[str
         Dict with sync result
     """
     try:
-        synced = 0
-        for repo in repos:
-            await database.execute(
-                """INSERT INTO repositories 
-                   (user_id, github_repo_id, name, full_name, description, 
-                    is_private, html_url, clone_url, ssh_url, language, 
-                    stargazers_count, default_branch)
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                   ON DUPLICATE KEY UPDATE
-                   name = VALUES(name),
-                   full_name = VALUES(full_name),
-                   description = VALUES(description),
-                   is_private = VALUES(is_private),
-                   html_url = VALUES(html_url),
-                   clone_url = VALUES(clone_url),
-                   ssh_url = VALUES(ssh_url),
-                   language = VALUES(language),
-                   stargazers_count = VALUES(stargazers_count),
-                   default_branch = VALUES(default_branch),
-                   synced_at = CURRENT_TIMESTAMP""",
-                (
-                    user_id,
-                    repo.get("id"),
-                    repo.get("name"),
-                    repo.get("full_name"),
-                    repo.get("description"),
-                    repo.get("private", False),
-                    repo.get("html_url"),
-                    repo.get("clone_url"),
-                    repo.get("ssh_url"),
-                    repo.get("language"),
-                    repo.get("stargazers_count", 0),
-                    repo.get("default_branch", "main"),
-                )
+        rows = [
+            (
+                user_id,
+                repo.get("id"),
+                repo.get("name"),
+                repo.get("full_name"),
+                repo.get("description"),
+                repo.get("private", False),
+                repo.get("html_url"),
+                repo.get("clone_url"),
+                repo.get("ssh_url"),
+                repo.get("language"),
+                repo.get("stargazers_count", 0),
+                repo.get("default_branch", "main"),
             )
-            synced += 1
+            for repo in repos
+        ]
+        
+        async with database.transaction() as cur:
+            for start in range(0, len(rows), SYNC_BATCH_SIZE):
+                chunk = rows[start:start + SYNC_BATCH_SIZE]
+                placeholders = ", ".join([_SYNC_ROW_PLACEHOLDER] * len(chunk))
+                await cur.execute(
+                    f"""INSERT INTO repositories 
+                       (user_id, github_repo_id, name, full_name, description, 
+                        is_private, html_url, clone_url, ssh_url, language, 
+                        stargazers_count, default_branch)
+                       VALUES {placeholders}
+                       ON DUPLICATE KEY UPDATE
+                       name = VALUES(name),
+                       full_name = VALUES(full_name),
+                       description = VALUES(description),
+                       is_private = VALUES(is_private),
+                       html_url = VALUES(html_url),
+                       clone_url = VALUES(clone_url),
+                       ssh_url = VALUES(ssh_url),
+                       language = VALUES(language),
+                       stargazers_count = VALUES(stargazers_count),
+                       default_branch = VALUES(default_branch),
+                       synced_at = CURRENT_TIMESTAMP""",
+                    tuple(chain.from_iterable(chunk))
+                )
+        
+        # Imported here: page_ops imports this module
+        import page_ops
+        page_ops.invalidate_resolved_ids(user_id)
         
-        logger.info(f"Synced {synced} repositories for user_id={user_id}")
+        synced = len(rows)
+        logger.info("Synced %s repositories for user_id=%s", synced, user_id)
         return {"status": "success", "synced": synced}
         
     except Exception as e:
-        logger.exception(f"Failed to sync_user_repos: {e}")
+        logger.exception("Failed to sync_user_repos: %s", e)
         raise
 
 
@@ -179,7 +198,7 @@ async def ensure_repo(
         )
     )
     
-    logger.info(f"Created repository: {full_name} (id={repo_id})")
+    logger.info("Created repository: %s (id=%s)", full_name, repo_id)
     return repo_id
 
 
@@ -201,13 +220,9 @@ async def ensure_repo_minimal(
         Repository internal ID or None if failed
     """
     # Check if already exists by name
-    existing = await database.fetchone(
-        "SELECT id FROM repositories WHERE user_id = %s AND name = %s",
-        (user_id, repo_name)
-    )
-    
-    if existing:
-        return existing["id"]
+    existing_id = await get_repo_id(user_id, repo_name)
+    if existing_id is not None:
+        return existing_id
     
     try:
         # Create minimal entry with placeholder github_repo_id
@@ -228,9 +243,9 @@ async def ensure_repo_minimal(
             )
         )
         
-        logger.info(f"Created minimal repository entry: {user_login}/{repo_name} (id={repo_id})")
+        logger.info("Created minimal repository entry: %s/%s (id=%s)", user_login, repo_name, repo_id)
         return repo_id
     except Exception as e:
-        logger.exception(f"Failed to create minimal repo entry: {e}")
+        logger.exception("Failed to create minimal repo entry: %s", e)
         return None
 
@@ -0,0 +1,59 @@
+"""
+==============================================================================
+Single-Flight Module (single_flight.py)
+==============================================================================
+Description: Coalesce concurrent identical async calls into one
+
+Main Features:
+    - single_flight: Run a coroutine once per key; concurrent callers with the
+      same key await the same result
+
+Strategy:
+    - The first caller for a key stores a future in the caller-owned
+      `inflight` dict and runs the work; later callers await that future
+    - Waiters are shielded, so a cancelled waiter never cancels the shared work
+    - Exceptions propagate to every caller; the key is removed when the work
+      ends, so the next call after it starts a fresh one
+    - There is no await between the lookup and the insert, so no lock is needed
+==============================================================================
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+async def single_flight(
+    inflight: Dict[Hashable, asyncio.Future],
+    key: Hashable,
+    factory: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Await factory() once for all concurrent callers with the same key.
+
+    Args:
+        inflight: Per-call-site map of pending futures (owned by the caller)
+        key: Identity of the call; equal keys share one execution
+        factory: Zero-argument callable returning the awaitable to run
+
+    Returns:
+        The result of factory(), shared by every caller that joined it
+    """
+    pending = inflight.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future = asyncio.get_running_loop().create_future()
+    inflight[key] = future
+    try:
+        result = await factory()
+        future.set_result(result)
+    except Exception as e:
+        future.set_exception(e)
+        # Mark it retrieved so a future nobody else awaited does not log a warning
+        future.exception()
+        raise
+    finally:
+        if not future.done():
+            future.cancel()
+        inflight.pop(key, None)
+    return result
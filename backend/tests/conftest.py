@@ -0,0 +1,130 @@
+"""
+Shared pytest fixtures for the backend tests
+"""
+import sys
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    One TestClient for the whole test session.
+
+    main is imported on first use, so collecting or running only the
+    git_ops tests never builds the FastAPI app. Not entered with `with`:
+    the tests run without the app lifespan (database pool, git process
+    pool), as they always have.
+    """
+    from fastapi.testclient import TestClient
+    from main import app
+
+    return TestClient(app)
+
+
+# Module-level caches reset around every test, by module name
+_MODULE_CACHES = {
+    "main": ("_verify_cache", "_login_cache", "_clone_status_cache"),
+    "github_client": ("_etag_cache",),
+    "git_ops": ("_list_cache",),
+    "page_ops": ("_resolve_cache", "_page_list_cache"),
+}
+
+
+def _clear_module_caches():
+    """Clear the caches of every listed module that is already imported"""
+    for module_name, attrs in _MODULE_CACHES.items():
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+        for attr in attrs:
+            getattr(module, attr).clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """
+    Isolate tests from each other's cached state.
+
+    Caches are cleared before and after every test, and a GitHub client a
+    test left behind is closed and the previous one restored. Modules are
+    never imported here, so running only the git_ops tests still never
+    builds the FastAPI app.
+    """
+    _clear_module_caches()
+    github_client = sys.modules.get("github_client")
+    previous = github_client._client if github_client is not None else None
+    yield
+    _clear_module_caches()
+    github_client = sys.modules.get("github_client")
+    if github_client is not None and github_client._client is not previous:
+        leftover = github_client._client
+        github_client._client = previous
+        if leftover is not None and not leftover.is_closed:
+            asyncio.run(leftover.aclose())
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run @pytest.mark.anyio tests on asyncio only"""
+    return "asyncio"
+
+
+@pytest.fixture
+async def aclient():
+    """
+    Async client that calls the ASGI app directly.
+
+    Requests are awaited on the test's own event loop, without the thread
+    hop TestClient makes for every call. Like client, no lifespan is run.
+    """
+    import httpx
+    from main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as c:
+        yield c
+
+
+class GitHubMock:
+    """
+    Canned GitHub API responses served through httpx.MockTransport.
+
+    Responses registered for a path are returned in order; the last one
+    repeats. Every request the app sent is kept in `requests`.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+
+    def add(self, path, *responses):
+        """Register responses (httpx.Response) for a URL path"""
+        self.routes[path] = list(responses)
+
+    def __call__(self, request):
+        self.requests.append(request)
+        responses = self.routes[request.url.path]
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+
+@pytest.fixture
+def github_mock():
+    """
+    Route the shared GitHub client to a GitHubMock for one test.
+
+    The real httpx.AsyncClient is kept, only its transport is replaced, so
+    headers, params and response parsing behave as in production. The mock
+    client is closed and the previous client restored afterwards.
+    """
+    import httpx
+    import github_client
+
+    mock = GitHubMock()
+    previous = github_client._client
+    mock_client = httpx.AsyncClient(transport=httpx.MockTransport(mock))
+    github_client._client = mock_client
+    yield mock
+    github_client._client = previous
+    asyncio.run(mock_client.aclose())
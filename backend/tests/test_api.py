@@ -3,17 +3,56 @@ Comprehensive API Tests for Gition Backend
 Target: 70% coverage
 """
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from main import app
-
-client = TestClient(app)
+import httpx
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, AsyncMock
+import json
+import orjson
+
+
+# Request bodies shared by the git endpoint tests, encoded once
+_JSON_HDRS = {"content-type": "application/json"}
+_EMPTY = b"{}"
+_CLONE_FULL = orjson.dumps({
+    "clone_url": "https://github.com/test/test.git",
+    "user_id": "test_user",
+    "repo_name": "test_repo",
+})
+_CHECKOUT_FULL = orjson.dumps({"user_id": "test", "repo_name": "test", "branch_name": "main"})
+_PULL_FULL = orjson.dumps({"user_id": "test", "repo_name": "test"})
+
+# git_ops functions imported by main, stubbed with their default results
+_GIT_STUB_DEFAULTS = {
+    "list_files": {"status": "success", "files": []},
+    "get_commits": {"status": "success", "commits": []},
+    "get_branches": {"status": "success", "branches": []},
+    "is_cloned": True,
+    "checkout_branch": {"status": "success"},
+    "search_files": {"status": "success", "results": []},
+}
+_GIT_ASYNC_STUB_DEFAULTS = {
+    "clone_repo_async": {"status": "success"},
+    "pull_repo_async": {"status": "success"},
+}
+
+
+@pytest.fixture(autouse=True)
+def git_stubs(monkeypatch):
+    """
+    Stub main's git_ops functions for every test.
+
+    Tests that care about a result request this fixture and adjust the
+    stub (git_stubs.list_files.return_value = ...).
+    """
+    import main
+
+    stubs = {name: MagicMock(return_value=value) for name, value in _GIT_STUB_DEFAULTS.items()}
+    stubs.update(
+        (name, AsyncMock(return_value=value)) for name, value in _GIT_ASYNC_STUB_DEFAULTS.items()
+    )
+    for name, stub in stubs.items():
+        monkeypatch.setattr(main, name, stub)
+    return SimpleNamespace(**stubs)
 
 
 # ============================================
@@ -22,24 +61,204 @@ client = TestClient(app)
 class TestHealthCheck:
     """Test basic API health"""
     
-    def test_health_endpoint(self):
+    def test_health_endpoint(self, client):
         """Test health endpoint"""
         response = client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data.get("status") == "ok"
     
-    def test_auth_github_redirect(self):
+    def test_auth_github_redirect(self, client):
         """Test GitHub OAuth redirect"""
         response = client.get("/auth/github", follow_redirects=False)
-        assert response.status_code in [200, 302, 307]
+        assert response.status_code == 307
+        assert response.headers["location"].startswith("https://github.com/login/oauth/authorize?")
     
-    def test_auth_callback_with_code(self):
+    def test_auth_callback_with_code(self, client):
         """Test OAuth callback with mock code"""
         response = client.get("/auth/github/callback?code=test_code")
         # May return various status based on env config
         assert response.status_code in [200, 302, 307, 400, 404, 500]
 
+    def test_auth_callback_prefers_verified_primary_email(self, github_mock, client):
+        """Test the callback picks the primary email, falling back to the first listed"""
+        import base64
+        github_mock.add("/login/oauth/access_token", httpx.Response(200, json={"access_token": "gho_test"}))
+        github_mock.add("/user", httpx.Response(200, json={"id": 1, "login": "octocat"}))
+        github_mock.add("/user/emails", httpx.Response(200, json=[
+            {"email": "first@example.com", "primary": False, "verified": True},
+            {"email": "primary@example.com", "primary": True, "verified": True},
+        ]))
+
+        response = client.get("/auth/github/callback?code=test_code", follow_redirects=False)
+        user_param = response.headers["location"].split("user=", 1)[1]
+        user = json.loads(base64.urlsafe_b64decode(user_param + "=" * (-len(user_param) % 4)))
+        assert user["email"] == "primary@example.com"
+
+
+class TestAuthVerify:
+    """Test auth verification endpoint"""
+
+    def test_verify_no_auth(self, client):
+        """Test verify without any token"""
+        response = client.get("/api/auth/verify")
+        assert response.status_code == 401
+        assert response.json()["authenticated"] is False
+
+    def test_verify_caches_positive_result(self, github_mock, client):
+        """Test a verified token is served from cache on the next call"""
+        github_mock.add("/user", httpx.Response(200, json={"id": 1, "login": "octocat", "name": "Octo"}))
+
+        for _ in range(2):
+            response = client.get("/api/auth/verify", headers={"Authorization": "Bearer cached_token"})
+            assert response.status_code == 200
+            assert response.json()["user"]["login"] == "octocat"
+        assert len(github_mock.requests) == 1
+
+
+class TestAuditLog:
+    """Test audit logging endpoint"""
+
+    def test_audit_no_auth(self, client):
+        """Test audit log without any token"""
+        response = client.post("/api/audit/log", json={"event_type": "COMMIT_SUCCESS"})
+        assert response.status_code == 401
+
+    def test_audit_caches_login(self, github_mock, client):
+        """Test consecutive audit events reuse the cached token -> login lookup"""
+        github_mock.add("/user", httpx.Response(200, json={"login": "octocat"}))
+
+        for event in ("COMMIT_INITIATED", "COMMIT_SUCCESS"):
+            response = client.post(
+                "/api/audit/log",
+                json={"event_type": event, "repo_name": "r"},
+                headers={"Authorization": "Bearer audit_token"},
+            )
+            assert response.json()["status"] == "success"
+        assert len(github_mock.requests) == 1
+
+    @patch("main._fetch_github_login")
+    def test_login_lookups_are_coalesced(self, mock_fetch):
+        """Test concurrent cache misses for one token share a single /user call"""
+        import asyncio
+        import main
+
+        async def slow_fetch(token):
+            await asyncio.sleep(0.01)
+            return "octocat"
+        mock_fetch.side_effect = slow_fetch
+
+        async def run():
+            return await asyncio.gather(*(main.get_github_login("burst_token") for _ in range(3)))
+
+        assert asyncio.run(run()) == ["octocat"] * 3
+        assert mock_fetch.call_count == 1
+        assert main._login_inflight == {}
+
+    @patch("main.get_github_login")
+    def test_audit_rejects_unknown_event(self, mock_login, client):
+        """Test event types outside the allowlist are rejected"""
+        mock_login.return_value = "octocat"
+        response = client.post(
+            "/api/audit/log",
+            json={"event_type": "DROP_TABLE"},
+            headers={"Authorization": "Bearer audit_token"},
+        )
+        assert response.status_code == 400
+        assert response.json()["message"] == "Invalid event type"
+
+    @patch("main.get_github_login")
+    def test_audit_rejects_malformed_json(self, mock_login, client):
+        """Test a body that is not JSON is rejected"""
+        mock_login.return_value = "octocat"
+        response = client.post(
+            "/api/audit/log",
+            content=b"{not json",
+            headers={"Authorization": "Bearer audit_token"},
+        )
+        assert response.status_code == 400
+        assert response.json()["message"] == "Invalid JSON body"
+
+    @patch("main.audit_log.enqueue")
+    @patch("main.get_github_login")
+    def test_audit_stringifies_non_string_fields(self, mock_login, mock_enqueue, client):
+        """Test non-string repo_name/status values are accepted and stringified"""
+        mock_login.return_value = "octocat"
+        response = client.post(
+            "/api/audit/log",
+            json={"event_type": "COMMIT_SUCCESS", "repo_name": ["a", "b"], "status": True},
+            headers={"Authorization": "Bearer audit_token"},
+        )
+        assert response.json()["status"] == "success"
+        entry = mock_enqueue.call_args[0][0]
+        assert (entry["repo"], entry["status"]) == ("['a', 'b']", "True")
+
+    @patch("main.audit_log.enqueue", side_effect=RuntimeError("disk full"))
+    @patch("main.get_github_login")
+    def test_audit_failure_is_json(self, mock_login, mock_enqueue, client):
+        """Test the 500 error path is served as application/json"""
+        mock_login.return_value = "octocat"
+        response = client.post(
+            "/api/audit/log",
+            json={"event_type": "COMMIT_SUCCESS"},
+            headers={"Authorization": "Bearer audit_token"},
+        )
+        assert response.status_code == 500
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["message"] == "Logging failed"
+
+    def test_audit_writer_batches_entries(self):
+        """Test the background writer flushes queued entries in batches"""
+        import asyncio
+        import audit_log
+
+        async def run():
+            audit_log.start()
+            for i in range(5):
+                audit_log.enqueue({"i": i})
+            await audit_log.stop()
+
+        with patch("audit_log.AUDIT_LOG_BUFFER_SIZE", 2), patch("audit_log._write") as mock_write:
+            asyncio.run(run())
+        assert [len(call.args[0]) for call in mock_write.call_args_list] == [2, 2, 1]
+
+    def test_audit_writer_survives_write_failure(self):
+        """Test a failed batch write falls back to logging and keeps flushing"""
+        import asyncio
+        import audit_log
+
+        async def run():
+            audit_log.start()
+            for i in range(3):
+                audit_log.enqueue({"i": i})
+            await audit_log.stop()
+
+        with patch("audit_log.AUDIT_LOG_BUFFER_SIZE", 2), \
+             patch("audit_log._write", side_effect=OSError("disk full")) as mock_write, \
+             patch.object(audit_log.logger, "info") as mock_info:
+            asyncio.run(run())
+        assert mock_write.call_count == 2
+        logged = [call.args[0] for call in mock_info.call_args_list if "audit_log" in call.args[0]]
+        assert len(logged) == 3
+
+    def test_audit_file_partial_write_logs_only_the_rest(self, tmp_path):
+        """Test entries already in the file are not logged again after a failed write"""
+        import os
+        import audit_log
+
+        fd = os.open(tmp_path / "audit.log", os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+        real_write = os.write
+        try:
+            # writev stores the first entry and part of the second, then the disk fills up
+            with patch("os.writev", lambda fd, buffers: real_write(fd, b"".join(buffers)[:3])), \
+                 patch("os.write", side_effect=OSError("disk full")), \
+                 patch.object(audit_log.logger, "info") as mock_info:
+                audit_log._write_fd(fd, ["a", "b", "c"])
+        finally:
+            os.close(fd)
+        assert (tmp_path / "audit.log").read_bytes() == b"a\nb"
+        assert [call.args[0] for call in mock_info.call_args_list] == ["b", "c"]
+
 
 # ============================================
 # Repository API Tests
@@ -47,30 +266,18 @@ class TestHealthCheck:
 class TestReposEndpoint:
     """Test repos endpoint"""
     
-    def test_repos_no_auth(self):
+    def test_repos_no_auth(self, client):
         """Test repos endpoint without auth token"""
         response = client.get("/api/repos")
         assert response.status_code == 200
         data = response.json()
         assert "error" in data or "repos" in data
     
-    @patch("main.httpx.AsyncClient")
-    def test_repos_with_token_success(self, mock_client_class):
+    def test_repos_with_token_success(self, github_mock, client):
         """Test repos endpoint with valid token success"""
-        from unittest.mock import AsyncMock
-        mock_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
+        github_mock.add("/user/repos", httpx.Response(200, json=[
             {"id": 1, "name": "repo1", "full_name": "u/r", "description": "d", "private": False, "clone_url": "url", "ssh_url": "surl", "html_url": "curl", "updated_at": "date", "default_branch": "main", "language": "TypeScript", "stargazers_count": 10}
-        ]
-        
-        # Mocking the async get method
-        mock_client.get.return_value = mock_response
-        
-        # Mocking the async context manager
-        mock_client.__aenter__.return_value = mock_client
-        mock_client_class.return_value = mock_client
+        ]))
         
         response = client.get(
             "/api/repos",
@@ -80,18 +287,74 @@ class TestReposEndpoint:
         data = response.json()
         assert "repos" in data
         assert len(data["repos"]) == 1
+        assert (data["total"], data["public"], data["private"]) == (1, 1, 0)
+
+    @patch("main.github_client.FRESH_TTL", 0)
+    def test_repos_not_modified_replays_cached(self, github_mock, client):
+        """Test a 304 from GitHub replays the response built from the previous 200"""
+        github_mock.add(
+            "/user/repos",
+            httpx.Response(200, headers={"ETag": '"v1"'}, json=[
+                {"id": 1, "name": "repo1", "full_name": "u/r", "description": "d", "private": True, "clone_url": "url", "ssh_url": "surl", "html_url": "curl", "updated_at": "date", "default_branch": "main", "language": None, "stargazers_count": 0}
+            ]),
+            httpx.Response(304),
+        )
 
-    @patch("main.httpx.AsyncClient")
-    def test_repos_github_error(self, mock_client_class):
+        first = client.get("/api/repos", headers={"Authorization": "Bearer etag_token"})
+        second = client.get("/api/repos", headers={"Authorization": "Bearer etag_token"})
+        assert second.json() == first.json()
+        assert second.json()["private"] == 1
+        assert github_mock.requests[-1].headers["If-None-Match"] == '"v1"'
+
+    def test_repos_fresh_cache_skips_github(self, github_mock, client):
+        """Test a repeat request inside the fresh window is served without a GitHub call"""
+        github_mock.add("/user/repos", httpx.Response(200, headers={"ETag": '"v1"'}, json=[]))
+
+        first = client.get("/api/repos", headers={"Authorization": "Bearer fresh_token"})
+        second = client.get("/api/repos", headers={"Authorization": "Bearer fresh_token"})
+        assert second.json() == first.json()
+        assert len(github_mock.requests) == 1
+
+    def test_repos_fetches_all_pages(self, github_mock, client):
+        """Test pages listed in the Link header are fetched and concatenated"""
+        repo = {"id": 1, "name": "repo", "full_name": "u/r", "description": "d", "private": False, "clone_url": "url", "ssh_url": "surl", "html_url": "curl", "updated_at": "date", "default_branch": "main", "language": None, "stargazers_count": 0}
+        link = ('<https://api.github.com/user/repos?per_page=100&page=2>; rel="next", '
+                '<https://api.github.com/user/repos?per_page=100&page=3>; rel="last"')
+        github_mock.add(
+            "/user/repos",
+            httpx.Response(200, headers={"Link": link}, json=[repo] * 100),
+            httpx.Response(200, json=[repo] * 100),
+            httpx.Response(200, json=[repo] * 7),
+        )
+
+        response = client.get("/api/repos", headers={"Authorization": "Bearer paged_token"})
+        assert response.json()["total"] == 207
+        pages = [request.url.params.get("page") for request in github_mock.requests]
+        # Pages after the first are fetched concurrently
+        assert pages[0] is None and sorted(pages[1:]) == ["2", "3"]
+
+    @patch("main.github_client.FRESH_TTL", 0)
+    def test_repos_multi_page_not_replayed(self, github_mock, client):
+        """Test a multi-page list is refetched instead of revalidated via page 1's ETag"""
+        repo = {"id": 1, "name": "repo", "full_name": "u/r", "description": "d", "private": False, "clone_url": "url", "ssh_url": "surl", "html_url": "curl", "updated_at": "date", "default_branch": "main", "language": None, "stargazers_count": 0}
+        link = '<https://api.github.com/user/repos?per_page=100&page=2>; rel="last"'
+        github_mock.add(
+            "/user/repos",
+            httpx.Response(200, headers={"Link": link, "ETag": '"v1"'}, json=[repo] * 100),
+            httpx.Response(200, json=[repo] * 5),
+            httpx.Response(200, headers={"Link": link, "ETag": '"v1"'}, json=[repo] * 100),
+            # A repo on page 2 was deleted; page 1 is unchanged
+            httpx.Response(200, json=[repo] * 4),
+        )
+
+        first = client.get("/api/repos", headers={"Authorization": "Bearer multi_token"})
+        second = client.get("/api/repos", headers={"Authorization": "Bearer multi_token"})
+        assert (first.json()["total"], second.json()["total"]) == (105, 104)
+        assert "If-None-Match" not in github_mock.requests[2].headers
+
+    def test_repos_github_error(self, github_mock, client):
         """Test repos endpoint when GitHub API fails"""
-        from unittest.mock import AsyncMock
-        mock_client = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        
-        mock_client.get.return_value = mock_response
-        mock_client.__aenter__.return_value = mock_client
-        mock_client_class.return_value = mock_client
+        github_mock.add("/user/repos", httpx.Response(401))
         
         response = client.get(
             "/api/repos",
@@ -108,14 +371,14 @@ class TestReposEndpoint:
 class TestGitClone:
     """Test Git clone operations"""
     
-    def test_clone_missing_params(self):
+    def test_clone_missing_params(self, client):
         """Test clone with missing parameters"""
-        response = client.post("/api/git/clone", json={})
+        response = client.post("/api/git/clone", content=_EMPTY, headers=_JSON_HDRS)
         assert response.status_code == 200
         data = response.json()
         assert data.get("status") == "error" or "error" in str(data).lower()
     
-    def test_clone_partial_params(self):
+    def test_clone_partial_params(self, client):
         """Test clone with partial parameters"""
         response = client.post("/api/git/clone", json={
             "clone_url": "https://github.com/test/test.git"
@@ -124,167 +387,245 @@ class TestGitClone:
         data = response.json()
         assert data.get("status") == "error"
     
-    @patch("main.clone_repo")
+    def test_clone_oversized_body(self, git_stubs, client):
+        """Test bodies over the limit are rejected with 413 before parsing"""
+        response = client.post(
+            "/api/git/clone",
+            content=b'{"clone_url": "' + b"x" * 20000 + b'"}',
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 413
+        assert response.json()["message"] == "Request body too large"
+        git_stubs.clone_repo_async.assert_not_called()
+
     @patch("main.get_token")
-    def test_clone_success(self, mock_get_token, mock_clone):
+    def test_clone_success(self, mock_get_token, git_stubs, client):
         """Test successful clone endpoint"""
         mock_get_token.return_value = "test_token"
-        mock_clone.return_value = {"status": "success", "message": "cloned"}
-        response = client.post("/api/git/clone", json={
-            "clone_url": "https://github.com/test/test.git",
-            "user_id": "test_user",
-            "repo_name": "test_repo"
-        })
+        git_stubs.clone_repo_async.return_value = {"status": "success", "message": "cloned"}
+        response = client.post("/api/git/clone", content=_CLONE_FULL, headers=_JSON_HDRS)
         assert response.status_code == 200
         data = response.json()
         assert data.get("status") == "success"
 
-    @patch("main.clone_repo")
     @patch("main.get_token")
-    def test_clone_error(self, mock_get_token, mock_clone):
-        """Test clone endpoint with git_ops error"""
+    def test_clone_numeric_user_id(self, mock_get_token, git_stubs, client):
+        """Test numeric user_id is passed to git_ops as a string"""
         mock_get_token.return_value = "test_token"
-        mock_clone.return_value = {"status": "error", "message": "failed"}
-        response = client.post("/api/git/clone", json={
+        git_stubs.clone_repo_async.return_value = {"status": "error", "message": "failed"}
+        client.post("/api/git/clone", json={
             "clone_url": "https://github.com/test/test.git",
-            "user_id": "test_user",
+            "user_id": 12345,
             "repo_name": "test_repo"
         })
+        git_stubs.clone_repo_async.assert_called_once_with(
+            "https://github.com/test/test.git", "test_token", "12345", "test_repo"
+        )
+
+    @patch("main.get_token")
+    def test_clone_saturated_returns_429(self, mock_get_token, client):
+        """Test clone is rejected when all slots and the wait queue are full"""
+        import asyncio
+        import main
+        mock_get_token.return_value = "test_token"
+        with patch.object(main, "_clone_sem", asyncio.Semaphore(0)), \
+                patch.object(main, "_clone_waiting", main.CLONE_QUEUE_LIMIT):
+            response = client.post("/api/git/clone", content=_CLONE_FULL, headers=_JSON_HDRS)
+        assert response.status_code == 429
+        assert response.json()["status"] == "error"
+
+    @patch("main.get_token")
+    def test_clone_error(self, mock_get_token, git_stubs, client):
+        """Test clone endpoint with git_ops error"""
+        mock_get_token.return_value = "test_token"
+        git_stubs.clone_repo_async.return_value = {"status": "error", "message": "failed"}
+        response = client.post("/api/git/clone", content=_CLONE_FULL, headers=_JSON_HDRS)
         assert response.status_code == 200
         data = response.json()
         assert data.get("status") == "error"
 
 
+# ============================================
+# Parameter Validation Tests
+# ============================================
+@pytest.mark.anyio
+class TestRequiredParams:
+    """Test endpoints reject requests without their required parameters"""
+
+    @pytest.mark.parametrize("method,url", [
+        ("GET", "/api/git/files"),
+        ("GET", "/api/git/file"),
+        ("GET", "/api/git/status"),
+        ("GET", "/api/git/commits"),
+        ("GET", "/api/git/branches"),
+        ("GET", "/api/git/search"),
+        ("DELETE", "/api/git/repo"),
+    ])
+    async def test_missing_params(self, method, url, aclient):
+        """Test endpoint with missing parameters"""
+        response = await aclient.request(method, url)
+        assert response.status_code in [200, 422]
+
+    @pytest.mark.parametrize("url", [
+        "/api/github/issues?owner=test&repo=test&state=closed",
+        "/api/github/pulls?owner=test&repo=test&state=closed",
+    ])
+    async def test_github_list_with_state(self, url, aclient):
+        """Test issues/pulls endpoints accept a state parameter"""
+        response = await aclient.get(url)
+        assert response.status_code == 200
+
+
 # ============================================
 # Git Files Tests
 # ============================================
+@pytest.mark.anyio
 class TestGitFiles:
     """Test Git files operations"""
     
-    def test_files_missing_params(self):
-        """Test files endpoint with missing parameters"""
-        response = client.get("/api/git/files")
-        assert response.status_code in [200, 422]
-    
-    @patch("main.list_files")
-    def test_files_with_params_success(self, mock_list):
+    async def test_files_with_params_success(self, git_stubs, aclient):
         """Test files endpoint with valid params success"""
-        mock_list.return_value = {"status": "success", "files": [{"name": "f1", "type": "file"}]}
-        response = client.get("/api/git/files?user_id=test&repo_name=test")
+        git_stubs.list_files.return_value = {"status": "success", "files": [{"name": "f1", "type": "file"}]}
+        response = await aclient.get("/api/git/files?user_id=test&repo_name=test")
         assert response.status_code == 200
         data = response.json()
         assert data.get("status") == "success"
         assert len(data["files"]) == 1
 
-    @patch("main.list_files")
-    def test_files_with_path_success(self, mock_list):
+    async def test_files_with_path_success(self, git_stubs, aclient):
         """Test files endpoint with path parameter success"""
-        mock_list.return_value = {"status": "success", "files": []}
-        response = client.get("/api/git/files?user_id=test&repo_name=test&path=src")
+        git_stubs.list_files.return_value = {"status": "success", "files": []}
+        response = await aclient.get("/api/git/files?user_id=test&repo_name=test&path=src")
+        assert response.status_code == 200
+        git_stubs.list_files.assert_called_with("test", "test", "src")
+
+    async def test_files_large_response_gzipped(self, git_stubs, aclient):
+        """Test large JSON responses are gzip-compressed when accepted"""
+        files = [{"name": f"file_{i}.py", "type": "file"} for i in range(200)]
+        git_stubs.list_files.return_value = {"status": "success", "files": files}
+        response = await aclient.get(
+            "/api/git/files?user_id=test&repo_name=test",
+            headers={"Accept-Encoding": "gzip"},
+        )
         assert response.status_code == 200
-        mock_list.assert_called_with("test", "test", "src")
+        assert response.headers.get("content-encoding") == "gzip"
+        assert len(response.json()["files"]) == 200
 
 
+@pytest.mark.anyio
 class TestGitFile:
     """Test Git file content operations"""
     
-    def test_file_missing_params(self):
-        """Test file endpoint with missing parameters"""
-        response = client.get("/api/git/file")
-        assert response.status_code in [200, 422]
-    
-    def test_file_with_params(self):
+    async def test_file_with_params(self, aclient):
         """Test file endpoint with valid params but non-existent repo"""
-        response = client.get("/api/git/file?user_id=test&repo_name=test&path=README.md")
+        response = await aclient.get("/api/git/file?user_id=test&repo_name=test&path=README.md")
         assert response.status_code == 200
         data = response.json()
         assert data.get("status") == "error" or "content" in data
     
-    def test_file_nested_path(self):
+    async def test_file_nested_path(self, aclient):
         """Test file endpoint with nested path"""
-        response = client.get("/api/git/file?user_id=test&repo_name=test&path=src/main.py")
+        response = await aclient.get("/api/git/file?user_id=test&repo_name=test&path=src/main.py")
         assert response.status_code == 200
 
 
 # ============================================
 # Git Status Tests
 # ============================================
+@pytest.mark.anyio
 class TestGitStatus:
     """Test Git status operations"""
     
-    def test_status_missing_params(self):
-        """Test status endpoint with missing parameters"""
-        response = client.get("/api/git/status")
-        assert response.status_code in [200, 422]
-    
-    @patch("main.is_cloned")
-    def test_status_with_params(self, mock_cloned):
+    async def test_status_with_params(self, git_stubs, aclient):
         """Test status with valid params"""
-        mock_cloned.return_value = True
-        response = client.get("/api/git/status?user_id=test&repo_name=test")
+        git_stubs.is_cloned.return_value = True
+        response = await aclient.get("/api/git/status?user_id=test&repo_name=test")
         assert response.status_code == 200
         data = response.json()
         assert data.get("cloned") == True
 
+    @patch("main.delete_repo")
+    async def test_status_cached_until_delete(self, mock_delete, git_stubs, aclient):
+        """Test repeated polls hit the cache and delete invalidates it"""
+        git_stubs.is_cloned.return_value = True
+        mock_delete.return_value = {"status": "success"}
+        url = "/api/git/status?user_id=poller&repo_name=polled"
+        assert (await aclient.get(url)).json()["cloned"] is True
+        assert (await aclient.get(url)).json()["cloned"] is True
+        assert git_stubs.is_cloned.call_count == 1
+
+        await aclient.request("DELETE", "/api/git/repo", json={"user_id": "poller", "repo_name": "polled"})
+        git_stubs.is_cloned.return_value = False
+        assert (await aclient.get(url)).json()["cloned"] is False
+        assert git_stubs.is_cloned.call_count == 2
+
 
 # ============================================
 # Git Commits Tests
 # ============================================
+@pytest.mark.anyio
 class TestGitCommits:
     """Test Git commits operations"""
     
-    def test_commits_missing_params(self):
-        """Test commits endpoint with missing parameters"""
-        response = client.get("/api/git/commits")
-        assert response.status_code in [200, 422]
-    
-    @patch("main.get_commits")
-    def test_commits_with_params(self, mock_commits):
+    async def test_commits_with_params(self, git_stubs, aclient):
         """Test commits with valid params but non-existent repo"""
-        mock_commits.return_value = {"status": "success", "commits": []}
-        response = client.get("/api/git/commits?user_id=test&repo_name=test")
+        git_stubs.get_commits.return_value = {"status": "success", "commits": []}
+        response = await aclient.get("/api/git/commits?user_id=test&repo_name=test")
         assert response.status_code == 200
         data = response.json()
         assert "commits" in data
     
-    def test_commits_with_max_count(self):
+    async def test_commits_with_max_count(self, aclient):
         """Test commits with max_count parameter"""
-        response = client.get("/api/git/commits?user_id=test&repo_name=test&max_count=10")
+        response = await aclient.get("/api/git/commits?user_id=test&repo_name=test&max_count=10")
         assert response.status_code == 200
 
 
 # ============================================
 # Git Branches Tests
 # ============================================
+@pytest.mark.anyio
 class TestGitBranches:
     """Test Git branches operations"""
     
-    def test_branches_missing_params(self):
-        """Test branches endpoint with missing parameters"""
-        response = client.get("/api/git/branches")
-        assert response.status_code in [200, 422]
-    
-    @patch("main.get_branches")
-    def test_branches_with_params(self, mock_branches):
+    async def test_branches_with_params(self, git_stubs, aclient):
         """Test branches with valid params but non-existent repo"""
-        mock_branches.return_value = {"status": "success", "branches": []}
-        response = client.get("/api/git/branches?user_id=test&repo_name=test")
+        git_stubs.get_branches.return_value = {"status": "success", "branches": []}
+        response = await aclient.get("/api/git/branches?user_id=test&repo_name=test")
         assert response.status_code == 200
         data = response.json()
         assert "branches" in data
 
 
+class TestGitOverview:
+    """Test combined repository overview endpoint"""
+
+    def test_overview_combines_results(self, git_stubs, client):
+        """Test overview returns files, commits and branches together"""
+        git_stubs.list_files.return_value = {"status": "success", "files": []}
+        git_stubs.get_commits.return_value = {"status": "success", "commits": []}
+        git_stubs.get_branches.return_value = {"status": "success", "branches": []}
+        response = client.get("/api/git/overview?user_id=test&repo_name=test&max_count=500")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["files"]["status"] == "success"
+        assert data["commits"]["status"] == "success"
+        assert data["branches"]["status"] == "success"
+        git_stubs.list_files.assert_called_once_with("test", "test", "")
+        git_stubs.get_commits.assert_called_once_with("test", "test", None, 100)
+
+
 class TestGitCheckout:
     """Test Git checkout operations"""
     
-    def test_checkout_missing_params(self):
+    def test_checkout_missing_params(self, client):
         """Test checkout endpoint with missing parameters"""
-        response = client.post("/api/git/checkout", json={})
+        response = client.post("/api/git/checkout", content=_EMPTY, headers=_JSON_HDRS)
         assert response.status_code == 200
         data = response.json()
         assert data.get("status") == "error"
     
-    def test_checkout_partial_params(self):
+    def test_checkout_partial_params(self, client):
         """Test checkout with partial parameters"""
         response = client.post("/api/git/checkout", json={
             "user_id": "test",
@@ -294,53 +635,53 @@ class TestGitCheckout:
         data = response.json()
         assert data.get("status") == "error"
     
-    @patch("main.checkout_branch")
-    def test_checkout_with_all_params(self, mock_checkout):
+    def test_checkout_with_all_params(self, git_stubs, client):
         """Test checkout with all params but non-existent repo"""
-        mock_checkout.return_value = {"status": "success"}
-        response = client.post("/api/git/checkout", json={
-            "user_id": "test",
-            "repo_name": "test",
-            "branch_name": "main"
-        })
+        git_stubs.checkout_branch.return_value = {"status": "success"}
+        response = client.post("/api/git/checkout", content=_CHECKOUT_FULL, headers=_JSON_HDRS)
         assert response.status_code == 200
 
+    def test_checkout_creates_branch_page(self, git_stubs, client):
+        """Test a successful checkout awaits the async page auto-creation"""
+        git_stubs.checkout_branch.return_value = {"status": "success"}
+        with patch("main.ensure_branch_page", new_callable=AsyncMock) as mock_ensure:
+            client.post("/api/git/checkout", json={
+                "user_id": "test",
+                "repo_name": "test",
+                "branch_name": "feature"
+            })
+        mock_ensure.assert_awaited_once_with("test", "test", "feature")
+
 
 # ============================================
 # Git Search Tests
 # ============================================
+@pytest.mark.anyio
 class TestGitSearch:
     """Test Git search operations"""
     
-    def test_search_missing_params(self):
-        """Test search endpoint with missing parameters"""
-        response = client.get("/api/git/search")
-        assert response.status_code in [200, 422]
-    
-    @patch("main.search_files")
-    def test_search_with_params_success(self, mock_search):
+    async def test_search_with_params_success(self, git_stubs, aclient):
         """Test search with valid params success"""
-        mock_search.return_value = {"status": "success", "results": [{"type": "filename", "path": "p"}]}
-        response = client.get("/api/git/search?user_id=test&repo_name=test&query=test")
+        git_stubs.search_files.return_value = {"status": "success", "results": [{"type": "filename", "path": "p"}]}
+        response = await aclient.get("/api/git/search?user_id=test&repo_name=test&query=test")
         assert response.status_code == 200
         data = response.json()
         assert data.get("status") == "success"
         assert len(data["results"]) == 1
     
-    def test_search_short_query(self):
+    async def test_search_short_query(self, aclient):
         """Test search with too short query"""
-        response = client.get("/api/git/search?user_id=test&repo_name=test&query=a")
+        response = await aclient.get("/api/git/search?user_id=test&repo_name=test&query=a")
         assert response.status_code == 200
         data = response.json()
         assert data.get("status") == "error"
 
-    @patch("main.search_files")
-    def test_search_with_content_flag(self, mock_search):
+    async def test_search_with_content_flag(self, git_stubs, aclient):
         """Test search with content flag"""
-        mock_search.return_value = {"status": "success", "results": []}
-        response = client.get("/api/git/search?user_id=test&repo_name=test&query=test&content=true")
+        git_stubs.search_files.return_value = {"status": "success", "results": []}
+        response = await aclient.get("/api/git/search?user_id=test&repo_name=test&query=test&content=true")
         assert response.status_code == 200
-        mock_search.assert_called_with("test", "test", "test", True, 50)
+        git_stubs.search_files.assert_called_with("test", "test", "test", True, 50)
 
 
 # ============================================
@@ -349,21 +690,17 @@ class TestGitSearch:
 class TestGitPull:
     """Test Git pull operations"""
     
-    def test_pull_missing_params(self):
+    def test_pull_missing_params(self, client):
         """Test pull with missing parameters"""
-        response = client.post("/api/git/pull", json={})
+        response = client.post("/api/git/pull", content=_EMPTY, headers=_JSON_HDRS)
         assert response.status_code == 200
         data = response.json()
         assert data.get("status") == "error" or "error" in str(data).lower()
     
-    @patch("main.pull_repo")
-    def test_pull_with_params_success(self, mock_pull):
+    def test_pull_with_params_success(self, git_stubs, client):
         """Test pull with valid params success"""
-        mock_pull.return_value = {"status": "success", "message": "pulled"}
-        response = client.post("/api/git/pull", json={
-            "user_id": "test",
-            "repo_name": "test"
-        })
+        git_stubs.pull_repo_async.return_value = {"status": "success", "message": "pulled"}
+        response = client.post("/api/git/pull", content=_PULL_FULL, headers=_JSON_HDRS)
         assert response.status_code == 200
         data = response.json()
         assert data.get("status") == "success"
@@ -375,12 +712,7 @@ class TestGitPull:
 class TestGitDelete:
     """Test Git delete operations"""
     
-    def test_delete_missing_params(self):
-        """Test delete with missing parameters"""
-        response = client.delete("/api/git/repo")
-        assert response.status_code in [200, 422]
-    
-    def test_delete_with_params(self):
+    def test_delete_with_params(self, client):
         """Test delete with valid params but non-existent repo"""
         response = client.delete("/api/git/repo?user_id=test&repo_name=test")
         assert response.status_code == 200
@@ -392,7 +724,7 @@ class TestGitDelete:
 class TestGitHubIssues:
     """Test GitHub Issues API"""
     
-    def test_issues_no_auth(self):
+    def test_issues_no_auth(self, client):
         """Test issues endpoint without auth token"""
         response = client.get("/api/github/issues?owner=test&repo=test")
         assert response.status_code == 200
@@ -400,7 +732,7 @@ class TestGitHubIssues:
         assert data.get("status") == "error"
         assert "issues" in data
     
-    def test_issues_with_invalid_auth(self):
+    def test_issues_with_invalid_auth(self, client):
         """Test issues endpoint with invalid auth"""
         response = client.get(
             "/api/github/issues?owner=test&repo=test",
@@ -410,16 +742,35 @@ class TestGitHubIssues:
         data = response.json()
         assert "issues" in data
     
-    def test_issues_with_state(self):
-        """Test issues endpoint with state parameter"""
-        response = client.get("/api/github/issues?owner=test&repo=test&state=closed")
-        assert response.status_code == 200
+    def test_issues_projection_excludes_prs(self, github_mock, client):
+        """Test issues are projected to the frontend fields and PRs are filtered out"""
+        issue = {
+            "id": 1, "number": 7, "title": "Bug", "state": "open", "comments": 2,
+            "created_at": "c", "updated_at": "u", "html_url": "h", "body": "ignored",
+            "user": {"login": "octocat", "avatar_url": "a", "id": 9},
+            "labels": [{"name": "bug", "color": "red", "id": 3}],
+        }
+        pr = dict(issue, id=2, pull_request={})
+        github_mock.add("/repos/test/projection/issues", httpx.Response(200, json=[issue, pr]))
+
+        response = client.get(
+            "/api/github/issues?owner=test&repo=projection",
+            headers={"Authorization": "Bearer valid_token"}
+        )
+        data = response.json()
+        assert data["total"] == 1
+        assert data["issues"][0] == {
+            "id": 1, "number": 7, "title": "Bug", "state": "open", "comments": 2,
+            "created_at": "c", "updated_at": "u", "html_url": "h",
+            "user": {"login": "octocat", "avatar_url": "a"},
+            "labels": [{"name": "bug", "color": "red"}],
+        }
 
 
 class TestGitHubPulls:
     """Test GitHub Pull Requests API"""
     
-    def test_pulls_no_auth(self):
+    def test_pulls_no_auth(self, client):
         """Test pulls endpoint without auth token"""
         response = client.get("/api/github/pulls?owner=test&repo=test")
         assert response.status_code == 200
@@ -427,7 +778,7 @@ class TestGitHubPulls:
         assert data.get("status") == "error"
         assert "pulls" in data
     
-    def test_pulls_with_invalid_auth(self):
+    def test_pulls_with_invalid_auth(self, client):
         """Test pulls endpoint with invalid auth"""
         response = client.get(
             "/api/github/pulls?owner=test&repo=test",
@@ -436,8 +787,80 @@ class TestGitHubPulls:
         assert response.status_code == 200
         data = response.json()
         assert "pulls" in data
-    
-    def test_pulls_with_state(self):
-        """Test pulls endpoint with state parameter"""
-        response = client.get("/api/github/pulls?owner=test&repo=test&state=closed")
-        assert response.status_code == 200
+
+
+class TestGitHubActivity:
+    """Test combined issues + pull requests endpoint"""
+
+    def test_activity_no_auth(self, client):
+        """Test activity endpoint without auth token"""
+        response = client.get("/api/github/activity?owner=test&repo=test")
+        data = response.json()
+        assert data["status"] == "error"
+        assert data["issues"] == [] and data["pulls"] == []
+
+    def test_activity_fetches_both(self, github_mock, client):
+        """Test issues and pulls are fetched together and nested in one response"""
+        github_mock.add("/repos/test/activity/issues", httpx.Response(200, content=b"[]"))
+        github_mock.add("/repos/test/activity/pulls", httpx.Response(200, content=b"[]"))
+
+        response = client.get(
+            "/api/github/activity?owner=test&repo=activity",
+            headers={"Authorization": "Bearer valid_token"}
+        )
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["partial"] is False
+        assert data["issues"] == {"status": "success", "total": 0, "issues": []}
+        assert data["pulls"] == {"status": "success", "total": 0, "pulls": []}
+        assert len(github_mock.requests) == 2
+
+    def test_activity_reports_partial_failure(self, github_mock, client):
+        """Test one failed upstream is flagged as partial"""
+        github_mock.add("/repos/test/partial/issues", httpx.Response(200, content=b"[]"))
+        github_mock.add("/repos/test/partial/pulls", httpx.Response(500))
+
+        response = client.get(
+            "/api/github/activity?owner=test&repo=partial",
+            headers={"Authorization": "Bearer valid_token"}
+        )
+        data = response.json()
+        assert (data["status"], data["partial"]) == ("success", True)
+        assert data["pulls"]["status"] == "error"
+
+    def test_activity_reports_error_when_both_fail(self, github_mock, client):
+        """Test a rejected token makes the combined response an error"""
+        github_mock.add("/repos/test/denied/issues", httpx.Response(401))
+        github_mock.add("/repos/test/denied/pulls", httpx.Response(401))
+
+        response = client.get(
+            "/api/github/activity?owner=test&repo=denied",
+            headers={"Authorization": "Bearer bad_token"}
+        )
+        data = response.json()
+        assert (data["status"], data["partial"]) == ("error", False)
+
+
+# ============================================
+# Branch Page Tests
+# ============================================
+class TestBranchPages:
+    """Test branch page endpoints"""
+
+    def test_list_pages_no_auth(self, client):
+        """Test page list without auth token"""
+        response = client.get("/api/pages/test/test")
+        data = response.json()
+        assert data["status"] == "error"
+        assert data["pages"] == []
+
+    def test_list_pages_forwards_paging(self, client):
+        """Test limit and cursor query params are passed to the page list"""
+        result = {"status": "success", "pages": [], "total": 0, "next_cursor": None}
+        with patch("main.list_branch_pages", new_callable=AsyncMock, return_value=result) as mock_list:
+            response = client.get(
+                "/api/pages/test/test?limit=20&cursor=2026-01-01T00:00:00|abc",
+                headers={"Authorization": "Bearer valid_token"}
+            )
+        assert response.json() == result
+        mock_list.assert_awaited_once_with("test", "test", 20, "2026-01-01T00:00:00|abc")
@@ -4,22 +4,24 @@ Git Operations Tests
 import pytest
 from unittest.mock import patch, MagicMock, mock_open
 from pathlib import Path
-import sys
 import os
 import shutil
-
-# Ensure backend directory is in path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import asyncio
 
 from git_ops import (
     get_repo_path,
-    clone_repo,
-    pull_repo,
+    clone_repo_async,
+    pull_repo_async,
+    evict_reference_cache,
+    _build_clone_args,
     list_files,
+    invalidate_list_cache,
     read_file,
     is_cloned,
     delete_repo,
     search_files,
+    build_search_index,
+    invalidate_search_index,
     get_commits,
     get_branches,
     checkout_branch
@@ -57,69 +59,159 @@ class TestGetRepoPath:
 
 
 class TestCloneRepo:
-    """Test clone_repo function"""
+    """Test clone_repo_async function"""
 
+    @patch("git_ops._run_git")
     @patch("git_ops.Path.exists")
-    def test_already_cloned(self, mock_exists):
+    def test_already_cloned(self, mock_exists, mock_run_git):
         """Test returns exists status if already cloned"""
-        mock_exists.side_effect = lambda: True
-        # Mock (repo_path / ".git").exists()
-        with patch("git_ops.Path.__truediv__") as mock_div:
-            mock_dot_git = MagicMock()
-            mock_dot_git.exists.return_value = True
-            mock_div.return_value = mock_dot_git
-            
-            result = clone_repo("https://github.com/u/r", "token", "user", "repo")
-            assert result["status"] == "exists"
-
-    @patch("git_ops.Repo.clone_from")
+        mock_exists.return_value = True
+
+        result = asyncio.run(clone_repo_async("https://github.com/u/r", "token", "user", "repo"))
+        assert result["status"] == "exists"
+        mock_run_git.assert_not_called()
+
+    @patch("git_ops.REF_CACHE_ENABLED", False)
+    @patch("git_ops.refresh_search_index")
+    @patch("git_ops._create_local_branches_async")
+    @patch("git_ops._run_git")
     @patch("git_ops.Path.mkdir")
     @patch("git_ops.Path.exists")
-    def test_successful_clone(self, mock_exists, mock_mkdir, mock_clone):
-        """Test successful repository clone"""
+    def test_clone_builds_search_index(self, mock_exists, mock_mkdir, mock_run_git, mock_branches, mock_refresh):
         mock_exists.return_value = False
-        
-        result = clone_repo("https://github.com/u/r", "token", "user", "repo")
+        mock_run_git.return_value = (0, "")
+        mock_branches.return_value = 0
+
+        result = asyncio.run(clone_repo_async("https://github.com/u/r", "token", "user", "repo"))
         assert result["status"] == "success"
-        mock_clone.assert_called_once()
+        mock_refresh.assert_called_once()
+
+
+class TestPullRepo:
+    """Test pull_repo_async function"""
+
+    @patch("git_ops.refresh_search_index")
+    @patch("git_ops._run_git")
+    @patch("git_ops.Path.exists")
+    def test_successful_pull(self, mock_exists, mock_run_git, mock_refresh):
+        mock_exists.return_value = True
+        mock_run_git.return_value = (0, "Updating a..b")
+
+        result = asyncio.run(pull_repo_async("user", "repo"))
+        assert result["status"] == "success"
+        assert mock_run_git.call_args[0][:2] == ("pull", "origin")
+        mock_refresh.assert_called_once()
+
+    @patch("git_ops.refresh_search_index")
+    @patch("git_ops._run_git")
+    @patch("git_ops.Path.exists")
+    def test_failed_pull_keeps_index(self, mock_exists, mock_run_git, mock_refresh):
+        mock_exists.return_value = True
+        mock_run_git.return_value = (1, "fatal: unable to access")
+
+        result = asyncio.run(pull_repo_async("user", "repo"))
+        assert result["status"] == "error"
+        mock_refresh.assert_not_called()
+
+
+class TestAsyncCloneRepo:
+    """Test clone_repo_async / pull_repo_async (git CLI subprocess)"""
+
+    @patch("git_ops.REF_CACHE_ENABLED", False)
+    @patch("git_ops._create_local_branches_async")
+    @patch("git_ops._run_git")
+    @patch("git_ops.Path.mkdir")
+    @patch("git_ops.Path.exists")
+    def test_successful_clone(self, mock_exists, mock_mkdir, mock_run_git, mock_branches):
+        mock_exists.return_value = False
+        mock_run_git.return_value = (0, "")
+        mock_branches.return_value = 2
+
+        result = asyncio.run(clone_repo_async("https://github.com/u/r", "token", "user", "repo"))
+        assert result["status"] == "success"
+        assert result["branches_created"] == 2
         # Verify token injection
-        assert "https://token@github.com/u/r" in mock_clone.call_args[0][0]
+        assert "https://token@github.com/u/r" in mock_run_git.call_args[0]
 
-    @patch("git_ops.Repo.clone_from")
+    @patch("git_ops.REF_CACHE_ENABLED", False)
+    @patch("git_ops._run_git")
     @patch("git_ops.shutil.rmtree")
     @patch("git_ops.Path.mkdir")
     @patch("git_ops.Path.exists")
-    def test_clone_failure_cleanup(self, mock_exists, mock_mkdir, mock_rmtree, mock_clone):
-        """Test cleanup after failed clone"""
-        mock_exists.side_effect = [False, True] # Not exists initially, exists for cleanup
-        from git import GitCommandError
-        mock_clone.side_effect = GitCommandError("clone", "failed")
-        
-        with patch("git_ops.REPOS_BASE_PATH", "/tmp/repos"):
-            result = clone_repo("https://github.com/u/r", "token", "user", "repo")
-            assert result["status"] == "error"
-            mock_rmtree.assert_called_once()
-
+    def test_clone_failure_redacts_token(self, mock_exists, mock_mkdir, mock_rmtree, mock_run_git):
+        mock_exists.side_effect = [False, True]  # Not exists initially, exists for cleanup
+        mock_run_git.return_value = (128, "fatal: could not read from https://token@github.com/u/r")
 
-class TestPullRepo:
-    """Test pull_repo function"""
+        result = asyncio.run(clone_repo_async("https://github.com/u/r", "token", "user", "repo"))
+        assert result["status"] == "error"
+        assert "token" not in result["message"]
+        mock_rmtree.assert_called_once()
 
     @patch("git_ops.Path.exists")
-    def test_error_not_cloned(self, mock_exists):
+    def test_pull_not_cloned(self, mock_exists):
         mock_exists.return_value = False
-        result = pull_repo("user", "repo")
+        result = asyncio.run(pull_repo_async("user", "repo"))
         assert result["status"] == "error"
 
-    @patch("git_ops.Repo")
+    def test_pull_invalid_name_returns_error(self):
+        result = asyncio.run(pull_repo_async("user", "../etc"))
+        assert result["status"] == "error"
+        assert "Invalid repo_name" in result["message"]
+
+    @patch("git_ops._run_git")
     @patch("git_ops.Path.exists")
-    def test_successful_pull(self, mock_exists, mock_repo_class):
+    def test_pull_success(self, mock_exists, mock_run_git):
         mock_exists.return_value = True
-        mock_repo = MagicMock()
-        mock_repo_class.return_value = mock_repo
-        
-        result = pull_repo("user", "repo")
+        mock_run_git.return_value = (0, "Already up to date.")
+        result = asyncio.run(pull_repo_async("user", "repo"))
         assert result["status"] == "success"
-        mock_repo.remotes.origin.pull.assert_called_once()
+
+
+class TestReferenceCache:
+    """Test clone argument building and reference mirror eviction"""
+
+    @patch("git_ops.CLONE_NO_TAGS", True)
+    @patch("git_ops.CLONE_FILTER", "blob:none")
+    @patch("git_ops.CLONE_DEPTH", 1)
+    def test_build_clone_args(self):
+        args = _build_clone_args("https://t@github.com/u/r", Path("/tmp/repos/u/r"), Path("/tmp/ref"))
+        assert args[:2] == ["clone", "--no-tags"]
+        assert "--no-single-branch" in args
+        assert "--filter=blob:none" in args
+        assert args[args.index("--reference-if-able") + 1] == "/tmp/ref"
+        assert args[-2:] == ["https://t@github.com/u/r", "/tmp/repos/u/r"]
+
+    def test_evict_oldest_first(self, tmp_path):
+        cache_root = tmp_path / "_ref_cache"
+        for i, name in enumerate(["old", "new"]):
+            mirror = cache_root / name
+            mirror.mkdir(parents=True)
+            (mirror / "pack").write_bytes(b"x" * 100)
+            os.utime(mirror, (1000 + i, 1000 + i))
+
+        with patch("git_ops.REPOS_BASE_PATH", str(tmp_path)):
+            assert evict_reference_cache(max_bytes=150) == 1
+        assert not (cache_root / "old").exists()
+        assert (cache_root / "new").exists()
+
+    def test_build_clone_args_fetches_tags_by_default(self):
+        args = _build_clone_args("https://t@github.com/u/r", Path("/tmp/repos/u/r"), None)
+        assert "--no-tags" not in args
+        assert "--reference-if-able" not in args
+
+    def test_evict_skips_borrowed_mirror(self, tmp_path):
+        cache_root = tmp_path / "_ref_cache"
+        for i, name in enumerate(["old", "new"]):
+            mirror = cache_root / name
+            mirror.mkdir(parents=True)
+            (mirror / "pack").write_bytes(b"x" * 100)
+            os.utime(mirror, (1000 + i, 1000 + i))
+
+        with patch("git_ops.REPOS_BASE_PATH", str(tmp_path)), \
+             patch.dict("git_ops._ref_cache_readers", {"old": 1}):
+            assert evict_reference_cache(max_bytes=150) == 1
+        assert (cache_root / "old").exists()
+        assert not (cache_root / "new").exists()
 
 
 class TestListFiles:
@@ -167,6 +259,50 @@ class TestListFiles:
         assert result["files"][0]["type"] == "directory" # Sorted
 
 
+class TestListFilesCache:
+    """Test list_files caching keyed by HEAD sha"""
+
+    @pytest.fixture
+    def repo_dir(self, tmp_path):
+        repo_path = tmp_path / "repo"
+        (repo_path / ".git" / "refs" / "heads").mkdir(parents=True)
+        (repo_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (repo_path / ".git" / "refs" / "heads" / "main").write_text("a" * 40 + "\n")
+        (repo_path / "file1.txt").write_text("x")
+        return repo_path
+
+    def test_cached_while_unchanged(self, repo_dir):
+        with patch("git_ops.get_repo_path", return_value=repo_dir), \
+             patch("git_ops.Path.iterdir", autospec=True, side_effect=Path.iterdir) as mock_iterdir:
+            first = list_files("user", "repo")
+            assert list_files("user", "repo") == first
+        assert mock_iterdir.call_count == 1
+
+    def test_working_tree_change_misses_cache(self, repo_dir):
+        with patch("git_ops.get_repo_path", return_value=repo_dir):
+            list_files("user", "repo")
+            # Created outside the backend, without any invalidate call
+            (repo_dir / "file2.txt").write_text("y")
+            assert len(list_files("user", "repo")["files"]) == 2
+            (repo_dir / "file1.txt").unlink()
+            assert [f["name"] for f in list_files("user", "repo")["files"]] == ["file2.txt"]
+
+    def test_invalidate_misses_cache(self, repo_dir):
+        with patch("git_ops.get_repo_path", return_value=repo_dir), \
+             patch("git_ops.Path.iterdir", autospec=True, side_effect=Path.iterdir) as mock_iterdir:
+            list_files("user", "repo")
+            invalidate_list_cache(repo_dir)
+            list_files("user", "repo")
+        assert mock_iterdir.call_count == 2
+
+    def test_head_change_misses_cache(self, repo_dir):
+        with patch("git_ops.get_repo_path", return_value=repo_dir):
+            list_files("user", "repo")
+            (repo_dir / "file2.txt").write_text("y")
+            (repo_dir / ".git" / "refs" / "heads" / "main").write_text("b" * 40 + "\n")
+            assert len(list_files("user", "repo")["files"]) == 2
+
+
 class TestReadFile:
     """Test read_file function"""
     
@@ -278,6 +414,89 @@ class TestSearchFiles:
         assert result["results"][0]["type"] == "filename"
 
 
+class TestSearchIndex:
+    """Test the FTS5-backed search path against a real repository"""
+
+    @pytest.fixture
+    def indexed_repo(self, tmp_path):
+        from git import Repo, Actor
+        repo_path = tmp_path / "repo"
+        repo = Repo.init(repo_path)
+        (repo_path / "src").mkdir()
+        (repo_path / "src" / "app.py").write_text("import os\nprint('Hello World')\n")
+        (repo_path / "README.md").write_text("# Demo\n")
+        repo.index.add(["src/app.py", "README.md"])
+        author = Actor("Test", "test@example.com")
+        repo.index.commit("init", author=author, committer=author)
+        # Untracked files are indexed too, ignored ones are not
+        (repo_path / "notes.txt").write_text("hello from untracked\n")
+        (repo_path / ".git" / "info" / "exclude").write_text("*.log\n")
+        (repo_path / "debug.log").write_text("hello from ignored\n")
+        return repo_path
+
+    def test_build_counts_tracked_and_untracked_files(self, indexed_repo):
+        assert build_search_index(indexed_repo) == 3
+        assert (indexed_repo / ".git" / "gition_index.sqlite").is_file()
+
+    def test_content_search_uses_index(self, indexed_repo):
+        with patch("git_ops.get_repo_path", return_value=indexed_repo):
+            result = search_files("user", "repo", "hello")
+        assert result["status"] == "success"
+        assert [(r["path"], r["line"]) for r in result["results"]] == [
+            ("notes.txt", 1), ("src/app.py", 2)
+        ]
+
+    def test_index_follows_working_tree_changes(self, indexed_repo):
+        build_search_index(indexed_repo)
+        # Edited outside the backend (e.g. from the terminal) after the build
+        (indexed_repo / "src" / "app.py").write_text("print('Goodbye Moon')\n")
+        (indexed_repo / "notes.txt").unlink()
+        with patch("git_ops.get_repo_path", return_value=indexed_repo):
+            edited = search_files("user", "repo", "moon")
+            stale = search_files("user", "repo", "hello")
+        assert [(r["path"], r["line"]) for r in edited["results"]] == [("src/app.py", 1)]
+        assert stale["results"] == []
+
+    def test_short_query_and_filename_match(self, indexed_repo):
+        with patch("git_ops.get_repo_path", return_value=indexed_repo):
+            result = search_files("user", "repo", "ap", search_content=False)
+        assert [r["name"] for r in result["results"]] == ["app.py"]
+
+    def test_failed_build_is_retried_after_ttl(self, indexed_repo):
+        marker = indexed_repo / ".git" / "gition_index.failed"
+        marker.touch()
+        os.utime(marker, (0, 0))
+        with patch("git_ops.get_repo_path", return_value=indexed_repo):
+            search_files("user", "repo", "hello")
+        assert (indexed_repo / ".git" / "gition_index.sqlite").is_file()
+        assert not marker.exists()
+
+    def test_invalidate_removes_index(self, indexed_repo):
+        build_search_index(indexed_repo)
+        invalidate_search_index(indexed_repo)
+        assert not (indexed_repo / ".git" / "gition_index.sqlite").exists()
+
+    def test_oversized_file_content_searched_on_disk(self, indexed_repo):
+        with patch("git_ops.SEARCH_INDEX_MAX_FILE_BYTES", 10), \
+             patch("git_ops.get_repo_path", return_value=indexed_repo):
+            build_search_index(indexed_repo)
+            result = search_files("user", "repo", "hello")
+        assert [(r["path"], r["line"]) for r in result["results"]] == [
+            ("notes.txt", 1), ("src/app.py", 2)
+        ]
+
+    def test_failed_build_is_not_retried(self, indexed_repo):
+        with patch("git_ops.build_search_index", side_effect=OSError("disk full")) as mock_build, \
+             patch("git_ops.get_repo_path", return_value=indexed_repo):
+            search_files("user", "repo", "hello")
+            result = search_files("user", "repo", "hello")
+        assert mock_build.call_count == 1
+        # Kept on disk, so every pool worker sees it
+        assert (indexed_repo / ".git" / "gition_index.failed").is_file()
+        # Served by the file scan, which also sees untracked files
+        assert "src/app.py" in [r["path"] for r in result["results"]]
+
+
 class TestGetCommits:
     """Test get_commits function"""
 
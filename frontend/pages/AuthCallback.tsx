@@ -7,7 +7,7 @@
  * 
  * Flow:
  *   1. Extract user info from URL parameters
- *   2. Parse JSON and store in localStorage
+ *   2. Decode (base64url JSON) and store in localStorage
  *   3. Redirect to dashboard (/)
  * 
  * Stored Data (localStorage):
@@ -28,6 +28,20 @@
 import { useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 
+/**
+ * Decode the `user` parameter: base64url-encoded UTF-8 JSON
+ * (raw JSON from older backends is still accepted)
+ */
+const decodeUserParam = (value: string) => {
+    if (value.startsWith('{')) {
+        return JSON.parse(value);
+    }
+    const base64 = value.replace(/-/g, '+').replace(/_/g, '/');
+    const binary = atob(base64.padEnd(base64.length + ((4 - (base64.length % 4)) % 4), '='));
+    const bytes = Uint8Array.from(binary, (c) => c.charCodeAt(0));
+    return JSON.parse(new TextDecoder().decode(bytes));
+};
+
 const AuthCallback = () => {
     const navigate = useNavigate();
 
@@ -38,8 +52,8 @@ const AuthCallback = () => {
 
         if (userDataStr) {
             try {
-                // Parse JSON
-                const userData = JSON.parse(userDataStr);
+                // Decode and parse JSON
+                const userData = decodeUserParam(userDataStr);
 
                 // Store user info in localStorage
                 localStorage.setItem('isAuthenticated', 'true');
@@ -37,7 +37,8 @@ CREATE TABLE IF NOT EXISTS repositories (
     synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
     UNIQUE KEY unique_user_repo (user_id, github_repo_id),
-    INDEX idx_user_id (user_id)
+    INDEX idx_user_id (user_id),
+    INDEX idx_user_name (user_id, name)  -- login/repo_name lookups (page_ops._resolve_ids, get_repo_id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Sessions table for JWT/session management
@@ -100,6 +101,7 @@ CREATE TABLE IF NOT EXISTS branch_pages (
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
     FOREIGN KEY (repo_id) REFERENCES repositories(id) ON DELETE CASCADE,
     UNIQUE KEY unique_user_repo_branch (user_id, repo_id, branch_name),
+    INDEX idx_user_repo_updated (user_id, repo_id, updated_at),  -- page list ORDER BY updated_at
     INDEX idx_user_id (user_id),
     INDEX idx_repo_id (repo_id),
     INDEX idx_branch_name (branch_name)